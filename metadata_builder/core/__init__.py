@@ -2,6 +2,7 @@
 
 from .generate_table_metadata import (
     generate_complete_table_metadata, 
+    generate_column_metadata,
     call_llm_api, 
     generate_smart_categorical_definitions,
     generate_enhanced_table_insights
@@ -10,6 +11,7 @@ from .semantic_models import generate_lookml_model
 
 __all__ = [
     'generate_complete_table_metadata',
+    'generate_column_metadata',
     'generate_lookml_model', 
     'call_llm_api',
     'generate_smart_categorical_definitions',
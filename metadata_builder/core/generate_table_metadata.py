@@ -22,12 +22,13 @@ from ..utils.metadata_utils import (
     is_date_like,
     is_date_like_string
 )
+from ..utils.phase_cache import PhaseCache, schema_fingerprint
 
 # LLM imports
-from openai import OpenAI
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 from openai import OpenAIError
 from .semantic_models import call_llm_json
+from .llm_service import get_openai_client
 
 logger = logging.getLogger(__name__)
 
@@ -98,10 +99,7 @@ def call_llm_api(prompt: str, system_message: str = None, temperature: float = 0
         estimated_cost = estimate_llm_cost(prompt, model_name)
         logger.info(f"Estimated LLM cost: ${estimated_cost:.4f}")
         
-        client = OpenAI(
-            api_key=api_key,
-            base_url=base_url,
-        )
+        client = get_openai_client(api_key, base_url)
         
         messages = []
         if system_message:
@@ -161,7 +159,9 @@ def get_table_info_with_better_sampling(
     sample_size: int = 100,   # Reduced for faster metadata generation
     num_samples: int = 5,    # Reduced for faster metadata generation
     use_stratified_sampling: bool = True,
-    connection_manager=None
+    connection_manager=None,
+    include_samples: bool = True,
+    columns: Optional[List[str]] = None
 ) -> Tuple[Dict[str, str], pd.DataFrame]:
     """
     Get table schema and sample data with improved sampling strategies.
@@ -175,6 +175,10 @@ def get_table_info_with_better_sampling(
         num_samples: Number of samples to take (increased default)
         use_stratified_sampling: Use stratified sampling if possible
         connection_manager: Optional connection manager for user/system connections
+        include_samples: Whether to sample rows at all; when False only the schema
+            and indexes are read and the DataFrame is empty
+        columns: Optional columns to sample; the schema still lists every column.
+            Ignored when analysis_sql is given
         
     Returns:
         Tuple with schema dictionary
@@ -234,6 +238,11 @@ def get_table_info_with_better_sampling(
             get_table_info._table_indexes = {}
         get_table_info._table_indexes[f"{db_name}.{table_name}"] = indexes
 
+        if columns is not None:
+            columns = [column for column in columns if column in schema]
+        if not include_samples or columns == []:
+            return schema, pd.DataFrame(columns=list(schema) if columns is None else columns)
+
         # Check if this is BigQuery and use partition-aware sampling
         from ..utils.bigquery_handler import BigQueryHandler
         if isinstance(db, BigQueryHandler):
@@ -242,7 +251,8 @@ def get_table_info_with_better_sampling(
                 table_name=table_name,
                 schema_name=schema_name,
                 sample_size=sample_size,
-                num_samples=num_samples
+                num_samples=num_samples,
+                columns=columns
             )
             df = pd.DataFrame(sample_data_list)
         else:
@@ -255,7 +265,8 @@ def get_table_info_with_better_sampling(
                 analysis_sql=analysis_sql,
                 sample_size=sample_size,
                 num_samples=num_samples,
-                use_stratified_sampling=use_stratified_sampling
+                use_stratified_sampling=use_stratified_sampling,
+                columns=columns
             )
         
         # Validate sample data quality
@@ -277,6 +288,12 @@ def _validate_sql_identifier(identifier: str) -> bool:
         return False
     return re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', identifier) is not None
 
+def _select_list(columns: Optional[List[str]] = None) -> str:
+    """Quote columns for a sampling SELECT, or * when no columns are given."""
+    if not columns:
+        return "*"
+    return ", ".join('"' + column.replace('"', '""') + '"' for column in columns)
+
 def _get_improved_sample_data(
     db, 
     table_name: str, 
@@ -285,9 +302,10 @@ def _get_improved_sample_data(
     analysis_sql: Optional[str] = None,
     sample_size: int = 500,
     num_samples: int = 10,
-    use_stratified_sampling: bool = True
+    use_stratified_sampling: bool = True,
+    columns: Optional[List[str]] = None
 ) -> pd.DataFrame:
-    """Get improved sample data with better strategies."""
+    """Get improved sample data with better strategies, selecting only columns when given."""
     
     samples = []
     
@@ -305,15 +323,15 @@ def _get_improved_sample_data(
         if row_count <= sample_size * num_samples:
             # Small table - get everything
             table_ref = f'"{schema_name}"."{table_name}"' if schema_name != 'main' else f'"{table_name}"'
-            query = f"SELECT * FROM {table_ref} LIMIT {row_count}"
+            query = f"SELECT {_select_list(columns)} FROM {table_ref} LIMIT {row_count}"
             result = db.fetch_all(query)
             samples.append(pd.DataFrame(result))
         else:
             # Large table - use improved sampling
             if use_stratified_sampling:
-                samples.extend(_stratified_sampling(db, table_name, schema_name, schema, sample_size, num_samples))
+                samples.extend(_stratified_sampling(db, table_name, schema_name, schema, sample_size, num_samples, columns))
             else:
-                samples.extend(_random_sampling(db, table_name, schema_name, sample_size, num_samples, row_count))
+                samples.extend(_random_sampling(db, table_name, schema_name, sample_size, num_samples, row_count, columns))
     
     # Combine all samples
     if samples:
@@ -331,7 +349,7 @@ def _get_improved_sample_data(
     else:
         return pd.DataFrame()
 
-def _stratified_sampling(db, table_name: str, schema_name: str, schema: Dict[str, str], sample_size: int, num_samples: int) -> List[pd.DataFrame]:
+def _stratified_sampling(db, table_name: str, schema_name: str, schema: Dict[str, str], sample_size: int, num_samples: int, columns: Optional[List[str]] = None) -> List[pd.DataFrame]:
     """Attempt stratified sampling based on likely categorical columns."""
     samples = []
     
@@ -357,7 +375,7 @@ def _stratified_sampling(db, table_name: str, schema_name: str, schema: Dict[str
                 
                 for value_row in distinct_values:
                     value = value_row[strat_col]
-                    stratum_query = f'SELECT * FROM {table_ref} WHERE "{strat_col}" = :strat_value LIMIT {per_stratum}'
+                    stratum_query = f'SELECT {_select_list(columns)} FROM {table_ref} WHERE "{strat_col}" = :strat_value LIMIT {per_stratum}'
                     stratum_result = db.fetch_all(stratum_query, {"strat_value": value})
                     if stratum_result:
                         samples.append(pd.DataFrame(stratum_result))
@@ -365,18 +383,18 @@ def _stratified_sampling(db, table_name: str, schema_name: str, schema: Dict[str
                 logger.info(f"Used stratified sampling on column {strat_col}")
             else:
                 # Fall back to random sampling
-                samples.extend(_random_sampling(db, table_name, schema_name, sample_size, num_samples))
+                samples.extend(_random_sampling(db, table_name, schema_name, sample_size, num_samples, columns=columns))
         else:
             # No good stratification columns - use random sampling
-            samples.extend(_random_sampling(db, table_name, schema_name, sample_size, num_samples))
+            samples.extend(_random_sampling(db, table_name, schema_name, sample_size, num_samples, columns=columns))
             
     except Exception as e:
         logger.warning(f"Stratified sampling failed: {e}, falling back to random sampling")
-        samples.extend(_random_sampling(db, table_name, schema_name, sample_size, num_samples))
+        samples.extend(_random_sampling(db, table_name, schema_name, sample_size, num_samples, columns=columns))
     
     return samples
 
-def _random_sampling(db, table_name: str, schema_name: str, sample_size: int, num_samples: int, row_count: int = None) -> List[pd.DataFrame]:
+def _random_sampling(db, table_name: str, schema_name: str, sample_size: int, num_samples: int, row_count: int = None, columns: Optional[List[str]] = None) -> List[pd.DataFrame]:
     """Random sampling with multiple offsets."""
     samples = []
     
@@ -389,7 +407,7 @@ def _random_sampling(db, table_name: str, schema_name: str, sample_size: int, nu
     table_ref = f'"{schema_name}"."{table_name}"' if schema_name != 'main' else f'"{table_name}"'
     
     for offset in offsets:
-        query = f"SELECT * FROM {table_ref} LIMIT {sample_size} OFFSET {offset}"
+        query = f"SELECT {_select_list(columns)} FROM {table_ref} LIMIT {sample_size} OFFSET {offset}"
         result = db.fetch_all(query)
         if result:
             samples.append(pd.DataFrame(result))
@@ -797,7 +815,7 @@ def generate_smart_categorical_definitions(
     if client is None or model is None:
         api_key, base_url, model_name = get_llm_api_config()
         model = model or model_name
-        client = OpenAI(base_url=base_url, api_key=api_key)
+        client = get_openai_client(api_key, base_url)
 
     categorical_definitions = {}
     
@@ -1224,6 +1242,58 @@ def generate_table_insights(
         include_query_rules=True
     )
 
+def _column_metadata(
+    col_name: str,
+    data_type: str,
+    definition: Dict[str, Any],
+    details: Optional[Dict[str, Any]],
+    original_description: str,
+    categorical_columns: List[str],
+    numerical_columns: List[str],
+    numerical_stats: Dict[str, Any],
+    data_quality: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Build one column's entry in the table metadata ``columns`` section.
+    
+    Args:
+        col_name: Column name
+        data_type: Column data type
+        definition: LLM column definition for the column
+        details: Detailed column info (BigQuery only), or None
+        original_description: Existing column description from the database
+        categorical_columns: Columns classified as categorical
+        numerical_columns: Columns classified as numerical
+        numerical_stats: Statistics per numerical column
+        data_quality: Quality metrics for the column, if computed
+        
+    Returns:
+        Column metadata dictionary
+    """
+    is_nullable = details.get("is_nullable", True) if details else True  # Use actual BigQuery info
+    return {
+        "name": col_name,
+        "data_type": data_type,
+        "is_nullable": is_nullable,
+        "description": definition.get("definition", ""),
+        "original_description": original_description,  # Add original BigQuery description
+        "business_name": definition.get("business_name", ""),
+        "purpose": definition.get("purpose", ""),
+        "format": definition.get("format", ""),
+        "constraints": definition.get("business_rules", []),
+        "is_categorical": col_name in categorical_columns,
+        "is_numerical": col_name in numerical_columns,
+        "statistics": numerical_stats.get(col_name, {}) if col_name in numerical_columns else {},
+        "data_quality": data_quality or {},
+        # Add BigQuery-specific metadata
+        "bigquery_info": {
+            "mode": "REQUIRED" if not is_nullable else "NULLABLE",
+            "numeric_precision": details.get("numeric_precision"),
+            "numeric_scale": details.get("numeric_scale"),
+            "character_maximum_length": details.get("character_maximum_length")
+        } if details else {}
+    }
+
 def generate_complete_table_metadata(
     db_name: str,
     table_name: str,
@@ -1240,7 +1310,9 @@ def generate_complete_table_metadata(
     include_query_examples: bool = True,
     include_additional_insights: bool = True,
     include_business_rules: bool = True,
-    include_categorical_definitions: bool = True
+    include_categorical_definitions: bool = True,
+    include_samples: bool = True,
+    resume: bool = False
 ) -> Dict[str, Any]:
     """
     Generate complete table metadata including column classifications, statistics,
@@ -1262,6 +1334,10 @@ def generate_complete_table_metadata(
         include_additional_insights: Whether to generate additional insights
         include_business_rules: Whether to generate business rules
         include_categorical_definitions: Whether to generate categorical value definitions
+        include_samples: Whether to sample table rows; when False no rows are read, so
+            statistics, data quality and categorical values are skipped as well
+        resume: Whether to persist LLM phase results on disk and reuse those computed
+            by an earlier, possibly interrupted, run against the same column list
         
     Returns:
         Dictionary with complete table metadata
@@ -1278,7 +1354,8 @@ def generate_complete_table_metadata(
             "query_examples": include_query_examples,
             "additional_insights": include_additional_insights,
             "business_rules": include_business_rules,
-            "categorical_definitions": include_categorical_definitions
+            "categorical_definitions": include_categorical_definitions,
+            "samples": include_samples
         }
     }
     
@@ -1292,7 +1369,8 @@ def generate_complete_table_metadata(
             analysis_sql=analysis_sql,
             sample_size=sample_size,
             num_samples=num_samples,
-            connection_manager=connection_manager
+            connection_manager=connection_manager,
+            include_samples=include_samples
         )
         processing_stats["steps"].append({
             "step": "get_table_info",
@@ -1301,6 +1379,9 @@ def generate_complete_table_metadata(
             "columns_processed": len(schema)
         })
         
+        phase_cache = PhaseCache(db_name, schema_name, table_name) if resume else None
+        definitions_fingerprint = schema_fingerprint(schema, {"analysis_sql": analysis_sql})
+        
         # Step 2: Identify column types (categorical vs numerical)
         step_start = time.time()
         categorical_columns, numerical_columns = identify_column_types(schema, sample_data)
@@ -1317,15 +1398,17 @@ def generate_complete_table_metadata(
         # Step 3: Extract database constraints (always needed)
         tasks.append(("extract_constraints", lambda: extract_constraints(table_name, db_name, connection_manager=connection_manager)))
         
+        # Steps 4-6 all read sampled rows, so none of them run without samples
         # Step 4: Compute numerical statistics (always needed for basic metadata)
-        tasks.append(("compute_numerical_stats", lambda: compute_numerical_stats(sample_data, numerical_columns)))
+        if include_samples:
+            tasks.append(("compute_numerical_stats", lambda: compute_numerical_stats(sample_data, numerical_columns)))
         
         # Step 5: Compute data quality metrics (optional)
-        if include_data_quality:
+        if include_data_quality and include_samples:
             tasks.append(("compute_data_quality_metrics", lambda: compute_data_quality_metrics(sample_data, schema)))
         
         # Step 6: Extract categorical values (needed for categorical definitions)
-        if include_categorical_definitions:
+        if include_categorical_definitions and include_samples:
             tasks.append(("extract_categorical_values", lambda: extract_categorical_values(
                 sample_data, categorical_columns, db_name, schema_name, table_name, connection_manager=connection_manager)))
         
@@ -1371,42 +1454,58 @@ def generate_complete_table_metadata(
         
         # Step 7: Generate column definitions using LLM
         step_start = time.time()
-        try:
-            column_definitions = generate_column_definitions(
-                schema=schema,
-                categorical_values=categorical_values,
-                db_name=db_name,
-                table_name=table_name,
-                schema_name=schema_name,
-                numerical_stats=numerical_stats,
-                constraints=constraints,
-                partition_info=partition_info
-            )
-        except Exception as e:
-            logger.warning(f"Failed to generate column definitions via LLM: {str(e)}")
-            # Create basic column definitions
-            column_definitions = {
-                col_name: {
-                    "definition": f"Column {col_name} of type {data_type}",
-                    "business_name": col_name.replace('_', ' ').title(),
-                    "purpose": f"Data field for {col_name}",
-                    "format": "Standard format",
-                    "business_rules": [],
-                    "source": "fallback"
-                } for col_name, data_type in schema.items()
-            }
+        column_definitions = phase_cache.load("column_definitions", definitions_fingerprint) if phase_cache else None
+        resumed = column_definitions is not None
+        if not resumed:
+            try:
+                column_definitions = generate_column_definitions(
+                    schema=schema,
+                    categorical_values=categorical_values,
+                    db_name=db_name,
+                    table_name=table_name,
+                    schema_name=schema_name,
+                    numerical_stats=numerical_stats,
+                    constraints=constraints,
+                    partition_info=partition_info
+                )
+                if phase_cache:
+                    phase_cache.store("column_definitions", definitions_fingerprint, column_definitions)
+            except Exception as e:
+                logger.warning(f"Failed to generate column definitions via LLM: {str(e)}")
+                # Create basic column definitions
+                column_definitions = {
+                    col_name: {
+                        "definition": f"Column {col_name} of type {data_type}",
+                        "business_name": col_name.replace('_', ' ').title(),
+                        "purpose": f"Data field for {col_name}",
+                        "format": "Standard format",
+                        "business_rules": [],
+                        "source": "fallback"
+                    } for col_name, data_type in schema.items()
+                }
         
         processing_stats["steps"].append({
             "step": "generate_column_definitions",
             "duration_seconds": time.time() - step_start,
-            "columns_processed": len(column_definitions)
+            "columns_processed": len(column_definitions),
+            "resumed": resumed
         })
         
-        # Step 8: Generate categorical value definitions using LLM (optional)
-        categorical_definitions = {}
-        if include_categorical_definitions:
-            step_start = time.time()
-            categorical_definitions = generate_smart_categorical_definitions(
+        # Steps 8 and 9 both build on the column definitions but not on each other,
+        # so their LLM calls run concurrently
+        def categorical_definitions_phase() -> Tuple[Dict[str, Any], float]:
+            # Step 8: Generate categorical value definitions using LLM (optional)
+            phase_start = time.time()
+            # The prompt is built from the extracted values, so new values invalidate the result
+            categorical_fingerprint = schema_fingerprint(schema, {
+                "analysis_sql": analysis_sql,
+                "categorical_values": categorical_values
+            })
+            if phase_cache:
+                definitions = phase_cache.load("categorical_definitions", categorical_fingerprint)
+                if definitions is not None:
+                    return definitions, time.time() - phase_start
+            definitions = generate_smart_categorical_definitions(
                 metadata={
                     "database_name": db_name,
                     "schema_name": schema_name,
@@ -1415,57 +1514,85 @@ def generate_complete_table_metadata(
                 },
                 categorical_values=categorical_values
             )
-            logger.info(f"Categorical definitions: {categorical_definitions}")
-            processing_stats["steps"].append({
-                "step": "generate_categorical_definitions",
-                "duration_seconds": time.time() - step_start,
-                "columns_processed": len(categorical_definitions)
+            logger.info(f"Categorical definitions: {definitions}")
+            if phase_cache:
+                phase_cache.store("categorical_definitions", categorical_fingerprint, definitions)
+            return definitions, time.time() - phase_start
+        
+        def table_insights_phase() -> Tuple[Dict[str, Any], float]:
+            # Step 9: Generate table-level insights using LLM (always generate basic summary, optionally include advanced sections)
+            phase_start = time.time()
+            insights_fingerprint = schema_fingerprint(schema, {
+                "analysis_sql": analysis_sql,
+                "optional_sections": processing_stats["optional_sections"]
             })
-        
-        # Step 9: Generate table-level insights using LLM (always generate basic summary, optionally include advanced sections)
-        step_start = time.time()
-        try:
-            table_insights = generate_enhanced_table_insights(
-                db_name=db_name,
-                schema_name=schema_name,
-                table_name=table_name,
-                schema=schema,
-                sample_data=sample_data,
-                constraints=constraints,
-                column_definitions=column_definitions,
-                include_relationships=include_relationships,
-                include_business_rules=include_business_rules,
-                include_additional_insights=include_additional_insights,
-                include_query_examples=include_query_examples,
-                include_aggregation_rules=include_aggregation_rules,
-                include_query_rules=include_query_rules
-            )
-        except Exception as e:
-            logger.warning(f"Failed to generate table insights via LLM: {str(e)}")
-            # Create basic insights as fallback
-            table_insights = {
-                "table_insights": {
-                    "domain": "Business Data",
-                    "category": "Data Table", 
-                    "description": f"**{table_name.replace('_', ' ').title()}**\n\nData storage table for {table_name.replace('_', ' ')} information in the {schema_name} schema.",
-                    "purpose": f"To store and manage {table_name.replace('_', ' ')} data for business operations.",
-                    "usage_patterns": [
-                        "Data storage and retrieval",
-                        "Analytics and reporting",
-                        "Application data management"
-                    ],
-                    "data_lifecycle": {
-                        "update_frequency": "Unknown",
-                        "retention_policy": "Not specified",
-                        "archival_strategy": "Not defined"
+            if phase_cache:
+                insights = phase_cache.load("table_insights", insights_fingerprint)
+                if insights is not None:
+                    return insights, time.time() - phase_start
+            try:
+                insights = generate_enhanced_table_insights(
+                    db_name=db_name,
+                    schema_name=schema_name,
+                    table_name=table_name,
+                    schema=schema,
+                    sample_data=sample_data,
+                    constraints=constraints,
+                    column_definitions=column_definitions,
+                    include_relationships=include_relationships,
+                    include_business_rules=include_business_rules,
+                    include_additional_insights=include_additional_insights,
+                    include_query_examples=include_query_examples,
+                    include_aggregation_rules=include_aggregation_rules,
+                    include_query_rules=include_query_rules
+                )
+                if phase_cache:
+                    phase_cache.store("table_insights", insights_fingerprint, insights)
+            except Exception as e:
+                logger.warning(f"Failed to generate table insights via LLM: {str(e)}")
+                # Create basic insights as fallback
+                insights = {
+                    "table_insights": {
+                        "domain": "Business Data",
+                        "category": "Data Table", 
+                        "description": f"**{table_name.replace('_', ' ').title()}**\n\nData storage table for {table_name.replace('_', ' ')} information in the {schema_name} schema.",
+                        "purpose": f"To store and manage {table_name.replace('_', ' ')} data for business operations.",
+                        "usage_patterns": [
+                            "Data storage and retrieval",
+                            "Analytics and reporting",
+                            "Application data management"
+                        ],
+                        "data_lifecycle": {
+                            "update_frequency": "Unknown",
+                            "retention_policy": "Not specified",
+                            "archival_strategy": "Not defined"
+                        }
                     }
                 }
-            }
+            return insights, time.time() - phase_start
         
-        processing_stats["steps"].append({
-            "step": "generate_table_insights",
-            "duration_seconds": time.time() - step_start
-        })
+        categorical_definitions = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            # Without sampled values there is nothing for the LLM to define
+            categorical_future = (
+                executor.submit(categorical_definitions_phase)
+                if include_categorical_definitions and include_samples else None
+            )
+            insights_future = executor.submit(table_insights_phase)
+            
+            if categorical_future is not None:
+                categorical_definitions, duration = categorical_future.result()
+                processing_stats["steps"].append({
+                    "step": "generate_categorical_definitions",
+                    "duration_seconds": duration,
+                    "columns_processed": len(categorical_definitions)
+                })
+            
+            table_insights, duration = insights_future.result()
+            processing_stats["steps"].append({
+                "step": "generate_table_insights",
+                "duration_seconds": duration
+            })
         
         # Step 10: Assemble final metadata
         indexes = getattr(get_table_info_with_better_sampling, '_table_indexes', {}).get(f"{db_name}.{table_name}", [])
@@ -1490,36 +1617,28 @@ def generate_complete_table_metadata(
         if hasattr(get_table_info_with_better_sampling, '_column_details'):
             column_details = get_table_info_with_better_sampling._column_details.get(f"{db_name}.{table_name}", {})
         
+        # Build column metadata
+        columns = {
+            col_name: _column_metadata(
+                col_name,
+                data_type,
+                definition=column_definitions.get(col_name, {}),
+                details=column_details.get(col_name),
+                original_description=column_descriptions.get(col_name, ""),
+                categorical_columns=categorical_columns,
+                numerical_columns=numerical_columns,
+                numerical_stats=numerical_stats,
+                data_quality=data_quality.get(col_name) if include_data_quality else None
+            ) for col_name, data_type in schema.items()
+        }
+        
         # Build base metadata structure
         metadata = {
             "database_name": db_name,
             "schema_name": schema_name,
             "table_name": table_name,
             "description": table_insights.get("table_insights", {}).get("description", ""),
-            "columns": {
-                col_name: {
-                    "name": col_name,
-                    "data_type": data_type,
-                    "is_nullable": column_details.get(col_name, {}).get("is_nullable", True),  # Use actual BigQuery info
-                    "description": column_definitions.get(col_name, {}).get("definition", ""),
-                    "original_description": column_descriptions.get(col_name, ""),  # Add original BigQuery description
-                    "business_name": column_definitions.get(col_name, {}).get("business_name", ""),
-                    "purpose": column_definitions.get(col_name, {}).get("purpose", ""),
-                    "format": column_definitions.get(col_name, {}).get("format", ""),
-                    "constraints": column_definitions.get(col_name, {}).get("business_rules", []),
-                    "is_categorical": col_name in categorical_columns,
-                    "is_numerical": col_name in numerical_columns,
-                    "statistics": numerical_stats.get(col_name, {}) if col_name in numerical_columns else {},
-                    "data_quality": data_quality.get(col_name, {}) if include_data_quality else {},
-                    # Add BigQuery-specific metadata
-                    "bigquery_info": {
-                        "mode": "REQUIRED" if not column_details.get(col_name, {}).get("is_nullable", True) else "NULLABLE",
-                        "numeric_precision": column_details.get(col_name, {}).get("numeric_precision"),
-                        "numeric_scale": column_details.get(col_name, {}).get("numeric_scale"),
-                        "character_maximum_length": column_details.get(col_name, {}).get("character_maximum_length")
-                    } if column_details.get(col_name) else {}
-                } for col_name, data_type in schema.items()
-            },
+            "columns": columns,
             "constraints": constraints,
             "table_description": {
                 "purpose": table_insights.get("table_insights", {}).get("purpose", ""),
@@ -1601,6 +1720,107 @@ def generate_complete_table_metadata(
             "processing_stats": processing_stats
         }
 
+def generate_column_metadata(
+    db_name: str,
+    table_name: str,
+    column_name: str,
+    schema_name: str = 'public',
+    sample_size: int = 100,
+    num_samples: int = 5,
+    connection_manager=None
+) -> Dict[str, Any]:
+    """
+    Generate metadata for a single column of a table.
+    
+    Runs only the per-column part of generate_complete_table_metadata
+    (type classification, statistics, categorical values and the column
+    definition) for the requested column, skipping table-wide insights,
+    business rules and quality metrics. Only that column is sampled.
+    
+    Args:
+        db_name: Database name
+        table_name: Table name
+        column_name: Column name
+        schema_name: Schema name
+        sample_size: Size of each sample
+        num_samples: Number of samples to take
+        connection_manager: Optional connection manager for user/system connections
+        
+    Returns:
+        Table metadata dictionary whose columns hold only the requested column,
+        or no columns if the table has no such column
+    """
+    metadata = {
+        "database_name": db_name,
+        "schema_name": schema_name,
+        "table_name": table_name,
+        "columns": {}
+    }
+    
+    try:
+        schema, sample_data = get_table_info_with_better_sampling(
+            table_name=table_name,
+            db_name=db_name,
+            schema_name=schema_name,
+            sample_size=sample_size,
+            num_samples=num_samples,
+            connection_manager=connection_manager,
+            columns=[column_name]
+        )
+        if column_name not in schema:
+            return metadata
+        
+        column_schema = {column_name: schema[column_name]}
+        categorical_columns, numerical_columns = identify_column_types(column_schema, sample_data)
+        
+        constraints = extract_constraints(table_name, db_name, connection_manager=connection_manager)
+        numerical_stats = compute_numerical_stats(sample_data, numerical_columns)
+        categorical_values = extract_categorical_values(
+            sample_data, categorical_columns, db_name, schema_name, table_name, connection_manager=connection_manager)
+        
+        try:
+            definition = generate_column_definitions(
+                schema=column_schema,
+                categorical_values=categorical_values,
+                db_name=db_name,
+                table_name=table_name,
+                schema_name=schema_name,
+                numerical_stats=numerical_stats,
+                constraints=constraints
+            ).get(column_name, {})
+        except Exception as e:
+            logger.warning(f"Failed to generate column definition via LLM: {str(e)}")
+            definition = {
+                "definition": f"Column {column_name} of type {schema[column_name]}",
+                "business_name": column_name.replace('_', ' ').title(),
+                "purpose": f"Data field for {column_name}",
+                "format": "Standard format",
+                "business_rules": [],
+                "source": "fallback"
+            }
+        
+        table_key = f"{db_name}.{table_name}"
+        original_description = getattr(get_table_info_with_better_sampling, '_column_descriptions', {}).get(table_key, {}).get(column_name, "")
+        details = getattr(get_table_info_with_better_sampling, '_column_details', {}).get(table_key, {}).get(column_name)
+        metadata["columns"][column_name] = _column_metadata(
+            column_name,
+            schema[column_name],
+            definition=definition,
+            details=details,
+            original_description=original_description,
+            categorical_columns=categorical_columns,
+            numerical_columns=numerical_columns,
+            numerical_stats=numerical_stats
+        )
+        if column_name in categorical_values:
+            metadata["categorical_values"] = {column_name: categorical_values[column_name]}
+        return metadata
+        
+    except Exception as e:
+        logger.error(f"Error generating column metadata: {str(e)}")
+        metadata["error"] = str(e)
+        return metadata
+
 # Backward compatibility - keep old function name as an alias
 def get_table_info(
     table_name: str, 
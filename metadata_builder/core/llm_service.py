@@ -1,13 +1,22 @@
 """LLM client for metadata generation."""
 
+import functools
 import json
 import logging
 import re
 import time
 from typing import Dict, Any, Optional
 
-from openai import OpenAI, OpenAIError
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from openai import (
+    OpenAI,
+    OpenAIError,
+    BadRequestError,
+    RateLimitError,
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+)
+from tenacity import retry, stop_after_attempt, wait_exponential, wait_random, retry_if_exception_type
 
 from ..config.config import get_llm_api_config
 from ..utils.token_counter import TokenCounter
@@ -15,34 +24,113 @@ from ..metadata.exceptions import LLMEmptyResponseError
 
 logger = logging.getLogger(__name__)
 
+# API failures that are worth retrying; request errors such as an over-long prompt are not
+TRANSIENT_LLM_ERRORS = (RateLimitError, APIConnectionError, APITimeoutError, InternalServerError)
+
+# Ask the API for a syntactically valid JSON object when a JSON response is expected
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+# Longest wait a Retry-After header can impose before the next attempt
+MAX_RETRY_AFTER_SECONDS = 30
+
+# Exponential backoff from half a second up to 8 seconds, plus up to a second of jitter
+_jittered_backoff = wait_exponential(multiplier=0.5, max=8) + wait_random(0, 1)
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """Read the server-requested delay from a rate-limit error's response headers.
+    
+    Args:
+        error: Exception raised by the OpenAI client
+        
+    Returns:
+        Delay in seconds, or None if the response doesn't specify one
+    """
+    headers = getattr(getattr(error, 'response', None), 'headers', None)
+    if not headers:
+        return None
+    try:
+        retry_after_ms = headers.get('retry-after-ms')
+        if retry_after_ms is not None:
+            return max(float(retry_after_ms) / 1000, 0.0)
+        retry_after = headers.get('retry-after')
+        if retry_after is not None:
+            return max(float(retry_after), 0.0)
+    except (TypeError, ValueError):
+        # HTTP-date values fall back to the regular backoff
+        pass
+    return None
+
+
+def _wait_for_retry(retry_state) -> float:
+    """Wait as long as a rate limit asks, otherwise back off exponentially with jitter."""
+    exception = retry_state.outcome.exception()
+    if isinstance(exception, RateLimitError):
+        retry_after = _retry_after_seconds(exception)
+        if retry_after is not None:
+            return min(retry_after, MAX_RETRY_AFTER_SECONDS)
+    return _jittered_backoff(retry_state)
+
+
+@functools.lru_cache(maxsize=8)
+def get_openai_client(api_key: Optional[str], base_url: Optional[str]) -> OpenAI:
+    """Get a shared OpenAI client for the given credentials.
+    
+    Clients are cached so their HTTP connection pool (and TLS sessions)
+    is reused across calls instead of being rebuilt per request.
+    
+    Args:
+        api_key: API key for the LLM endpoint
+        base_url: Base URL of the LLM endpoint
+        
+    Returns:
+        OpenAI client instance
+    """
+    return OpenAI(api_key=api_key, base_url=base_url)
+
+
 class LLMClient:
     """Handles interactions with the LLM API."""
     
-    def __init__(self, model: str = None, client: Optional[OpenAI] = None):
+    def __init__(
+        self,
+        model: str = None,
+        client: Optional[OpenAI] = None,
+        token_counter: Optional[TokenCounter] = None
+    ):
         """Initialize LLM client.
         
         Args:
             model: Optional model name to use
             client: Optional OpenAI client instance
+            token_counter: Optional token counter to record usage in, so several
+                clients can share one set of statistics
         """
         if client is None:
             api_key, base_url, model = get_llm_api_config()
-            self.client = OpenAI(base_url=base_url, api_key=api_key)
+            self.client = get_openai_client(api_key, base_url)
         else:
             self.client = client
         self.model = model
-        self.token_counter = TokenCounter(model)
+        self.token_counter = token_counter or TokenCounter(model)
     
     @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type((LLMEmptyResponseError, OpenAIError))
+        stop=stop_after_attempt(4),
+        wait=_wait_for_retry,
+        retry=retry_if_exception_type((LLMEmptyResponseError,) + TRANSIENT_LLM_ERRORS)
     )
-    def call_llm(self, prompt: str) -> str:
+    def call_llm(
+        self,
+        prompt: str,
+        stream: bool = False,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> str:
         """Call LLM and get raw response.
         
         Args:
             prompt: The prompt to send to the LLM
+            stream: Whether to stream the completion and assemble it as chunks arrive
+            response_format: Optional response_format to request, e.g. JSON_RESPONSE_FORMAT
             
         Returns:
             The LLM's response as a string
@@ -57,7 +145,7 @@ class LLMClient:
                 logger.error(f"Invalid prompt type: {type(prompt)}")
                 raise ValueError(f"Prompt must be a string, got {type(prompt)}")
                 
-            logger.info(f"LLM REQUEST: {prompt}")
+            logger.debug("LLM REQUEST: %s", prompt)
             
             try:
                 prompt_tokens = self.token_counter.count_tokens(prompt)
@@ -66,6 +154,7 @@ class LLMClient:
                 logger.error(f"Error counting tokens: {e}")
                 prompt_tokens = 0
             
+            request_options = {"response_format": response_format} if response_format else {}
             response = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
@@ -74,13 +163,18 @@ class LLMClient:
                 ],
                 temperature=0.2,
                 max_tokens=8192,
+                stream=stream,
+                **request_options,
             )
 
-            if not response or not response.choices or len(response.choices) == 0:
-                logger.error("Empty response received from LLM")
-                raise LLMEmptyResponseError("Empty response from LLM")
+            if stream:
+                content = self._collect_stream(response, start_time)
+            else:
+                if not response or not response.choices or len(response.choices) == 0:
+                    logger.error("Empty response received from LLM")
+                    raise LLMEmptyResponseError("Empty response from LLM")
 
-            content = response.choices[0].message.content
+                content = response.choices[0].message.content
             if not content or not content.strip():
                 logger.error("Empty content received from LLM")
                 raise LLMEmptyResponseError("Response content is empty")
@@ -94,7 +188,7 @@ class LLMClient:
 
             elapsed_time = time.time() - start_time
             logger.info(f"LLM call completed in {elapsed_time:.2f} seconds")
-            logger.info(f"Raw LLM response:\n{content}")
+            logger.debug("Raw LLM response:\n%s", content)
             
             return content.strip()
 
@@ -107,16 +201,39 @@ class LLMClient:
             logger.error(f"Error in LLM call after {elapsed_time:.2f} seconds: {e}", exc_info=True)
             raise
 
+    @staticmethod
+    def _collect_stream(response, start_time: float) -> str:
+        """Assemble a streamed completion into a single string.
+        
+        Args:
+            response: Stream of completion chunks
+            start_time: Time the request was sent, for latency logging
+            
+        Returns:
+            The concatenated completion content
+        """
+        parts = []
+        for chunk in response:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                if not parts:
+                    logger.debug(f"First LLM token received after {time.time() - start_time:.2f} seconds")
+                parts.append(delta)
+        return "".join(parts)
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type((LLMEmptyResponseError, OpenAIError, json.JSONDecodeError))
+        retry=retry_if_exception_type((LLMEmptyResponseError, json.JSONDecodeError))
     )
     def call_llm_json(
         self,
         prompt: str,
         operation_type: str = 'default',
-        structure: Optional[str] = None
+        structure: Optional[str] = None,
+        stream: bool = False
     ) -> Dict[str, Any]:
         """Call LLM and parse response as JSON.
         
@@ -124,6 +241,7 @@ class LLMClient:
             prompt: The prompt to send to the LLM
             operation_type: Type of operation being performed
             structure: Optional JSON structure to expect
+            stream: Whether to stream the completion from the API
             
         Returns:
             Parsed JSON response as a dictionary
@@ -133,7 +251,21 @@ class LLMClient:
             json.JSONDecodeError: If response is not valid JSON
         """
         try:
-            content = self.call_llm(prompt)
+            try:
+                content = self.call_llm(prompt, stream=stream, response_format=JSON_RESPONSE_FORMAT)
+            except BadRequestError as e:
+                # Some OpenAI-compatible servers and older models reject JSON mode
+                if "response_format" not in str(e).lower():
+                    raise
+                logger.warning(f"JSON mode not supported for {self.model}, retrying without it: {str(e)}")
+                content = self.call_llm(prompt, stream=stream)
+            
+            # JSON mode output parses directly; only clean up free-form responses
+            try:
+                return json.loads(content)
+            except json.JSONDecodeError:
+                pass
+            
             cleaned_content = self._clean_json_string(content.strip())
             if not cleaned_content:
                 raise json.JSONDecodeError("No JSON content found", content, 0)
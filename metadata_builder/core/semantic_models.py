@@ -3,20 +3,232 @@ Semantic model generation for various analytics platforms.
 This module provides functions to generate semantic models for tools like dbt, LookML, Cube.js, etc.
 """
 
+import concurrent.futures
+import copy
+import functools
+import hashlib
 import logging
 import time
-import json
-from typing import Dict, List, Any, Optional
+from typing import TYPE_CHECKING, Dict, List, Any, Optional
 from datetime import datetime
 
-from openai import OpenAI
+import yaml
 from ..config.config import get_llm_api_config, get_db_handler
+from ..utils import json_utils
 from ..utils.token_counter import TokenCounter
-from .llm_service import LLMClient
-from ..utils.metadata_utils import extract_constraints
+from ..utils.ttl_cache import TTLCache
+from .llm_service import LLMClient, get_openai_client
+from ..utils.metadata_utils import extract_constraints_bulk
+
+if TYPE_CHECKING:
+    # Only needed for annotations; clients come from get_openai_client
+    from openai import OpenAI
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader for parsing existing LookML, falling back to pure Python
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader
+
+# Upper bound on concurrent LLM requests issued by a single LookML generation
+MAX_PARALLEL_LLM_CALLS = 4
+
+# Serialized metadata shorter than threshold * this many characters is never over the token threshold
+CHARS_PER_TOKEN_LOWER_BOUND = 3
+
+# Table- and column-level metadata fields that LookML generation draws on; everything
+# else (statistics, data quality, sample rows, processing stats) is left out of prompts
+_LOOKML_TABLE_FIELDS = ('table_name', 'description', 'schema', 'columns', 'constraints', 'relationships')
+_LOOKML_COLUMN_FIELDS = ('data_type', 'description', 'business_name', 'is_nullable', 'constraints',
+                         'is_categorical', 'is_numerical', 'format')
+
+# Static prompt scaffolding, built once at import and joined with per-call metadata
+_ADDITIONAL_REQUIREMENTS_HEAD = "Additional Requirements:\n"
+
+_VIEWS_PROMPT_HEAD = "Generate LookML view definitions for these tables:\n\nTable Metadata:\n"
+
+_VIEWS_PROMPT_INSTRUCTIONS = """
+
+For each table, create a LookML view that:
+1. Uses appropriate dimension types based on the column data types and usage
+2. Includes clear descriptions for dimensions and measures
+3. Sets primary keys and foreign keys correctly
+4. Creates relevant measures based on the data type and business context
+5. Uses proper LookML syntax and best practices
+
+"""
+
+_DERIVED_TABLES_PROMPT = """Also suggest derived tables where appropriate for:
+- Common aggregations
+- Useful combinations of data
+- Performance optimization"""
+
+_VIEWS_PROMPT_FORMAT_HEAD = """
+
+Return the response in this JSON format:
+{
+    "views": [
+        {
+            "view_name": "name of the view",
+            "sql_table_name": \""""
+
+_VIEWS_PROMPT_FORMAT_TAIL = """.table_name",
+            "dimensions": [
+                {
+                    "name": "dimension name",
+                    "type": "dimension type",
+                    "sql": "SQL definition",
+                    "description": "Clear description",
+                    "primary_key": true/false,
+                    "group_label": "optional grouping label",
+                    "value_format": "optional format string"
+                }
+            ],
+            "measures": [
+                {
+                    "name": "measure name",
+                    "type": "measure type",
+                    "sql": "SQL definition",
+                    "description": "Clear description",
+                    "value_format": "optional format string"
+                }
+            ],
+            "derived_tables": [
+                {
+                    "name": "derived table name",
+                    "sql": "SQL definition",
+                    "dimensions": [],
+                    "measures": []
+                }
+            ],
+            "suggestions": {
+                "indexes": ["suggested indexes"],
+                "relationships": ["suggested relationships"],
+                "drill_fields": ["suggested drill fields"]
+            }
+        }
+    ]
+}"""
+
+_EXPLORES_PROMPT_HEAD = "Based on these LookML views and table metadata:\n\nViews:\n"
+
+_EXPLORES_PROMPT_METADATA = "\n\nTable Metadata:\n"
+
+_EXPLORES_PROMPT_TAIL = """
+
+Generate LookML explore definitions that:
+1. Identify logical join relationships between views
+2. Set appropriate join types and relationships
+3. Include relevant fields in the joins
+4. Group related explores together
+5. Use proper LookML syntax and best practices
+6. Consider foreign key relationships from metadata
+7. Add appropriate labels and descriptions
+
+Return the response in this JSON format:
+{
+    "explores": [
+        {
+            "name": "explore name",
+            "view_name": "base view name",
+            "label": "User-friendly label",
+            "description": "Clear description",
+            "fields": ["included fields"],
+            "joins": [
+                {
+                    "name": "joined view name",
+                    "type": "join type",
+                    "relationship": "one_to_many/many_to_one/etc",
+                    "sql_on": "SQL join condition",
+                    "fields": ["included fields from joined view"]
+                }
+            ],
+            "suggestions": {
+                "fields_to_consider": ["suggested fields to include"],
+                "common_queries": ["example business questions"],
+                "access_filters": ["suggested access filters"]
+            }
+        }
+    ]
+}"""
+
+_APPEND_PROMPT_HEAD = "Given this existing LookML model and additional requirements, generate new measures to add:\n\nExisting LookML:\n"
+
+_APPEND_PROMPT_TAIL = """
+
+Generate ONLY new measures that:
+1. Address the additional requirements
+2. Don't duplicate existing measures
+3. Use proper LookML syntax and best practices
+4. Include clear descriptions
+5. Use appropriate aggregation types and SQL definitions
+
+Return the response in this JSON format:
+{
+    "new_measures": [
+        {
+            "view_name": "name of the view to add measure to",
+            "measures": [
+                {
+                    "name": "measure name",
+                    "type": "measure type",
+                    "sql": "SQL definition",
+                    "description": "Clear description",
+                    "value_format": "optional format string"
+                }
+            ]
+        }
+    ]
+}"""
+
+
+def _truncate_strings(data: Any, limit: int = 200) -> None:
+    """
+    Truncate every string longer than limit inside nested dicts/lists, in place.
+    
+    Args:
+        data: Dict or list to walk
+        limit: Maximum string length to keep
+    """
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if type(node) is dict:
+            items = node.items()
+        elif type(node) is list:
+            items = enumerate(node)
+        else:
+            continue
+        for key, value in items:
+            if type(value) is str:
+                if len(value) > limit:
+                    node[key] = value[:limit] + "..."
+            elif type(value) is dict or type(value) is list:
+                stack.append(value)
+
+
+def _project_for_lookml(table_metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Narrow one table's metadata to the fields used to generate LookML.
+    
+    Args:
+        table_metadata: Metadata for a single table
+        
+    Returns:
+        New dictionary holding only the LookML-relevant fields
+    """
+    projected = {key: table_metadata[key] for key in _LOOKML_TABLE_FIELDS if key in table_metadata}
+    columns = projected.get('columns')
+    if type(columns) is dict:
+        projected['columns'] = {
+            column_name: {key: column[key] for key in _LOOKML_COLUMN_FIELDS if key in column}
+            if type(column) is dict else column
+            for column_name, column in columns.items()
+        }
+    return projected
+
 
 def chunk_metadata_by_tokens(
     metadata: Dict[str, Any], 
@@ -26,6 +238,8 @@ def chunk_metadata_by_tokens(
     """
     Chunk metadata to stay within token limits.
     
+    Metadata over the threshold is truncated in place.
+    
     Args:
         metadata: Metadata dictionary to chunk
         token_threshold: Maximum tokens allowed
@@ -34,15 +248,20 @@ def chunk_metadata_by_tokens(
     Returns:
         Chunked metadata dictionary
     """
-    # Convert metadata to JSON string to count tokens
-    metadata_str = json.dumps(metadata, indent=2)
-    current_tokens = token_counter.count_tokens(metadata_str)
+    # Serialize the way the metadata is sent in prompts to size it
+    metadata_str = json_utils.dumps(metadata)
+    
+    # Cheap bound first: JSON averages more than 3 characters per token, so
+    # anything this short is within the threshold without running the tokenizer
+    if len(metadata_str) < token_threshold * CHARS_PER_TOKEN_LOWER_BOUND:
+        return metadata
     
+    current_tokens = token_counter.count_tokens(metadata_str)
     if current_tokens <= token_threshold:
         return metadata
     
-    # If over threshold, truncate sample data and other large fields
-    chunked_metadata = metadata.copy()
+    # If over threshold, truncate sample data and other large fields in place
+    chunked_metadata = metadata
     
     # Remove or reduce large fields
     if 'sample_data' in chunked_metadata:
@@ -52,19 +271,26 @@ def chunk_metadata_by_tokens(
             chunked_metadata['sample_data'] = sample_data[:5]
     
     # Truncate long text fields
-    for table_key, table_data in chunked_metadata.items():
-        if isinstance(table_data, dict):
-            if 'columns' in table_data:
-                for col_key, col_data in table_data['columns'].items():
-                    if isinstance(col_data, dict):
-                        for field, value in col_data.items():
-                            if isinstance(value, str) and len(value) > 200:
-                                col_data[field] = value[:200] + "..."
+    for table_data in chunked_metadata.values():
+        if type(table_data) is dict and 'columns' in table_data:
+            _truncate_strings(table_data['columns'])
+    
+    # Estimate rather than re-tokenize the trimmed metadata
+    estimated_tokens = len(json_utils.dumps(chunked_metadata)) // 4
+    if estimated_tokens > token_threshold:
+        logger.warning(f"Metadata still estimated at {estimated_tokens} tokens after truncation "
+                       f"(threshold {token_threshold})")
     
     return chunked_metadata
 
 
-def call_llm_json(client: OpenAI, model: str, prompt: str) -> Dict[str, Any]:
+def call_llm_json(
+    client: "OpenAI",
+    model: str,
+    prompt: str,
+    stream: bool = False,
+    token_counter: Optional[TokenCounter] = None
+) -> Dict[str, Any]:
     """
     Call LLM and get JSON response.
     
@@ -72,12 +298,195 @@ def call_llm_json(client: OpenAI, model: str, prompt: str) -> Dict[str, Any]:
         client: OpenAI client instance
         model: Model name to use
         prompt: Prompt to send
+        stream: Whether to stream the completion from the API
+        token_counter: Optional token counter to record usage in
         
     Returns:
         Parsed JSON response
     """
-    llm_client = LLMClient(model=model, client=client)
-    return llm_client.call_llm_json(prompt)
+    llm_client = LLMClient(model=model, client=client, token_counter=token_counter)
+    return llm_client.call_llm_json(prompt, stream=stream)
+
+
+class CachedLLMClient:
+    """
+    In-process cache of parsed LLM JSON responses.
+    
+    Prompts are keyed on a SHA-256 digest of the model name and the exact
+    prompt text, so regenerating a model for the same tables and
+    instructions reuses the earlier response instead of paying for another
+    LLM round trip.
+    """
+    
+    def __init__(self, maxsize: int = 256, ttl_seconds: float = 3600):
+        """
+        Initialize the response cache.
+        
+        Args:
+            maxsize: Maximum number of responses to keep
+            ttl_seconds: How long a cached response stays valid
+        """
+        self._responses = TTLCache(maxsize=maxsize, ttl_seconds=ttl_seconds)
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(model: str, prompt: str) -> str:
+        """Build the cache key for a model/prompt pair."""
+        return hashlib.sha256(f"{model}\x00{prompt}".encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached response, or None if missing or expired."""
+        response = self._responses.get(key)
+        if response is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return copy.deepcopy(response)
+    
+    def put(self, key: str, response: Dict[str, Any]) -> None:
+        """Store a copy of a response, evicting the least recently used entry when full."""
+        self._responses.set(key, copy.deepcopy(response))
+    
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._responses.clear()
+        self.hits = 0
+        self.misses = 0
+    
+    def call_llm_json(
+        self,
+        client: "OpenAI",
+        model: str,
+        prompt: str,
+        stream: bool = False,
+        token_counter: Optional[TokenCounter] = None
+    ) -> Dict[str, Any]:
+        """
+        Call LLM and get JSON response, serving repeated prompts from the cache.
+        
+        Args:
+            client: OpenAI client instance
+            model: Model name to use
+            prompt: Prompt to send
+            stream: Whether to stream the completion from the API
+            token_counter: Optional token counter to record usage in
+            
+        Returns:
+            Parsed JSON response
+        """
+        key = self.make_key(model, prompt)
+        cached = self.get(key)
+        if cached is not None:
+            logger.info("Using cached LLM response")
+            return cached
+        
+        response = call_llm_json(client, model, prompt, stream=stream, token_counter=token_counter)
+        if response:
+            self.put(key, response)
+        return response
+
+
+# Shared response cache for LookML generation
+_llm_response_cache = CachedLLMClient()
+
+
+def _build_views_prompt(
+    metadata_json: str,
+    schema_name: str,
+    additional_prompt: Optional[str],
+    include_derived_tables: bool
+) -> str:
+    """
+    Build the prompt asking the LLM for LookML view definitions.
+    
+    Args:
+        metadata_json: Serialized metadata for the tables to generate views for
+        schema_name: Schema name
+        additional_prompt: Additional instructions for LookML generation
+        include_derived_tables: Whether to include derived table suggestions
+        
+    Returns:
+        Prompt string
+    """
+    return "".join((
+        _VIEWS_PROMPT_HEAD,
+        metadata_json,
+        "\n\n",
+        _ADDITIONAL_REQUIREMENTS_HEAD + additional_prompt if additional_prompt else "",
+        _VIEWS_PROMPT_INSTRUCTIONS,
+        _DERIVED_TABLES_PROMPT if include_derived_tables else "",
+        _VIEWS_PROMPT_FORMAT_HEAD,
+        schema_name,
+        _VIEWS_PROMPT_FORMAT_TAIL,
+    ))
+
+
+def _build_explores_prompt(views_json: str, metadata_json: str) -> str:
+    """
+    Build the prompt asking the LLM for LookML explore definitions.
+    
+    Args:
+        views_json: Serialized view definitions generated so far
+        metadata_json: Serialized table metadata
+        
+    Returns:
+        Prompt string
+    """
+    return "".join((_EXPLORES_PROMPT_HEAD, views_json, _EXPLORES_PROMPT_METADATA, metadata_json, _EXPLORES_PROMPT_TAIL))
+
+
+def _build_append_prompt(existing_lookml: str, additional_prompt: str, metadata_json: str) -> str:
+    """
+    Build the prompt asking the LLM for measures to add to existing LookML.
+    
+    Args:
+        existing_lookml: Existing LookML content
+        additional_prompt: Additional requirements for the new measures
+        metadata_json: Serialized table metadata
+        
+    Returns:
+        Prompt string
+    """
+    return "".join((
+        _APPEND_PROMPT_HEAD,
+        existing_lookml,
+        "\n\n" + _ADDITIONAL_REQUIREMENTS_HEAD,
+        additional_prompt,
+        "\n\nTable Metadata:\n",
+        metadata_json,
+        _APPEND_PROMPT_TAIL,
+    ))
+
+
+def _request_views(llm_json, client: "OpenAI", model: str, views_prompt: str) -> List[Dict[str, Any]]:
+    """
+    Send a views prompt to the LLM and validate the response.
+    
+    Args:
+        llm_json: Function used to call the LLM and parse its JSON response
+        client: OpenAI client instance
+        model: Model name to use
+        views_prompt: Prompt to send
+        
+    Returns:
+        List of view definitions
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Sending prompt for views:\n%s", views_prompt)
+    
+    views_response = llm_json(client, model, views_prompt, stream=True)
+    logger.debug("Raw LLM response for views: %s", views_response)
+
+    if not views_response:
+        logger.error("Empty response received from LLM for views generation")
+        raise ValueError("Empty response from LLM")
+
+    if 'views' not in views_response:
+        logger.error(f"Invalid response format. Expected 'views' key but got: {list(views_response.keys())}")
+        raise ValueError("Invalid response format from LLM")
+
+    return views_response.get('views', [])
 
 
 def generate_lookml_model(
@@ -92,7 +501,8 @@ def generate_lookml_model(
     generation_type: str = "full",
     additional_prompt: Optional[str] = None,
     existing_lookml: Optional[str] = None,
-    token_threshold: Optional[int] = 8000
+    token_threshold: Optional[int] = 8000,
+    cache_enabled: bool = True
 ) -> Dict[str, Any]:
     """
     Generates a LookML semantic model for the specified tables.
@@ -111,6 +521,7 @@ def generate_lookml_model(
         additional_prompt: Additional instructions for LookML generation
         existing_lookml: Existing LookML content when appending
         token_threshold: Optional maximum token count for metadata
+        cache_enabled: Whether to reuse cached LLM responses for identical prompts
     """
     logger.info(f"Starting LookML generation for tables: {table_names}")
     start_time = time.time()
@@ -118,39 +529,46 @@ def generate_lookml_model(
 
     # Get API config including model
     api_key, base_url, model_name = get_llm_api_config()
-    client = OpenAI(
-        api_key=api_key,
-        base_url=base_url
-    )
+    client = get_openai_client(api_key, base_url)
     model = model or model_name
     logger.debug(f"Using model: {model}")
+    cached_or_direct = _llm_response_cache.call_llm_json if cache_enabled else call_llm_json
+    # Record usage of every LLM call in this generation's token counter
+    llm_json = functools.partial(cached_or_direct, token_counter=token_counter)
 
     # Use provided metadata or fetch from database
     tables_metadata = {}
     if metadata:
         logger.info("Using provided metadata")
+        # Drop fields LookML generation doesn't use before sizing or serializing anything
+        if set(metadata) <= set(table_names):
+            tables_metadata = {
+                table_name: _project_for_lookml(table_metadata) if type(table_metadata) is dict else table_metadata
+                for table_name, table_metadata in metadata.items()
+            }
+        else:
+            tables_metadata = _project_for_lookml(metadata)
+
         # If token threshold is set, chunk the metadata
         if token_threshold:
             logger.debug(f"Chunking metadata with token threshold: {token_threshold}")
-            tables_metadata = chunk_metadata_by_tokens(metadata, token_threshold, token_counter)
+            tables_metadata = chunk_metadata_by_tokens(tables_metadata, token_threshold, token_counter)
                 
             logger.debug(f"Chunked metadata to meet token threshold of {token_threshold}")
-        else:
-            tables_metadata = metadata
     else:
         logger.debug("Fetching metadata from database")
         # Get metadata for each table
         db = get_db_handler(db_name)
         try:
+            # Fetch schemas and constraints for all tables in one round trip each
+            schemas = db.get_tables_schemas(table_names)
+            constraints_by_table = extract_constraints_bulk(table_names, db_name, db=db)
+            
             for table_name in table_names:
                 logger.debug(f"Processing metadata for table: {table_name}")
-                # Get schema and constraints
-                schema = db.get_table_schema(table_name)
-                constraints = extract_constraints(table_name, db_name)
-
                 table_metadata = {
-                    'schema': schema,
-                    'constraints': constraints
+                    'schema': schemas.get(table_name, {}),
+                    'constraints': constraints_by_table.get(table_name, {})
                 }
 
                 # Get catalog entry if available
@@ -171,52 +589,21 @@ def generate_lookml_model(
 
                 tables_metadata[table_name] = table_metadata
         finally:
-            db.close()
+            db.release()
+
+    # Serialize the metadata once (compact) and reuse it in every prompt
+    metadata_json = json_utils.dumps(tables_metadata)
 
     if generation_type == "append" and existing_lookml and additional_prompt:
         logger.info("Generating append-type LookML with additional measures")
         # Create prompt for appending new measures
-        append_prompt = f"""Given this existing LookML model and additional requirements, generate new measures to add:
-
-Existing LookML:
-{existing_lookml}
-
-Additional Requirements:
-{additional_prompt}
-
-Table Metadata:
-{json.dumps(tables_metadata, indent=2)}
-
-Generate ONLY new measures that:
-1. Address the additional requirements
-2. Don't duplicate existing measures
-3. Use proper LookML syntax and best practices
-4. Include clear descriptions
-5. Use appropriate aggregation types and SQL definitions
-
-Return the response in this JSON format:
-{{
-    "new_measures": [
-        {{
-            "view_name": "name of the view to add measure to",
-            "measures": [
-                {{
-                    "name": "measure name",
-                    "type": "measure type",
-                    "sql": "SQL definition",
-                    "description": "Clear description",
-                    "value_format": "optional format string"
-                }}
-            ]
-        }}
-    ]
-}}"""
+        append_prompt = _build_append_prompt(existing_lookml, additional_prompt, metadata_json)
 
         try:
             # Generate new measures
             logger.info("Calling LLM to generate new measures")
-            measures_response = call_llm_json(client, model, append_prompt)
-            logger.debug(f"Raw LLM response for measures: {measures_response}")
+            measures_response = llm_json(client, model, append_prompt)
+            logger.debug("Raw LLM response for measures: %s", measures_response)
 
             if not measures_response:
                 logger.error("Empty response received from LLM for measures generation")
@@ -224,32 +611,32 @@ Return the response in this JSON format:
 
             # Parse existing LookML to combine with new measures
             logger.info("Parsing existing LookML")
-            import yaml
-            existing_model = yaml.safe_load(existing_lookml)
+            existing_model = yaml.load(existing_lookml, Loader=_YamlSafeLoader)
 
             # Add new measures to existing views
             measures_added = 0
             if measures_response and 'new_measures' in measures_response:
                 logger.info("Adding new measures to views")
+                views_by_name = {view['view_name']: view for view in existing_model.get('views', [])}
                 for new_measure_group in measures_response['new_measures']:
-                    view_name = new_measure_group['view_name']
-                    for view in existing_model.get('views', []):
-                        if view['view_name'] == view_name:
-                            view['measures'].extend(new_measure_group['measures'])
-                            measures_added += len(new_measure_group['measures'])
+                    view = views_by_name.get(new_measure_group['view_name'])
+                    if view is not None:
+                        view.setdefault('measures', []).extend(new_measure_group['measures'])
+                        measures_added += len(new_measure_group['measures'])
                 logger.info(f"Added {measures_added} new measures")
             else:
                 logger.warning("No new measures found in LLM response")
 
+            token_stats = token_counter.get_usage_stats()
             result = {
                 'model_name': existing_model.get('model_name', model_name),
                 'views': existing_model.get('views', []),
                 'explores': existing_model.get('explores', []),
                 'processing_stats': {
                     'total_time_seconds': round(time.time() - start_time, 2),
-                    'total_tokens': token_counter.get_usage_stats()['total_tokens'],
-                    'request_count': token_counter.get_usage_stats()['request_count'],
-                    'average_tokens_per_request': round(token_counter.get_usage_stats()['average_tokens_per_request'], 2),
+                    'total_tokens': token_stats['total_tokens'],
+                    'request_count': token_stats['request_count'],
+                    'average_tokens_per_request': round(token_stats['average_tokens_per_request'], 2),
                     'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
                     'measures_added': measures_added
                 }
@@ -261,141 +648,47 @@ Return the response in this JSON format:
             logger.error(f"Error appending measures to LookML: {str(e)}", exc_info=True)
             raise
 
-    # Create prompt for generating LookML views
-    logger.info("Generating views prompt")
-    views_prompt = f"""Generate LookML view definitions for these tables:
-
-Table Metadata:
-{json.dumps(tables_metadata, indent=2)}
-
-{f'''Additional Requirements:
-{additional_prompt}''' if additional_prompt else ''}
-
-For each table, create a LookML view that:
-1. Uses appropriate dimension types based on the column data types and usage
-2. Includes clear descriptions for dimensions and measures
-3. Sets primary keys and foreign keys correctly
-4. Creates relevant measures based on the data type and business context
-5. Uses proper LookML syntax and best practices
-
-{f'''Also suggest derived tables where appropriate for:
-- Common aggregations
-- Useful combinations of data
-- Performance optimization''' if include_derived_tables else ''}
-
-Return the response in this JSON format:
-{{
-    "views": [
-        {{
-            "view_name": "name of the view",
-            "sql_table_name": "{schema_name}.table_name",
-            "dimensions": [
-                {{
-                    "name": "dimension name",
-                    "type": "dimension type",
-                    "sql": "SQL definition",
-                    "description": "Clear description",
-                    "primary_key": true/false,
-                    "group_label": "optional grouping label",
-                    "value_format": "optional format string"
-                }}
-            ],
-            "measures": [
-                {{
-                    "name": "measure name",
-                    "type": "measure type",
-                    "sql": "SQL definition",
-                    "description": "Clear description",
-                    "value_format": "optional format string"
-                }}
-            ],
-            "derived_tables": [
-                {{
-                    "name": "derived table name",
-                    "sql": "SQL definition",
-                    "dimensions": [],
-                    "measures": []
-                }}
-            ],
-            "suggestions": {{
-                "indexes": ["suggested indexes"],
-                "relationships": ["suggested relationships"],
-                "drill_fields": ["suggested drill fields"]
-            }}
-        }}
-    ]
-}}"""
-
     try:
-        # Generate views with token limit handling
+        # Generate views, one concurrent LLM request per table when metadata is keyed by table
         logger.info("Calling LLM to generate views")
-        logger.info(f"Sending prompt for views:\n{views_prompt}")
-        
-        views_response = call_llm_json(client, model, views_prompt)
-        logger.debug(f"Raw LLM response for views: {views_response}")
-
-        if not views_response:
-            logger.error("Empty response received from LLM for views generation")
-            raise ValueError("Empty response from LLM")
-
-        if 'views' not in views_response:
-            logger.error(f"Invalid response format. Expected 'views' key but got: {list(views_response.keys())}")
-            raise ValueError("Invalid response format from LLM")
+        if len(tables_metadata) > 1 and set(tables_metadata) <= set(table_names):
+            max_workers = min(len(tables_metadata), MAX_PARALLEL_LLM_CALLS)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        _request_views, llm_json, client, model,
+                        _build_views_prompt(json_utils.dumps({table_name: table_metadata}), schema_name,
+                                            additional_prompt, include_derived_tables)
+                    )
+                    for table_name, table_metadata in tables_metadata.items()
+                ]
+                views = [view for future in futures for view in future.result()]
+        else:
+            views = _request_views(
+                llm_json, client, model,
+                _build_views_prompt(metadata_json, schema_name, additional_prompt, include_derived_tables)
+            )
+        views_response = {'views': views}
 
         logger.info(f"Generated {len(views_response.get('views', []))} views")
 
         explores = []
-        if include_explores:
+        if include_explores and len(table_names) == 1:
+            # A single view has nothing to join, so build its explore locally instead of asking the LLM.
+            # Use the generated view's name, which may differ from the table name.
+            if views:
+                view_name = views[0]['view_name']
+                explores = [{'name': view_name, 'view_name': view_name, 'label': view_name.replace('_', ' ').title(), 'joins': []}]
+            logger.info("Single table requested, skipping LLM call for explores")
+        elif include_explores:
             logger.info("Generating explores prompt")
             # Create prompt for generating explores
-            explores_prompt = f"""Based on these LookML views and table metadata:
-
-Views:
-{json.dumps(views_response.get('views', []), indent=2)}
-
-Table Metadata:
-{json.dumps(tables_metadata, indent=2)}
-
-Generate LookML explore definitions that:
-1. Identify logical join relationships between views
-2. Set appropriate join types and relationships
-3. Include relevant fields in the joins
-4. Group related explores together
-5. Use proper LookML syntax and best practices
-6. Consider foreign key relationships from metadata
-7. Add appropriate labels and descriptions
-
-Return the response in this JSON format:
-{{
-    "explores": [
-        {{
-            "name": "explore name",
-            "view_name": "base view name",
-            "label": "User-friendly label",
-            "description": "Clear description",
-            "fields": ["included fields"],
-            "joins": [
-                {{
-                    "name": "joined view name",
-                    "type": "join type",
-                    "relationship": "one_to_many/many_to_one/etc",
-                    "sql_on": "SQL join condition",
-                    "fields": ["included fields from joined view"]
-                }}
-            ],
-            "suggestions": {{
-                "fields_to_consider": ["suggested fields to include"],
-                "common_queries": ["example business questions"],
-                "access_filters": ["suggested access filters"]
-            }}
-        }}
-    ]
-}}"""
+            explores_prompt = _build_explores_prompt(json_utils.dumps(views_response.get('views', [])), metadata_json)
 
             logger.info("Calling LLM to generate explores")
             
-            explores_response = call_llm_json(client, model, explores_prompt)
-            logger.debug(f"Raw LLM response for explores: {explores_response}")
+            explores_response = llm_json(client, model, explores_prompt, stream=True)
+            logger.debug("Raw LLM response for explores: %s", explores_response)
 
             if not explores_response:
                 logger.error("Empty response received from LLM for explores generation")
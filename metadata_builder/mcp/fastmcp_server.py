@@ -1,23 +1,106 @@
 """FastMCP Server implementation for metadata intelligence - Superior to traditional MCP."""
 
-import json
+import asyncio
+import contextlib
+import inspect
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from itertools import islice
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime
 
 from fastmcp import FastMCP
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
-from ..core.generate_table_metadata import generate_complete_table_metadata
+from ..core.generate_table_metadata import generate_complete_table_metadata, generate_column_metadata
 from ..core.semantic_models import generate_lookml_model
-from ..utils.database_handler import get_db_handler
-from ..config.config import load_config
+from ..config.config import load_config, get_db_config, get_db_handler
+from ..utils import json_utils
+from ..utils.database_handler import SQLAlchemyHandler
+from ..utils.table_search import build_name_index, match_table_names
+from ..utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Generated table metadata is reused for this long across tool calls
+METADATA_CACHE_TTL_SECONDS = 300
+METADATA_CACHE_MAXSIZE = 512
+
+# Table listings and the lowercased name indexes built from them are refreshed after this long
+NAME_INDEX_TTL_SECONDS = 60
+
+# Formatted search results are reused for repeated queries
+SEARCH_CACHE_MAXSIZE = 256
+
+# Generated semantic models stay readable as resources for this long
+SEMANTIC_MODEL_TTL_SECONDS = 3600
+SEMANTIC_MODEL_CACHE_MAXSIZE = 32
+
+# Tables per page of the database schema resource
+SCHEMA_RESOURCE_PAGE_SIZE = 100
+
+# Columns and quality metrics listed in the AI-oriented metadata summary
+AI_SUMMARY_MAX_COLUMNS = 15
+AI_SUMMARY_MAX_QUALITY_METRICS = 5
+
+
+# (second, ISO timestamp) of the last generated_at stamp
+_TS_CACHE = [0.0, ""]
+
+
+def _now_iso() -> str:
+    """Current local time as an ISO string, reformatted at most once per second."""
+    now = time.time()
+    if now - _TS_CACHE[0] >= 1.0:
+        _TS_CACHE[1] = datetime.fromtimestamp(now).isoformat()
+        _TS_CACHE[0] = now
+    return _TS_CACHE[1]
+
+
+@contextlib.asynccontextmanager
+async def pooled_db_handler(db_name: str):
+    """
+    Get a database handler for the duration of a tool call.
+    
+    Handlers share a per-database connection pool for the life of the
+    process; releasing returns the handler's connection to that pool as
+    soon as the tool is done instead of whenever it is garbage collected.
+    Connecting happens in a worker thread so it never blocks the event loop.
+    
+    Args:
+        db_name: Database name
+        
+    Yields:
+        Database handler
+    """
+    db = await asyncio.to_thread(get_db_handler, db_name)
+    try:
+        yield db
+    finally:
+        db.release()
+
+
+def _pool_capacity(db_name: str) -> int:
+    """Connections a database's shared pool can hand out (pool_size + max_overflow)."""
+    engine_args = SQLAlchemyHandler._engine_args(get_db_config(db_name))
+    return engine_args['pool_size'] + engine_args['max_overflow']
+
+
+# Request models are immutable and reject unknown fields, which keeps their
+# compiled validators tight since FastMCP validates every tool call
+REQUEST_MODEL_CONFIG = ConfigDict(
+    frozen=True,
+    extra='forbid',
+    str_strip_whitespace=False,
+    validate_default=False,
+)
+
+
 # Pydantic models for type safety and auto-documentation
 class TableMetadataRequest(BaseModel):
     """Request model for table metadata with validation and documentation."""
+    model_config = REQUEST_MODEL_CONFIG
+    
     database: str = Field(..., description="Database name to query")
     table: str = Field(..., description="Table name to analyze")
     schema: str = Field("public", description="Schema name (defaults to 'public')")
@@ -27,31 +110,41 @@ class TableMetadataRequest(BaseModel):
 
 class TableSearchRequest(BaseModel):
     """Request model for table search operations."""
+    model_config = REQUEST_MODEL_CONFIG
+    
     query: str = Field(..., description="Search query (table name pattern or business term)")
     database: Optional[str] = Field(None, description="Specific database to search (optional)")
     limit: int = Field(20, ge=1, le=100, description="Maximum results to return (1-100)")
 
 class QualityAnalysisRequest(BaseModel):
     """Request model for data quality analysis."""
+    model_config = REQUEST_MODEL_CONFIG
+    
     database: str = Field(..., description="Database name to analyze")
     table: Optional[str] = Field(None, description="Table name (optional - analyzes entire database if not provided)")
     schema: str = Field("public", description="Schema name")
 
 class SchemaOverviewRequest(BaseModel):
     """Request model for schema overview."""
+    model_config = REQUEST_MODEL_CONFIG
+    
     database: str = Field(..., description="Database name")
     schema: str = Field("public", description="Schema name")
 
 class SemanticModelRequest(BaseModel):
     """Request model for semantic model generation."""
+    model_config = REQUEST_MODEL_CONFIG
+    
     database: str = Field(..., description="Database name")
     tables: List[str] = Field(..., description="List of table names to include in model")
     schema: str = Field("public", description="Schema name")
-    model_type: str = Field("lookml", regex="^(lookml|dbt)$", description="Type of semantic model")
+    model_type: str = Field("lookml", pattern="^(lookml|dbt)$", description="Type of semantic model")
     model_name: str = Field(..., description="Name for the generated model")
 
 class BusinessContextRequest(BaseModel):
     """Request model for business context explanation."""
+    model_config = REQUEST_MODEL_CONFIG
+    
     database: str = Field(..., description="Database name")
     table: str = Field(..., description="Table name")
     column: Optional[str] = Field(None, description="Column name (optional - explains entire table if not provided)")
@@ -64,9 +157,257 @@ class MetadataFastMCPServer:
     def __init__(self):
         self.app = FastMCP("Metadata Intelligence Server")
         self.config = load_config()
+        self._db_names = tuple(self.config.get('databases', {}).keys())
+        self._tables_cache = TTLCache(maxsize=64, ttl_seconds=NAME_INDEX_TTL_SECONDS)
+        self._meta_cache = TTLCache(maxsize=METADATA_CACHE_MAXSIZE, ttl_seconds=METADATA_CACHE_TTL_SECONDS)
+        self._meta_locks: Dict[tuple, asyncio.Lock] = {}
+        self._db_slots: Dict[str, asyncio.Semaphore] = {}
+        self._name_index = TTLCache(maxsize=64, ttl_seconds=NAME_INDEX_TTL_SECONDS)
+        self._search_cache = TTLCache(maxsize=SEARCH_CACHE_MAXSIZE, ttl_seconds=NAME_INDEX_TTL_SECONDS)
+        self._semantic_models = TTLCache(maxsize=SEMANTIC_MODEL_CACHE_MAXSIZE, ttl_seconds=SEMANTIC_MODEL_TTL_SECONDS)
         self._setup_tools()
         self._setup_resources()
         
+    def _db_slot(self, db_name: str) -> asyncio.Semaphore:
+        """
+        Get the semaphore limiting connections checked out from a database.
+        
+        It is sized to the database's pool (pool_size + max_overflow) so tool
+        calls wait here rather than timing out inside the pool.
+        
+        Args:
+            db_name: Database name
+            
+        Returns:
+            Semaphore shared by all tool calls against the database
+        """
+        slot = self._db_slots.get(db_name)
+        if slot is None:
+            slot = self._db_slots[db_name] = asyncio.Semaphore(_pool_capacity(db_name))
+        return slot
+        
+    @contextlib.asynccontextmanager
+    async def _checkout(self, db_name: str):
+        """
+        Check out a pooled database handler once a connection slot is free.
+        
+        Args:
+            db_name: Database name
+            
+        Yields:
+            Database handler
+        """
+        async with self._db_slot(db_name):
+            async with pooled_db_handler(db_name) as db:
+                yield db
+        
+    async def _run_db(self, db_name: str, func: Callable, /, *args, **kwargs) -> Any:
+        """
+        Run blocking metadata work that opens its own handler in a worker thread.
+        
+        The work holds one of the database's connection slots while it runs.
+        Calls on a handler from _checkout() already hold a slot and go
+        straight to asyncio.to_thread().
+        
+        Args:
+            db_name: Database the work runs against
+            func: Blocking callable
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+            
+        Returns:
+            The callable's result
+        """
+        async with self._db_slot(db_name):
+            return await asyncio.to_thread(func, *args, **kwargs)
+        
+    async def _tables(self, db_name: str, db, schema_name: Optional[str] = None) -> List[str]:
+        """
+        List a database's tables, reusing listings fetched in the last minute.
+        
+        Args:
+            db_name: Database name
+            db: Handler for the database, used on a cache miss
+            schema_name: Optional schema to list
+            
+        Returns:
+            Table names
+        """
+        key = (db_name, schema_name)
+        tables = self._tables_cache.get(key)
+        if tables is None:
+            if schema_name is None:
+                tables = await asyncio.to_thread(db.get_all_tables)
+            else:
+                tables = await asyncio.to_thread(db.get_all_tables, schema_name)
+            self._tables_cache.set(key, tables)
+        return tables
+        
+    async def _cached_metadata(
+        self,
+        generator: Callable = generate_complete_table_metadata,
+        /,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Generate table metadata, reusing results from recent identical requests.
+        
+        Concurrent requests for the same table and options wait on a shared
+        lock so the metadata is only generated once. Failed generations are
+        not cached.
+        
+        Args:
+            generator: Metadata function to call on a cache miss
+            **kwargs: Arguments for the generator
+            
+        Returns:
+            Table metadata dictionary
+        """
+        # Key on the full argument set so calls that spell out defaults share an entry
+        arguments = inspect.signature(generator).bind(**kwargs)
+        arguments.apply_defaults()
+        key = (generator.__name__, *sorted(arguments.arguments.items()))
+        metadata = self._meta_cache.get(key)
+        if metadata is not None:
+            return metadata
+        
+        lock = self._meta_locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                metadata = self._meta_cache.get(key)
+                if metadata is None:
+                    metadata = await self._run_db(kwargs['db_name'], generator, **kwargs)
+                    if "error" not in metadata:
+                        self._meta_cache.set(key, metadata)
+        finally:
+            if self._meta_locks.get(key) is lock:
+                del self._meta_locks[key]
+        return metadata
+        
+    async def _load_table_metadata(
+        self,
+        database: str,
+        schema: str,
+        table: str,
+        include_samples: bool = True,
+        include_quality: bool = True,
+        include_relationships: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Get full table metadata as served by get_table_metadata and its resource.
+        
+        Args:
+            database: Database name
+            schema: Schema name
+            table: Table name
+            include_samples: Whether to sample rows
+            include_quality: Whether to compute data quality metrics
+            include_relationships: Whether to analyze relationships
+            
+        Returns:
+            Table metadata dictionary, from the metadata cache when recent
+        """
+        return await self._cached_metadata(
+            db_name=database,
+            table_name=table,
+            schema_name=schema,
+            sample_size=100,
+            num_samples=3,
+            include_samples=include_samples,
+            include_data_quality=include_quality,
+            include_relationships=include_relationships
+        )
+        
+    async def _schema_page(self, database: str, page: int) -> str:
+        """
+        Build one page of the database schema resource.
+        
+        Column listings for the whole page are fetched in a single
+        information_schema query rather than one query per table.
+        
+        Args:
+            database: Database name
+            page: 1-based page number
+            
+        Returns:
+            JSON document with the page's tables and their columns
+        """
+        if page < 1:
+            return json_utils.dumps({"error": f"Invalid page: {page}"})
+        
+        try:
+            async with self._checkout(database) as db:
+                tables = await self._tables(database, db)
+                start = (page - 1) * SCHEMA_RESOURCE_PAGE_SIZE
+                page_tables = tables[start:start + SCHEMA_RESOURCE_PAGE_SIZE]
+                schemas = await asyncio.to_thread(db.get_tables_schemas, page_tables)
+            
+            total_pages = max(1, -(-len(tables) // SCHEMA_RESOURCE_PAGE_SIZE))
+            schema_info = {
+                "database": database,
+                "page": page,
+                "total_pages": total_pages,
+                "total_tables": len(tables),
+                "next_page": f"metadata://databases/{database}/schema/{page + 1}" if page < total_pages else None,
+                "tables": [
+                    {"name": table, "columns": schemas.get(table, {})}
+                    for table in page_tables
+                ],
+                "generated_at": _now_iso()
+            }
+            return json_utils.dumps(schema_info, indent=True)
+            
+        except Exception as e:
+            return json_utils.dumps({"error": str(e)})
+
+    async def _search_one_db(self, db_name: str, query: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Find tables in one database whose names match a query.
+        
+        Args:
+            db_name: Database to search
+            query: Table name pattern
+            limit: Maximum number of matching tables
+            
+        Returns:
+            List of match dictionaries
+        """
+        async with self._checkout(db_name) as db:
+            name_index = self._name_index.get(db_name)
+            if name_index is None:
+                name_index = build_name_index(await self._tables(db_name, db))
+                self._name_index.set(db_name, name_index)
+        
+            # Pattern matching - could be enhanced with semantic search
+            matching_tables = match_table_names(name_index, query, limit)
+            match_reason = f"Name contains '{query}'" if len(query.split()) <= 1 else f"Name matches terms in '{query}'"
+        
+            # Get basic metadata for context, fetching all matches' columns in one query
+            try:
+                schemas = await asyncio.to_thread(db.get_tables_schemas, matching_tables)
+            except Exception as e:
+                logger.error(f"Error getting schemas for tables in {db_name}: {str(e)}")
+                schemas = {}
+        
+        results = []
+        for table in matching_tables:
+            columns = schemas.get(table)
+            if not columns:
+                results.append({
+                    "database": db_name,
+                    "table": table,
+                    "match_reason": match_reason
+                })
+            else:
+                results.append({
+                    "database": db_name,
+                    "table": table,
+                    "columns": len(columns),
+                    "match_reason": match_reason,
+                    "sample_columns": list(islice(columns, 5))
+                })
+        return results
+        
     def _setup_tools(self):
         """Register FastMCP tools with automatic documentation and type safety."""
         
@@ -87,25 +428,23 @@ class MetadataFastMCPServer:
             """
             try:
                 # Generate comprehensive metadata
-                metadata = generate_complete_table_metadata(
-                    db_name=request.database,
-                    table_name=request.table,
-                    schema_name=request.schema,
-                    sample_size=100 if request.include_samples else 0,
-                    num_samples=3 if request.include_samples else 0,
-                    include_data_quality=request.include_quality,
+                metadata = await self._load_table_metadata(
+                    request.database,
+                    request.schema,
+                    request.table,
+                    include_samples=request.include_samples,
+                    include_quality=request.include_quality,
                     include_relationships=request.include_relationships
                 )
                 
-                # Format for AI consumption
+                # Format for AI consumption; the full metadata is served by the resource below
                 summary = self._format_metadata_for_ai(metadata)
                 
                 return f"""Table Metadata for {request.database}.{request.schema}.{request.table}:
 
 {summary}
 
-Full metadata available in JSON format:
-{json.dumps(metadata, indent=2, default=str)}"""
+Full metadata: metadata://databases/{request.database}/tables/{request.schema}/{request.table}"""
                 
             except Exception as e:
                 logger.error(f"Error getting table metadata: {str(e)}")
@@ -124,56 +463,48 @@ Full metadata available in JSON format:
             Returns a ranked list of matching tables with metadata.
             """
             try:
-                results = []
-                databases_to_search = [request.database] if request.database else list(self.config.get('databases', {}).keys())
+                # Queries differing only in case or spacing share one cache entry
+                query = " ".join(request.query.casefold().split())
+                cache_key = (query, request.database, request.limit)
+                cached = self._search_cache.get(cache_key)
+                if cached is not None:
+                    return cached
                 
-                for db_name in databases_to_search:
-                    try:
-                        db = get_db_handler(db_name)
-                        tables = db.get_all_tables()
-                        
-                        # Pattern matching - could be enhanced with semantic search
-                        matching_tables = [
-                            table for table in tables 
-                            if request.query.lower() in table.lower()
-                        ][:request.limit]
-                        
-                        for table in matching_tables:
-                            # Get basic metadata for context
-                            try:
-                                columns = db.get_table_schema(table)
-                                results.append({
-                                    "database": db_name,
-                                    "table": table,
-                                    "columns": len(columns),
-                                    "match_reason": f"Name contains '{request.query}'",
-                                    "sample_columns": list(columns.keys())[:5]
-                                })
-                            except Exception:
-                                results.append({
-                                    "database": db_name,
-                                    "table": table,
-                                    "match_reason": f"Name contains '{request.query}'"
-                                })
-                                
-                    except Exception as e:
-                        logger.error(f"Error searching database {db_name}: {str(e)}")
+                databases_to_search = [request.database] if request.database else self._db_names
+                
+                # Search every database concurrently
+                results_lists = await asyncio.gather(
+                    *[self._search_one_db(db_name, query, request.limit) for db_name in databases_to_search],
+                    return_exceptions=True
+                )
+                
+                results = []
+                complete = True
+                for db_name, db_results in zip(databases_to_search, results_lists):
+                    if isinstance(db_results, Exception):
+                        logger.error(f"Error searching database {db_name}: {str(db_results)}")
+                        complete = False
+                    else:
+                        results.extend(db_results)
                         
                 # Format results
                 if not results:
-                    return f"No tables found matching '{request.query}'"
+                    return f"No tables found matching '{query}'"
                 
-                search_summary = f"Found {len(results)} tables matching '{request.query}':\n\n"
+                parts = [f"Found {len(results)} tables matching '{query}':\n\n"]
                 for result in results[:request.limit]:
-                    search_summary += f"📊 {result['database']}.{result['table']}"
+                    parts.append(f"📊 {result['database']}.{result['table']}")
                     if 'columns' in result:
-                        search_summary += f" ({result['columns']} columns)"
-                    search_summary += f"\n   Match: {result['match_reason']}\n"
+                        parts.append(f" ({result['columns']} columns)")
+                    parts.append(f"\n   Match: {result['match_reason']}\n")
                     if 'sample_columns' in result:
-                        search_summary += f"   Columns: {', '.join(result['sample_columns'])}\n"
-                    search_summary += "\n"
-                    
-                return search_summary
+                        parts.append(f"   Columns: {', '.join(result['sample_columns'])}\n")
+                    parts.append("\n")
+                
+                response = "".join(parts)
+                if complete:
+                    self._search_cache.set(cache_key, response)
+                return response
                 
             except Exception as e:
                 logger.error(f"Error in table search: {str(e)}")
@@ -195,7 +526,7 @@ Full metadata available in JSON format:
             try:
                 if request.table:
                     # Analyze specific table
-                    metadata = generate_complete_table_metadata(
+                    metadata = await self._cached_metadata(
                         db_name=request.database,
                         table_name=request.table,
                         schema_name=request.schema,
@@ -205,35 +536,37 @@ Full metadata available in JSON format:
                         num_samples=5
                     )
                     
-                    quality_metrics = metadata.get('data_quality_metrics', {})
-                    column_stats = metadata.get('column_statistics', {})
+                    parts = [f"🔍 Data Quality Analysis for {request.database}.{request.schema}.{request.table}:\n\n"]
                     
-                    summary = f"🔍 Data Quality Analysis for {request.database}.{request.schema}.{request.table}:\n\n"
+                    # Completeness, distinct counts and issues are precomputed per column by the quality step
+                    column_lines = []
+                    issues = []
+                    completeness = []
+                    for col_name, col_info in metadata.get('columns', {}).items():
+                        quality = col_info.get('data_quality')
+                        if quality:
+                            completeness.append(quality.get('completeness', 0))
+                            column_lines.append(f"  • {col_name}: {quality.get('completeness', 0):.1f}% complete, {quality.get('unique_count', 'N/A')} unique values\n")
+                            issues.extend(f"{col_name}: {issue}" for issue in quality.get('common_issues', []))
                     
-                    # Overall quality score (if available)
-                    if 'overall_quality_score' in quality_metrics:
-                        score = quality_metrics['overall_quality_score']
-                        summary += f"📊 Overall Quality Score: {score}/100\n\n"
+                    # Overall quality score: mean column completeness
+                    if completeness:
+                        parts.append(f"📊 Overall Quality Score: {sum(completeness) / len(completeness):.1f}/100\n\n")
                     
                     # Column-level quality
-                    summary += "📋 Column Quality Metrics:\n"
-                    for col_name, col_info in column_stats.items():
-                        if isinstance(col_info, dict):
-                            null_rate = col_info.get('null_percentage', 0)
-                            unique_count = col_info.get('unique_count', 'N/A')
-                            summary += f"  • {col_name}: {100-null_rate:.1f}% complete, {unique_count} unique values\n"
+                    parts.append("📋 Column Quality Metrics:\n")
+                    parts.extend(column_lines)
                     
                     # Additional quality insights
-                    if 'quality_issues' in quality_metrics:
-                        issues = quality_metrics['quality_issues']
+                    if completeness:
                         if issues:
-                            summary += f"\n⚠️ Quality Issues Found:\n"
+                            parts.append(f"\n⚠️ Quality Issues Found:\n")
                             for issue in issues:
-                                summary += f"  • {issue}\n"
+                                parts.append(f"  • {issue}\n")
                         else:
-                            summary += f"\n✅ No major quality issues detected\n"
+                            parts.append(f"\n✅ No major quality issues detected\n")
                     
-                    return summary
+                    return "".join(parts)
                     
                 else:
                     # Analyze entire database/schema
@@ -257,57 +590,53 @@ Full metadata available in JSON format:
             Perfect for AI agents getting familiar with a new database.
             """
             try:
-                db = get_db_handler(request.database)
-                tables = db.get_all_tables(request.schema)
+                async with self._checkout(request.database) as db:
+                    tables = await self._tables(request.database, db, request.schema)
                 
-                overview = f"🗄️ Schema Overview for {request.database}.{request.schema}:\n\n"
-                overview += f"📊 Total Tables: {len(tables)}\n\n"
+                    parts = [f"🗄️ Schema Overview for {request.database}.{request.schema}:\n\n"]
+                    parts.append(f"📊 Total Tables: {len(tables)}\n\n")
                 
-                if not tables:
-                    return overview + "No tables found in this schema."
+                    if not tables:
+                        parts.append("No tables found in this schema.")
+                        return "".join(parts)
                 
-                overview += "📋 Tables Summary:\n"
+                    parts.append("📋 Tables Summary:\n")
                 
-                table_details = []
-                for table in tables[:50]:  # Limit to avoid overwhelming output
-                    try:
-                        columns = db.get_table_schema(table, request.schema)
-                        # Try to get row count (if supported)
-                        try:
-                            row_count_query = f"SELECT COUNT(*) as count FROM {request.schema}.{table}" if request.schema != "public" else f"SELECT COUNT(*) as count FROM {table}"
-                            result = db.fetch_all(row_count_query)
-                            row_count = result[0]['count'] if result else "Unknown"
-                        except:
-                            row_count = "Unknown"
-                            
-                        table_details.append({
-                            "name": table,
-                            "columns": len(columns),
-                            "rows": row_count
-                        })
-                        
-                    except Exception as e:
-                        table_details.append({
-                            "name": table,
-                            "error": str(e)
-                        })
+                    # Column counts and estimated row counts for all listed tables in one query
+                    overview_tables = tables[:50]  # Limit to avoid overwhelming output
+                    stats = await asyncio.to_thread(db.get_schema_bulk_stats, request.schema, overview_tables)
+                
+                    table_details = []
+                    for table in overview_tables:
+                        table_stats = stats.get(table)
+                        if table_stats is None:
+                            table_details.append({
+                                "name": table,
+                                "error": "statistics unavailable"
+                            })
+                        else:
+                            table_details.append({
+                                "name": table,
+                                "columns": table_stats['columns'],
+                                "rows": table_stats['rows'] if table_stats['rows'] is not None else "Unknown"
+                            })
                 
-                # Sort by column count (most complex first)
-                table_details.sort(key=lambda x: x.get('columns', 0), reverse=True)
+                    # Sort by column count (most complex first)
+                    table_details.sort(key=lambda x: x.get('columns', 0), reverse=True)
                 
-                for detail in table_details:
-                    if 'error' in detail:
-                        overview += f"  ❌ {detail['name']} (error: {detail['error']})\n"
-                    else:
-                        overview += f"  📊 {detail['name']} - {detail['columns']} columns"
-                        if detail['rows'] != "Unknown":
-                            overview += f", {detail['rows']:,} rows"
-                        overview += "\n"
+                    for detail in table_details:
+                        if 'error' in detail:
+                            parts.append(f"  ❌ {detail['name']} (error: {detail['error']})\n")
+                        else:
+                            parts.append(f"  📊 {detail['name']} - {detail['columns']} columns")
+                            if detail['rows'] != "Unknown":
+                                parts.append(f", {detail['rows']:,} rows")
+                            parts.append("\n")
                         
-                if len(tables) > 50:
-                    overview += f"\n... and {len(tables) - 50} more tables (showing top 50 by complexity)"
+                    if len(tables) > 50:
+                        parts.append(f"\n... and {len(tables) - 50} more tables (showing top 50 by complexity)")
                     
-                return overview
+                    return "".join(parts)
                 
             except Exception as e:
                 logger.error(f"Error getting schema overview: {str(e)}")
@@ -328,7 +657,9 @@ Full metadata available in JSON format:
             """
             try:
                 if request.model_type == "lookml":
-                    lookml_result = generate_lookml_model(
+                    lookml_result = await self._run_db(
+                        request.database,
+                        generate_lookml_model,
                         db_name=request.database,
                         schema_name=request.schema,
                         table_names=request.tables,
@@ -337,37 +668,32 @@ Full metadata available in JSON format:
                         include_explores=True
                     )
                     
-                    summary = f"🏗️ Generated LookML model '{request.model_name}' for tables: {', '.join(request.tables)}\n\n"
+                    parts = [f"🏗️ Generated LookML model '{request.model_name}' for tables: {', '.join(request.tables)}\n\n"]
                     
                     # Extract key information
-                    if 'view_files' in lookml_result:
-                        view_files = lookml_result['view_files']
-                        summary += f"📊 Generated Components:\n"
-                        summary += f"  • {len(view_files)} view files\n"
+                    views = lookml_result.get('views', [])
+                    if views:
+                        parts.append(f"📊 Generated Components:\n")
+                        parts.append(f"  • {len(views)} views\n")
                         
-                        # List view files
-                        for view_name in view_files.keys():
-                            summary += f"    - {view_name}.view.lkml\n"
-                    
-                    if 'model_file' in lookml_result:
-                        summary += f"  • 1 model file ({request.model_name}.model.lkml)\n"
+                        # List views
+                        for view in views:
+                            parts.append(f"    - {view.get('view_name', 'unnamed')}.view.lkml\n")
                         
-                    if 'explore_definitions' in lookml_result:
-                        explores = lookml_result['explore_definitions']
-                        summary += f"  • {len(explores)} explore definitions\n"
+                    explores = lookml_result.get('explores', [])
+                    if explores:
+                        parts.append(f"  • {len(explores)} explore definitions\n")
                     
                     # Include processing stats
                     stats = lookml_result.get('processing_stats', {})
                     if 'total_time_seconds' in stats:
-                        summary += f"\n⏱️ Generated in {stats['total_time_seconds']:.2f} seconds\n"
+                        parts.append(f"\n⏱️ Generated in {stats['total_time_seconds']:.2f} seconds\n")
                     
-                    # Include full LookML for implementation
-                    summary += f"\n📝 Full LookML Model:\n"
-                    summary += "```lookml\n"
-                    summary += json.dumps(lookml_result, indent=2, default=str)
-                    summary += "\n```\n"
+                    # Keep the full model server-side and point the client at it
+                    self._semantic_models.set(request.model_name, lookml_result)
+                    parts.append(f"\n📝 Full LookML model: metadata://semantic-models/{request.model_name}\n")
                     
-                    return summary
+                    return "".join(parts)
                     
                 elif request.model_type == "dbt":
                     return "🚧 dbt model generation is coming soon! Currently supported: LookML"
@@ -393,85 +719,85 @@ Full metadata available in JSON format:
             Helps AI agents understand the business semantics behind data structures.
             """
             try:
-                # Get metadata with business context
-                metadata = generate_complete_table_metadata(
-                    db_name=request.database,
-                    table_name=request.table,
-                    schema_name=request.schema,
-                    include_additional_insights=True,
-                    include_business_rules=True
-                )
-                
                 if request.column:
-                    # Explain specific column
+                    # Explain specific column; only its own metadata is generated
+                    metadata = await self._cached_metadata(
+                        generate_column_metadata,
+                        db_name=request.database,
+                        table_name=request.table,
+                        column_name=request.column,
+                        schema_name=request.schema
+                    )
                     column_info = metadata.get('columns', {}).get(request.column, {})
                     
                     if not column_info:
                         return f"❌ Column '{request.column}' not found in table {request.database}.{request.schema}.{request.table}"
                     
-                    explanation = f"💼 Business Context for Column: {request.database}.{request.schema}.{request.table}.{request.column}\n\n"
+                    parts = [f"💼 Business Context for Column: {request.database}.{request.schema}.{request.table}.{request.column}\n\n"]
                     
                     # Basic information
-                    explanation += f"📊 **Technical Details:**\n"
-                    explanation += f"  • Data Type: {column_info.get('data_type', 'Unknown')}\n"
-                    explanation += f"  • Nullable: {column_info.get('is_nullable', 'Unknown')}\n"
+                    parts.append(f"📊 **Technical Details:**\n")
+                    parts.append(f"  • Data Type: {column_info.get('data_type', 'Unknown')}\n")
+                    parts.append(f"  • Nullable: {column_info.get('is_nullable', 'Unknown')}\n")
                     
                     # Business information
-                    explanation += f"\n💼 **Business Information:**\n"
-                    explanation += f"  • Business Name: {column_info.get('business_name', 'Not specified')}\n"
-                    explanation += f"  • Description: {column_info.get('description', 'No description available')}\n"
+                    parts.append(f"\n💼 **Business Information:**\n")
+                    parts.append(f"  • Business Name: {column_info.get('business_name', 'Not specified')}\n")
+                    parts.append(f"  • Description: {column_info.get('description', 'No description available')}\n")
                     
                     # Additional insights
-                    if column_info.get('categorical_values'):
-                        explanation += f"  • Possible Values: {', '.join(column_info['categorical_values'][:10])}\n"
-                        if len(column_info['categorical_values']) > 10:
-                            explanation += f"    (and {len(column_info['categorical_values']) - 10} more...)\n"
+                    categorical_values = metadata.get('categorical_values', {}).get(request.column)
+                    if categorical_values:
+                        parts.append(f"  • Possible Values: {', '.join(map(str, categorical_values[:10]))}\n")
+                        if len(categorical_values) > 10:
+                            parts.append(f"    (and {len(categorical_values) - 10} more...)\n")
                     
                     # Statistics if available
                     stats = column_info.get('statistics', {})
                     if stats:
-                        explanation += f"\n📈 **Statistics:**\n"
+                        parts.append(f"\n📈 **Statistics:**\n")
                         for stat_name, stat_value in stats.items():
-                            explanation += f"  • {stat_name}: {stat_value}\n"
+                            parts.append(f"  • {stat_name}: {stat_value}\n")
                     
                 else:
                     # Explain entire table
+                    metadata = await self._load_table_metadata(request.database, request.schema, request.table)
                     table_desc = metadata.get('table_description', {})
                     
-                    explanation = f"💼 Business Context for Table: {request.database}.{request.schema}.{request.table}\n\n"
+                    parts = [f"💼 Business Context for Table: {request.database}.{request.schema}.{request.table}\n\n"]
                     
                     # High-level purpose
-                    explanation += f"🎯 **Purpose:** {table_desc.get('purpose', 'No purpose description available')}\n\n"
-                    explanation += f"🏢 **Business Domain:** {table_desc.get('business_domain', 'Not specified')}\n\n"
+                    parts.append(f"🎯 **Purpose:** {table_desc.get('purpose', 'No purpose description available')}\n\n")
+                    parts.append(f"🏢 **Business Domain:** {table_desc.get('business_domain', 'Not specified')}\n\n")
                     
                     # Key columns
                     columns = metadata.get('columns', {})
                     if columns:
-                        explanation += f"📋 **Key Columns ({len(columns)} total):**\n"
+                        parts.append(f"📋 **Key Columns ({len(columns)} total):**\n")
                         # Show first 10 columns with descriptions
                         for i, (col_name, col_info) in enumerate(list(columns.items())[:10]):
                             desc = col_info.get('description', 'No description')
-                            explanation += f"  • **{col_name}** ({col_info.get('data_type', 'unknown')}): {desc}\n"
+                            parts.append(f"  • **{col_name}** ({col_info.get('data_type', 'unknown')}): {desc}\n")
                         
                         if len(columns) > 10:
-                            explanation += f"  ... and {len(columns) - 10} more columns\n"
+                            parts.append(f"  ... and {len(columns) - 10} more columns\n")
                     
                     # Business rules
                     business_rules = metadata.get('business_rules', {})
                     if business_rules:
-                        explanation += f"\n📋 **Business Rules:**\n"
+                        parts.append(f"\n📋 **Business Rules:**\n")
                         for rule_type, rules in business_rules.items():
                             if rules:
-                                explanation += f"  • {rule_type}: {rules}\n"
+                                parts.append(f"  • {rule_type}: {rules}\n")
                     
                     # Usage recommendations
                     insights = metadata.get('additional_insights', {})
                     if insights:
-                        explanation += f"\n💡 **Usage Insights:**\n"
+                        parts.append(f"\n💡 **Usage Insights:**\n")
                         for insight_type, insight_value in insights.items():
-                            explanation += f"  • {insight_type}: {insight_value}\n"
+                            parts.append(f"  • {insight_type}: {insight_value}\n")
                 
-                return explanation
+                return "".join(parts)
                 
             except Exception as e:
                 logger.error(f"Error explaining business context: {str(e)}")
@@ -482,40 +808,47 @@ Full metadata available in JSON format:
         
         @self.app.resource("metadata://databases/{database}/schema")
         async def get_database_schema(database: str) -> str:
-            """Get complete database schema as a resource."""
+            """Get the first page of the database schema as a resource."""
+            return await self._schema_page(database, 1)
+
+        @self.app.resource("metadata://databases/{database}/schema/{page}")
+        async def get_database_schema_page(database: str, page: str) -> str:
+            """Get one page of the database schema as a resource."""
             try:
-                db = get_db_handler(database)
-                tables = db.get_all_tables()
-                
-                schema_info = {
-                    "database": database,
-                    "tables": [],
-                    "generated_at": datetime.now().isoformat()
-                }
-                
-                for table in tables:
-                    try:
-                        columns = db.get_table_schema(table)
-                        schema_info["tables"].append({
-                            "name": table,
-                            "columns": columns
-                        })
-                    except Exception as e:
-                        logger.error(f"Error getting schema for table {table}: {str(e)}")
-                        
-                return json.dumps(schema_info, indent=2)
-                
+                page_number = int(page)
+            except ValueError:
+                return json_utils.dumps({"error": f"Invalid page: {page}"})
+            return await self._schema_page(database, page_number)
+
+        @self.app.resource("metadata://databases/{database}/tables/{schema}/{table}")
+        async def get_table_metadata_resource(database: str, schema: str, table: str) -> str:
+            """Get full table metadata, generating it if no recent result is cached."""
+            try:
+                metadata = await self._load_table_metadata(database, schema, table)
             except Exception as e:
-                return json.dumps({"error": str(e)})
+                logger.error(f"Error reading table metadata resource: {str(e)}")
+                return json_utils.dumps({"error": str(e)})
+            return json_utils.dumps(metadata, indent=True)
+
+        @self.app.resource("metadata://semantic-models/{model_name}")
+        async def get_semantic_model(model_name: str) -> str:
+            """Get a semantic model generated by the generate_semantic_model tool."""
+            lookml_result = self._semantic_models.get(model_name)
+            if lookml_result is None:
+                return json_utils.dumps({
+                    "error": f"No generated semantic model named '{model_name}'",
+                    "recommendation": "Use generate_semantic_model tool to generate it"
+                })
+            return json_utils.dumps(lookml_result, indent=True)
 
         @self.app.resource("metadata://databases/{database}/quality-report")
         async def get_quality_report(database: str) -> str:
             """Get data quality report as a resource."""
             # Enhanced quality reporting could be implemented here
-            return json.dumps({
+            return json_utils.dumps({
                 "database": database,
                 "quality_summary": "Comprehensive quality analysis available via tools",
-                "generated_at": datetime.now().isoformat(),
+                "generated_at": _now_iso(),
                 "recommendation": "Use analyze_data_quality tool for detailed analysis"
             })
 
@@ -533,25 +866,33 @@ Full metadata available in JSON format:
         columns = metadata.get('columns', {})
         if columns:
             summary.append(f"\n📊 COLUMNS ({len(columns)} total):")
-            for col_name, col_info in list(columns.items())[:15]:  # Show top 15
-                col_summary = f"  • **{col_name}** ({col_info.get('data_type', 'unknown')})"
-                if col_info.get('description'):
-                    col_summary += f" - {col_info['description']}"
-                if col_info.get('is_primary_key'):
-                    col_summary += " [PRIMARY KEY]"
-                if col_info.get('is_foreign_key'):
-                    col_summary += " [FOREIGN KEY]"
-                summary.append(col_summary)
+            for col_name, col_info in islice(columns.items(), AI_SUMMARY_MAX_COLUMNS):
+                description = col_info.get('description')
+                tail = f" - {description}" if description else ""
+                pk = " [PRIMARY KEY]" if col_info.get('is_primary_key') else ""
+                fk = " [FOREIGN KEY]" if col_info.get('is_foreign_key') else ""
+                summary.append(f"  • **{col_name}** ({col_info.get('data_type', 'unknown')}){tail}{pk}{fk}")
             
-            if len(columns) > 15:
-                summary.append(f"  ... and {len(columns) - 15} more columns")
+            if len(columns) > AI_SUMMARY_MAX_COLUMNS:
+                summary.append(f"  ... and {len(columns) - AI_SUMMARY_MAX_COLUMNS} more columns")
                 
-        # Data quality highlights
-        quality_metrics = metadata.get('data_quality_metrics', {})
-        if quality_metrics:
+        # Data quality highlights, from the per-column quality metrics
+        column_quality = {
+            col_name: col_info['data_quality']
+            for col_name, col_info in columns.items()
+            if col_info.get('data_quality')
+        }
+        if column_quality:
             summary.append(f"\n📊 DATA QUALITY HIGHLIGHTS:")
-            for metric, value in list(quality_metrics.items())[:5]:
-                summary.append(f"  • {metric}: {value}")
+            completeness = [quality.get('completeness', 0) for quality in column_quality.values()]
+            summary.append(f"  • Average completeness: {sum(completeness) / len(completeness):.1f}%")
+            issues = (
+                f"{col_name}: {issue}"
+                for col_name, quality in column_quality.items()
+                for issue in quality.get('common_issues', [])
+            )
+            for issue in islice(issues, AI_SUMMARY_MAX_QUALITY_METRICS):
+                summary.append(f"  • {issue}")
                 
         # Key relationships
         relationships = metadata.get('relationships', {})
@@ -1,7 +1,16 @@
 """MCP Server implementation for metadata intelligence."""
 
-import json
+import asyncio
+import concurrent.futures
+import gzip
+import inspect
 import logging
+import os
+import re
+import tempfile
+import threading
+import uuid
+from collections import Counter, OrderedDict
 from typing import Any, Dict, List, Optional, Sequence
 from datetime import datetime
 
@@ -9,13 +18,47 @@ from mcp import types
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 
-from ..core.generate_table_metadata import generate_complete_table_metadata
+from ..core.generate_table_metadata import generate_complete_table_metadata, get_table_info_with_better_sampling
 from ..core.semantic_models import generate_lookml_model
-from ..utils.database_handler import get_db_handler
-from ..config.config import load_config
+from ..config.config import load_config, get_db_handler
+from ..utils import json_utils
+from ..utils.metadata_utils import compute_data_quality_metrics
+from ..utils.table_search import build_name_index, match_table_names
+from ..utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Generated table metadata is reused for this long across tool calls
+METADATA_CACHE_TTL_SECONDS = 600
+METADATA_CACHE_MAXSIZE = 256
+
+# Search results and the lowercased table names they are matched against
+SEARCH_CACHE_TTL_SECONDS = 300
+SEARCH_CACHE_MAXSIZE = 512
+
+# Default lifetime of cached table listings; override with mcp.table_cache_ttl_seconds
+TABLE_CACHE_TTL_SECONDS = 300
+
+# Worker threads for blocking database and LLM work run off the event loop
+WORKER_THREADS = 16
+
+# JSON payloads larger than this are spilled to a gzipped temp file and served as a resource
+MAX_INLINE_JSON_BYTES = 512 * 1024
+MAX_SPILLED_PAYLOADS = 64
+
+# Table schema lookups allowed in flight at once, to stay within driver connection pools
+MAX_CONCURRENT_SCHEMA_FETCHES = 16
+
+# Data quality metrics of the most requested tables are recomputed in the background
+HOT_METRICS_REFRESH_SECONDS = 300
+HOT_METRICS_TOP_K = 10
+
+# Database-level resources: metadata://databases/{db_name}/{resource_type}
+DATABASE_RESOURCE_URI = re.compile(r"metadata://databases/([^/]+)/([^/]+)")
+
+# Full table metadata JSON, fetched on demand: metadata://tables/{db_name}/{schema}/{table}
+TABLE_RESOURCE_URI = re.compile(r"metadata://tables/([^/]+)/([^/]+)/([^/]+)")
+
 
 class MetadataMCPServer:
     """MCP Server for metadata intelligence and data context."""
@@ -23,119 +66,337 @@ class MetadataMCPServer:
     def __init__(self):
         self.server = Server("metadata-builder")
         self.config = load_config()
+        self._schema_sem = asyncio.Semaphore(MAX_CONCURRENT_SCHEMA_FETCHES)
+        self._meta_cache = TTLCache(maxsize=METADATA_CACHE_MAXSIZE, ttl_seconds=METADATA_CACHE_TTL_SECONDS)
+        self._meta_locks: Dict[tuple, asyncio.Lock] = {}
+        self._spilled: "OrderedDict[str, str]" = OrderedDict()
+        self._spilled_lock = threading.Lock()
+        # (database, schema, table) -> data quality metrics, refreshed for the top requested tables
+        self._quality_requests: Counter = Counter()
+        self._hot_metrics: Dict[tuple, Dict[str, Any]] = {}
+        self._search_cache = TTLCache(maxsize=SEARCH_CACHE_MAXSIZE, ttl_seconds=SEARCH_CACHE_TTL_SECONDS)
+        table_cache_ttl = self.config.get('mcp', {}).get('table_cache_ttl_seconds', TABLE_CACHE_TTL_SECONDS)
+        self._tables_cache = TTLCache(maxsize=64, ttl_seconds=table_cache_ttl)
+        self._tables_by_db = TTLCache(maxsize=64, ttl_seconds=table_cache_ttl)
+        # Handlers hold a single connection, so each worker thread keeps its own per database
+        self._thread_handlers = threading.local()
+        self._db_handlers: List[Any] = []
+        self._db_handlers_lock = threading.Lock()
         self._setup_tools()
         self._setup_resources()
         
+    def refresh_resources(self) -> None:
+        """Rebuild the resource list from the configured databases."""
+        resources = []
+        
+        # Add database schemas as resources
+        try:
+            databases = self.config.get('databases', {})
+            for db_name in databases.keys():
+                resources.append(types.Resource(
+                    uri=f"metadata://databases/{db_name}/schema",
+                    name=f"{db_name} Schema",
+                    description=f"Complete schema information for {db_name} database",
+                    mimeType="application/json"
+                ))
+                
+                resources.append(types.Resource(
+                    uri=f"metadata://databases/{db_name}/quality-report",
+                    name=f"{db_name} Quality Report",
+                    description=f"Data quality assessment for {db_name} database",
+                    mimeType="application/json"
+                ))
+                
+        except Exception as e:
+            logger.error(f"Error listing resources: {str(e)}")
+            
+        self._resource_list = resources
+        
+    def _get_handler(self, db_name: str):
+        """
+        Get this thread's database handler, creating it on first use.
+        
+        Args:
+            db_name: Database name
+            
+        Returns:
+            Database handler
+        """
+        handlers = getattr(self._thread_handlers, 'handlers', None)
+        if handlers is None:
+            handlers = self._thread_handlers.handlers = {}
+        handler = handlers.get(db_name)
+        if handler is None:
+            handler = handlers[db_name] = get_db_handler(db_name)
+            with self._db_handlers_lock:
+                self._db_handlers.append(handler)
+        return handler
+        
+    def _call_handler(self, db_name: str, method: str, *args) -> Any:
+        """Call a handler method, returning its connection to the pool afterwards."""
+        handler = self._get_handler(db_name)
+        try:
+            return getattr(handler, method)(*args)
+        finally:
+            handler.release()
+        
+    async def _run_db(self, db_name: str, method: str, *args) -> Any:
+        """
+        Call a database handler method in a worker thread.
+        
+        Args:
+            db_name: Database name
+            method: Handler method name
+            *args: Arguments for the method
+            
+        Returns:
+            The method's result
+        """
+        return await asyncio.to_thread(self._call_handler, db_name, method, *args)
+        
+    async def _cached_metadata(self, **kwargs) -> Dict[str, Any]:
+        """
+        Generate table metadata, reusing results from recent identical requests.
+        
+        Concurrent requests for the same table and options wait on a shared
+        lock so the metadata is only generated once. Generation runs in a
+        worker thread and persists its LLM phases on disk, so a call cut
+        short by a client disconnect resumes where it stopped when retried;
+        phase results older than an hour are regenerated.
+        Failed generations are not cached.
+        
+        Args:
+            **kwargs: Arguments for generate_complete_table_metadata
+            
+        Returns:
+            Table metadata dictionary
+        """
+        # Key on the full argument set so calls that spell out defaults share an entry
+        arguments = inspect.signature(generate_complete_table_metadata).bind(**kwargs)
+        arguments.apply_defaults()
+        key = tuple(sorted(arguments.arguments.items()))
+        metadata = self._meta_cache.get(key)
+        if metadata is not None:
+            return metadata
+        
+        lock = self._meta_locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                metadata = self._meta_cache.get(key)
+                if metadata is None:
+                    metadata = await asyncio.to_thread(generate_complete_table_metadata, resume=True, **kwargs)
+                    if "error" not in metadata:
+                        self._meta_cache.set(key, metadata)
+        finally:
+            if self._meta_locks.get(key) is lock:
+                del self._meta_locks[key]
+        return metadata
+        
+    async def _cached_tables(self, db_name: str, schema: Optional[str] = None) -> List[str]:
+        """
+        List a database's tables, reusing a recent listing when available.
+        
+        Args:
+            db_name: Database name
+            schema: Optional schema to list
+            
+        Returns:
+            Table names
+        """
+        key = (db_name, schema)
+        tables = self._tables_cache.get(key)
+        if tables is None:
+            if schema is None:
+                tables = await self._run_db(db_name, 'get_all_tables')
+            else:
+                tables = await self._run_db(db_name, 'get_all_tables', schema)
+            self._tables_cache.set(key, tables)
+        return tables
+        
+    def invalidate_table_cache(self) -> None:
+        """Drop cached table listings and the search results built from them."""
+        self._tables_cache.clear()
+        self._tables_by_db.clear()
+        self._search_cache.clear()
+        
+    def _spill_payload(self, payload_json: str) -> str:
+        """
+        Write a JSON payload to a gzipped temp file.
+        
+        Only the most recent MAX_SPILLED_PAYLOADS files are kept.
+        
+        Args:
+            payload_json: Serialized payload
+            
+        Returns:
+            Identifier for reading the payload back
+        """
+        payload_id = uuid.uuid4().hex
+        path = os.path.join(tempfile.gettempdir(), f"meta-{payload_id}.json.gz")
+        with gzip.open(path, "wt", encoding="utf-8", compresslevel=1) as f:
+            f.write(payload_json)
+        
+        with self._spilled_lock:
+            self._spilled[payload_id] = path
+            evicted = []
+            while len(self._spilled) > MAX_SPILLED_PAYLOADS:
+                evicted.append(self._spilled.popitem(last=False)[1])
+        for old_path in evicted:
+            self._remove_spilled(old_path)
+        return payload_id
+        
+    def _read_spilled(self, payload_id: str) -> str:
+        """Read back a payload written by _spill_payload."""
+        with self._spilled_lock:
+            path = self._spilled.get(payload_id)
+        if path is None:
+            raise ValueError(f"Unknown or expired payload: {payload_id}")
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return f.read()
+        
+    @staticmethod
+    def _remove_spilled(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError as e:
+            logger.warning(f"Could not remove spilled payload {path}: {str(e)}")
+        
+    def close(self) -> None:
+        """Close all cached database handlers and remove spilled payload files."""
+        with self._db_handlers_lock:
+            handlers, self._db_handlers = self._db_handlers, []
+        for handler in handlers:
+            try:
+                handler.close()
+            except Exception as e:
+                logger.warning(f"Error closing database handler: {str(e)}")
+        
+        with self._spilled_lock:
+            paths, self._spilled = list(self._spilled.values()), OrderedDict()
+        for path in paths:
+            self._remove_spilled(path)
+        
     def _setup_tools(self):
         """Register MCP tools for metadata operations."""
         
+        # Tool name -> implementation, so dispatch is a single lookup
+        self._dispatch = {
+            "get_table_metadata": self._get_table_metadata,
+            "search_tables": self._search_tables,
+            "analyze_data_quality": self._analyze_data_quality,
+            "get_schema_overview": self._get_schema_overview,
+            "generate_semantic_model": self._generate_semantic_model,
+            "explain_business_context": self._explain_business_context,
+        }
+        
+        # Tool definitions are static, so build them once and share the list
+        self._tool_list = [
+            types.Tool(
+                name="get_table_metadata",
+                description="Get comprehensive metadata for a database table including schema, statistics, business context, and data quality metrics",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "database": {"type": "string", "description": "Database name"},
+                        "table": {"type": "string", "description": "Table name"},
+                        "schema": {"type": "string", "description": "Schema name (optional)", "default": "public"},
+                        "include_samples": {"type": "boolean", "description": "Include sample data", "default": True},
+                        "include_quality": {"type": "boolean", "description": "Include data quality analysis", "default": True},
+                        "include_relationships": {"type": "boolean", "description": "Include relationship analysis", "default": True},
+                        "format": {
+                            "type": "string",
+                            "enum": ["summary", "json", "both"],
+                            "description": "Return the readable summary, the full JSON, or both; the JSON is also available from the metadata://tables/{database}/{schema}/{table} resource",
+                            "default": "summary"
+                        },
+                        "compress": {"type": "boolean", "description": "Return the full JSON gzip-compressed and base64-encoded", "default": False}
+                    },
+                    "required": ["database", "table"]
+                }
+            ),
+            types.Tool(
+                name="search_tables",
+                description="Search for tables across databases based on name patterns or business context",
+                inputSchema={
+                    "type": "object", 
+                    "properties": {
+                        "query": {"type": "string", "description": "Search query (table name pattern or business term)"},
+                        "database": {"type": "string", "description": "Specific database to search (optional)"},
+                        "limit": {"type": "integer", "description": "Maximum results to return", "default": 20}
+                    },
+                    "required": ["query"]
+                }
+            ),
+            types.Tool(
+                name="analyze_data_quality",
+                description="Analyze data quality metrics for tables or entire schemas",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "database": {"type": "string", "description": "Database name"},
+                        "table": {"type": "string", "description": "Table name (optional - if not provided, analyzes entire database)"},
+                        "schema": {"type": "string", "description": "Schema name (optional)", "default": "public"}
+                    },
+                    "required": ["database"]
+                }
+            ),
+            types.Tool(
+                name="get_schema_overview",
+                description="Get an overview of all tables in a database schema with basic metadata",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "database": {"type": "string", "description": "Database name"},
+                        "schema": {"type": "string", "description": "Schema name (optional)", "default": "public"}
+                    },
+                    "required": ["database"]
+                }
+            ),
+            types.Tool(
+                name="generate_semantic_model",
+                description="Generate semantic models (LookML, dbt) for business intelligence and analytics",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "database": {"type": "string", "description": "Database name"},
+                        "tables": {"type": "array", "items": {"type": "string"}, "description": "List of table names"},
+                        "schema": {"type": "string", "description": "Schema name (optional)", "default": "public"},
+                        "model_type": {"type": "string", "enum": ["lookml", "dbt"], "default": "lookml"},
+                        "model_name": {"type": "string", "description": "Name for the generated model"},
+                        "compress": {"type": "boolean", "description": "Return the full JSON gzip-compressed and base64-encoded", "default": False}
+                    },
+                    "required": ["database", "tables", "model_name"]
+                }
+            ),
+            types.Tool(
+                name="explain_business_context",
+                description="Get business context and meaning for tables and columns using AI analysis",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "database": {"type": "string", "description": "Database name"},
+                        "table": {"type": "string", "description": "Table name"},
+                        "column": {"type": "string", "description": "Column name (optional - if not provided, explains entire table)"},
+                        "schema": {"type": "string", "description": "Schema name (optional)", "default": "public"}
+                    },
+                    "required": ["database", "table"]
+                }
+            )
+        ]
+        
         @self.server.list_tools()
         async def list_tools() -> List[types.Tool]:
             """List available metadata tools."""
-            return [
-                types.Tool(
-                    name="get_table_metadata",
-                    description="Get comprehensive metadata for a database table including schema, statistics, business context, and data quality metrics",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "database": {"type": "string", "description": "Database name"},
-                            "table": {"type": "string", "description": "Table name"},
-                            "schema": {"type": "string", "description": "Schema name (optional)", "default": "public"},
-                            "include_samples": {"type": "boolean", "description": "Include sample data", "default": True},
-                            "include_quality": {"type": "boolean", "description": "Include data quality analysis", "default": True},
-                            "include_relationships": {"type": "boolean", "description": "Include relationship analysis", "default": True}
-                        },
-                        "required": ["database", "table"]
-                    }
-                ),
-                types.Tool(
-                    name="search_tables",
-                    description="Search for tables across databases based on name patterns or business context",
-                    inputSchema={
-                        "type": "object", 
-                        "properties": {
-                            "query": {"type": "string", "description": "Search query (table name pattern or business term)"},
-                            "database": {"type": "string", "description": "Specific database to search (optional)"},
-                            "limit": {"type": "integer", "description": "Maximum results to return", "default": 20}
-                        },
-                        "required": ["query"]
-                    }
-                ),
-                types.Tool(
-                    name="analyze_data_quality",
-                    description="Analyze data quality metrics for tables or entire schemas",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "database": {"type": "string", "description": "Database name"},
-                            "table": {"type": "string", "description": "Table name (optional - if not provided, analyzes entire database)"},
-                            "schema": {"type": "string", "description": "Schema name (optional)", "default": "public"}
-                        },
-                        "required": ["database"]
-                    }
-                ),
-                types.Tool(
-                    name="get_schema_overview",
-                    description="Get an overview of all tables in a database schema with basic metadata",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "database": {"type": "string", "description": "Database name"},
-                            "schema": {"type": "string", "description": "Schema name (optional)", "default": "public"}
-                        },
-                        "required": ["database"]
-                    }
-                ),
-                types.Tool(
-                    name="generate_semantic_model",
-                    description="Generate semantic models (LookML, dbt) for business intelligence and analytics",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "database": {"type": "string", "description": "Database name"},
-                            "tables": {"type": "array", "items": {"type": "string"}, "description": "List of table names"},
-                            "schema": {"type": "string", "description": "Schema name (optional)", "default": "public"},
-                            "model_type": {"type": "string", "enum": ["lookml", "dbt"], "default": "lookml"},
-                            "model_name": {"type": "string", "description": "Name for the generated model"}
-                        },
-                        "required": ["database", "tables", "model_name"]
-                    }
-                ),
-                types.Tool(
-                    name="explain_business_context",
-                    description="Get business context and meaning for tables and columns using AI analysis",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "database": {"type": "string", "description": "Database name"},
-                            "table": {"type": "string", "description": "Table name"},
-                            "column": {"type": "string", "description": "Column name (optional - if not provided, explains entire table)"},
-                            "schema": {"type": "string", "description": "Schema name (optional)", "default": "public"}
-                        },
-                        "required": ["database", "table"]
-                    }
-                )
-            ]
+            return self._tool_list
 
         @self.server.call_tool()
         async def call_tool(name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
             """Handle tool calls."""
             try:
-                if name == "get_table_metadata":
-                    return await self._get_table_metadata(arguments)
-                elif name == "search_tables":
-                    return await self._search_tables(arguments)
-                elif name == "analyze_data_quality":
-                    return await self._analyze_data_quality(arguments)
-                elif name == "get_schema_overview":
-                    return await self._get_schema_overview(arguments)
-                elif name == "generate_semantic_model":
-                    return await self._generate_semantic_model(arguments)
-                elif name == "explain_business_context":
-                    return await self._explain_business_context(arguments)
-                else:
+                handler = self._dispatch.get(name)
+                if handler is None:
                     raise ValueError(f"Unknown tool: {name}")
+                return await handler(arguments)
                     
             except Exception as e:
                 logger.error(f"Error in tool {name}: {str(e)}")
@@ -147,44 +408,33 @@ class MetadataMCPServer:
     def _setup_resources(self):
         """Register MCP resources for metadata access."""
         
+        self.refresh_resources()
+        
         @self.server.list_resources()
         async def list_resources() -> List[types.Resource]:
             """List available metadata resources."""
-            resources = []
-            
-            # Add database schemas as resources
-            try:
-                databases = self.config.get('databases', {})
-                for db_name in databases.keys():
-                    resources.append(types.Resource(
-                        uri=f"metadata://databases/{db_name}/schema",
-                        name=f"{db_name} Schema",
-                        description=f"Complete schema information for {db_name} database",
-                        mimeType="application/json"
-                    ))
-                    
-                    resources.append(types.Resource(
-                        uri=f"metadata://databases/{db_name}/quality-report",
-                        name=f"{db_name} Quality Report",
-                        description=f"Data quality assessment for {db_name} database",
-                        mimeType="application/json"
-                    ))
-                    
-            except Exception as e:
-                logger.error(f"Error listing resources: {str(e)}")
-                
-            return resources
+            return self._resource_list
 
         @self.server.read_resource()
         async def read_resource(uri: str) -> str:
             """Read metadata resource content."""
             try:
+                # Large tool payloads: metadata://tmp/{payload_id}
+                if uri.startswith("metadata://tmp/"):
+                    return await asyncio.to_thread(self._read_spilled, uri[len("metadata://tmp/"):])
+                
+                table_match = TABLE_RESOURCE_URI.fullmatch(uri)
+                if table_match is not None:
+                    db_name, schema, table = table_match.groups()
+                    metadata = await self._load_table_metadata({"database": db_name, "schema": schema, "table": table})
+                    return json_utils.dumps(metadata)
+                
                 # Parse URI: metadata://databases/{db_name}/{resource_type}
-                parts = uri.replace("metadata://databases/", "").split("/")
-                if len(parts) != 2:
+                match = DATABASE_RESOURCE_URI.fullmatch(uri)
+                if match is None:
                     raise ValueError(f"Invalid resource URI: {uri}")
                     
-                db_name, resource_type = parts
+                db_name, resource_type = match.groups()
                 
                 if resource_type == "schema":
                     return await self._get_database_schema(db_name)
@@ -195,41 +445,53 @@ class MetadataMCPServer:
                     
             except Exception as e:
                 logger.error(f"Error reading resource {uri}: {str(e)}")
-                return json.dumps({"error": str(e)})
+                return json_utils.dumps({"error": str(e)})
 
+    async def _load_table_metadata(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Generate (or reuse) table metadata for get_table_metadata-style arguments.
+        
+        Args:
+            args: Tool arguments with database, table and optional schema and include flags
+            
+        Returns:
+            Table metadata dictionary
+        """
+        include_samples = args.get("include_samples", True)
+        return await self._cached_metadata(
+            db_name=args["database"],
+            table_name=args["table"],
+            schema_name=args.get("schema", "public"),
+            sample_size=100,
+            num_samples=3,
+            include_samples=include_samples,
+            include_data_quality=args.get("include_quality", True),
+            include_relationships=args.get("include_relationships", True)
+        )
+        
     async def _get_table_metadata(self, args: Dict[str, Any]) -> List[types.TextContent]:
         """Get comprehensive table metadata."""
         database = args["database"]
         table = args["table"]
         schema = args.get("schema", "public")
-        include_samples = args.get("include_samples", True)
-        include_quality = args.get("include_quality", True)
-        include_relationships = args.get("include_relationships", True)
+        output_format = args.get("format", "summary")
+        if output_format not in ("summary", "json", "both"):
+            raise ValueError(f"Unknown format: {output_format}")
         
         # Generate comprehensive metadata
-        metadata = generate_complete_table_metadata(
-            db_name=database,
-            table_name=table,
-            schema_name=schema,
-            sample_size=100 if include_samples else 0,
-            num_samples=3 if include_samples else 0,
-            include_data_quality=include_quality,
-            include_relationships=include_relationships
-        )
-        
-        # Format for AI consumption
-        summary = self._format_metadata_for_ai(metadata)
+        metadata = await self._load_table_metadata(args)
         
-        return [
-            types.TextContent(
-                type="text",
-                text=f"Table Metadata for {database}.{schema}.{table}:\n\n{summary}"
-            ),
-            types.TextContent(
-                type="text", 
-                text=f"Full metadata (JSON):\n{json.dumps(metadata, indent=2)}"
-            )
-        ]
+        content = []
+        if output_format != "json":
+            # Format for AI consumption; the JSON stays available on demand as a resource
+            summary = self._format_metadata_for_ai(metadata)
+            text = f"Table Metadata for {database}.{schema}.{table}:\n\n{summary}"
+            if output_format == "summary":
+                text = f"{text}\n\nFull JSON: metadata://tables/{database}/{schema}/{table}"
+            content.append(types.TextContent(type="text", text=text))
+        if output_format != "summary":
+            content.append(await self._json_content("Full metadata", metadata, args.get("compress", False)))
+        return content
 
     async def _search_tables(self, args: Dict[str, Any]) -> List[types.TextContent]:
         """Search for tables across databases."""
@@ -237,36 +499,93 @@ class MetadataMCPServer:
         database = args.get("database")
         limit = args.get("limit", 20)
         
-        results = []
         databases_to_search = [database] if database else list(self.config.get('databases', {}).keys())
         
-        for db_name in databases_to_search:
-            try:
-                db = get_db_handler(db_name)
-                tables = db.get_all_tables()
-                
-                # Simple pattern matching for now
-                matching_tables = [
-                    table for table in tables 
-                    if query.lower() in table.lower()
-                ][:limit]
-                
-                for table in matching_tables:
-                    results.append({
-                        "database": db_name,
-                        "table": table,
-                        "match_reason": f"Name contains '{query}'"
-                    })
-                    
-            except Exception as e:
-                logger.error(f"Error searching database {db_name}: {str(e)}")
+        # Queries differing only in case or surrounding whitespace share results
+        query = query.strip()
+        cache_key = (tuple(sorted(databases_to_search)), query.casefold(), limit)
+        search_summary = self._search_cache.get(cache_key)
+        if search_summary is not None:
+            return [types.TextContent(type="text", text=search_summary)]
+        
+        # Probe every database concurrently
+        results_lists = await asyncio.gather(
+            *[self._search_one_db(db_name, query, limit) for db_name in databases_to_search],
+            return_exceptions=True
+        )
+        
+        results = []
+        complete = True
+        for db_name, db_results in zip(databases_to_search, results_lists):
+            if isinstance(db_results, Exception):
+                logger.error(f"Error searching database {db_name}: {str(db_results)}")
+                complete = False
+            else:
+                results.extend(db_results)
                 
-        search_summary = f"Found {len(results)} tables matching '{query}':\n\n"
-        for result in results[:limit]:
-            search_summary += f"• {result['database']}.{result['table']} - {result['match_reason']}\n"
-            
+        parts = [f"Found {len(results)} tables matching '{query}':\n\n"]
+        parts.extend(
+            f"• {result['database']}.{result['table']} - {result['match_reason']}\n"
+            for result in results[:limit]
+        )
+        search_summary = "".join(parts)
+        
+        if complete:
+            self._search_cache.set(cache_key, search_summary)
         return [types.TextContent(type="text", text=search_summary)]
 
+    async def _search_one_db(self, db_name: str, query: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Find tables in one database whose names match a query.
+        
+        Args:
+            db_name: Database to search
+            query: Table name pattern
+            limit: Maximum number of matching tables
+            
+        Returns:
+            List of match dictionaries
+        """
+        name_index = self._tables_by_db.get(db_name)
+        if name_index is None:
+            name_index = build_name_index(await self._cached_tables(db_name))
+            self._tables_by_db.set(db_name, name_index)
+        
+        # Multi-term queries match all terms in one Aho-Corasick pass per name when available
+        matching_tables = match_table_names(name_index, query, limit)
+        match_reason = f"Name contains '{query}'" if len(query.split()) <= 1 else f"Name matches terms in '{query}'"
+        
+        return [
+            {
+                "database": db_name,
+                "table": table,
+                "match_reason": match_reason
+            }
+            for table in matching_tables
+        ]
+
+    async def _fetch_table_schemas(self, db_name: str, tables: List[str], schema: Optional[str] = None) -> List[Any]:
+        """
+        Fetch several table schemas concurrently in worker threads.
+        
+        At most MAX_CONCURRENT_SCHEMA_FETCHES lookups run at once.
+        
+        Args:
+            db_name: Database name
+            tables: Table names
+            schema: Optional schema name
+            
+        Returns:
+            Column mapping, or the raised exception, for each table in order
+        """
+        async def fetch(table: str) -> Dict[str, str]:
+            async with self._schema_sem:
+                if schema is None:
+                    return await self._run_db(db_name, 'get_table_schema', table)
+                return await self._run_db(db_name, 'get_table_schema', table, schema)
+        
+        return await asyncio.gather(*[fetch(table) for table in tables], return_exceptions=True)
+
     async def _analyze_data_quality(self, args: Dict[str, Any]) -> List[types.TextContent]:
         """Analyze data quality for tables."""
         database = args["database"]
@@ -274,19 +593,21 @@ class MetadataMCPServer:
         schema = args.get("schema", "public")
         
         if table:
-            # Analyze specific table
-            metadata = generate_complete_table_metadata(
-                db_name=database,
-                table_name=table,
-                schema_name=schema,
-                include_data_quality=True
-            )
-            
-            quality_metrics = metadata.get('data_quality_metrics', {})
-            summary = f"Data Quality Analysis for {database}.{schema}.{table}:\n\n"
+            # Analyze specific table, answering from the background-refreshed metrics when it is hot
+            key = (database, schema, table)
+            self._quality_requests[key] += 1
+            quality_metrics = self._hot_metrics.get(key)
+            if quality_metrics is None:
+                metadata = await self._load_table_metadata({"database": database, "table": table, "schema": schema})
+                quality_metrics = {
+                    column_name: column['data_quality']
+                    for column_name, column in metadata.get('columns', {}).items()
+                    if column.get('data_quality')
+                }
             
-            for metric_name, metric_data in quality_metrics.items():
-                summary += f"• {metric_name}: {metric_data}\n"
+            parts = [f"Data Quality Analysis for {database}.{schema}.{table}:\n\n"]
+            parts.extend(f"• {metric_name}: {metric_data}\n" for metric_name, metric_data in quality_metrics.items())
+            summary = "".join(parts)
                 
         else:
             # Analyze entire database/schema
@@ -294,27 +615,79 @@ class MetadataMCPServer:
             
         return [types.TextContent(type="text", text=summary)]
 
+    @staticmethod
+    def _compute_quality_metrics(database: str, schema: str, table: str) -> Dict[str, Any]:
+        """
+        Sample a table and compute its per-column data quality metrics, without any LLM calls.
+        
+        Args:
+            database: Database name
+            schema: Schema name
+            table: Table name
+            
+        Returns:
+            Dictionary mapping column names to their quality metrics
+        """
+        table_schema, sample_data = get_table_info_with_better_sampling(
+            table_name=table,
+            db_name=database,
+            schema_name=schema
+        )
+        return compute_data_quality_metrics(sample_data, table_schema)
+        
+    async def _refresh_hot_metrics(self) -> None:
+        """Periodically recompute quality metrics for the tables requested most since the last pass."""
+        while True:
+            await asyncio.sleep(HOT_METRICS_REFRESH_SECONDS)
+            hot_tables = [key for key, _ in self._quality_requests.most_common(HOT_METRICS_TOP_K)]
+            self._quality_requests.clear()
+            
+            refreshed = {}
+            for key in hot_tables:
+                try:
+                    refreshed[key] = await asyncio.to_thread(self._compute_quality_metrics, *key)
+                except Exception as e:
+                    logger.warning(f"Could not refresh quality metrics for {'.'.join(key)}: {str(e)}")
+            self._hot_metrics = refreshed
+            
     async def _get_schema_overview(self, args: Dict[str, Any]) -> List[types.TextContent]:
         """Get schema overview."""
         database = args["database"]
         schema = args.get("schema", "public")
         
         try:
-            db = get_db_handler(database)
-            tables = db.get_all_tables(schema)
+            tables = await self._cached_tables(database, schema)
             
-            overview = f"Schema Overview for {database}.{schema}:\n\n"
-            overview += f"Total Tables: {len(tables)}\n\n"
+            parts = [f"Schema Overview for {database}.{schema}:\n\n", f"Total Tables: {len(tables)}\n\n"]
             
-            for table in tables[:20]:  # Limit to first 20 tables
-                try:
-                    columns = db.get_table_schema(table, schema)
-                    overview += f"• {table} ({len(columns)} columns)\n"
-                except Exception as e:
-                    overview += f"• {table} (error: {str(e)})\n"
+            shown_tables = tables[:20]  # Limit to first 20 tables
+            try:
+                # Column counts and catalog row estimates for all shown tables in one query
+                stats = await self._run_db(database, 'get_schema_bulk_stats', schema, shown_tables)
+            except Exception as e:
+                logger.warning(f"Bulk statistics failed for {database}.{schema}: {str(e)}")
+                stats = {}
+            
+            if stats:
+                for table in shown_tables:
+                    table_stats = stats.get(table)
+                    if table_stats is None:
+                        parts.append(f"• {table} (statistics unavailable)\n")
+                    elif table_stats['rows'] is None:
+                        parts.append(f"• {table} ({table_stats['columns']} columns)\n")
+                    else:
+                        parts.append(f"• {table} ({table_stats['columns']} columns, ~{table_stats['rows']:,} rows)\n")
+            else:
+                schemas = await self._fetch_table_schemas(database, shown_tables, schema)
+                for table, columns in zip(shown_tables, schemas):
+                    if isinstance(columns, Exception):
+                        parts.append(f"• {table} (error: {str(columns)})\n")
+                    else:
+                        parts.append(f"• {table} ({len(columns)} columns)\n")
                     
             if len(tables) > 20:
-                overview += f"\n... and {len(tables) - 20} more tables"
+                parts.append(f"\n... and {len(tables) - 20} more tables")
+            overview = "".join(parts)
                 
         except Exception as e:
             overview = f"Error getting schema overview: {str(e)}"
@@ -330,24 +703,27 @@ class MetadataMCPServer:
         model_name = args["model_name"]
         
         if model_type == "lookml":
-            lookml_result = generate_lookml_model(
+            lookml_result = await asyncio.to_thread(
+                generate_lookml_model,
                 db_name=database,
                 schema_name=schema,
                 table_names=tables,
                 model_name=model_name
             )
             
-            summary = f"Generated LookML model '{model_name}' for tables: {', '.join(tables)}\n\n"
-            summary += f"Model includes:\n"
+            parts = [
+                f"Generated LookML model '{model_name}' for tables: {', '.join(tables)}\n\n",
+                "Model includes:\n"
+            ]
             
             if 'view_files' in lookml_result:
-                summary += f"• {len(lookml_result['view_files'])} view files\n"
+                parts.append(f"• {len(lookml_result['view_files'])} view files\n")
             if 'model_file' in lookml_result:
-                summary += f"• 1 model file\n"
+                parts.append("• 1 model file\n")
                 
             return [
-                types.TextContent(type="text", text=summary),
-                types.TextContent(type="text", text=f"Full LookML:\n{json.dumps(lookml_result, indent=2)}")
+                types.TextContent(type="text", text="".join(parts)),
+                await self._json_content("Full LookML", lookml_result, args.get("compress", False))
             ]
         else:
             return [types.TextContent(type="text", text="dbt model generation coming soon!")]
@@ -360,29 +736,59 @@ class MetadataMCPServer:
         schema = args.get("schema", "public")
         
         # Get metadata with business context
-        metadata = generate_complete_table_metadata(
-            db_name=database,
-            table_name=table,
-            schema_name=schema,
-            include_additional_insights=True
-        )
+        metadata = await self._load_table_metadata({"database": database, "table": table, "schema": schema})
         
         if column:
             # Explain specific column
             column_info = metadata.get('columns', {}).get(column, {})
-            explanation = f"Business Context for {database}.{schema}.{table}.{column}:\n\n"
-            explanation += f"Description: {column_info.get('description', 'No description available')}\n"
-            explanation += f"Data Type: {column_info.get('data_type', 'Unknown')}\n"
-            explanation += f"Business Name: {column_info.get('business_name', 'Not specified')}\n"
+            explanation = "".join([
+                f"Business Context for {database}.{schema}.{table}.{column}:\n\n",
+                f"Description: {column_info.get('description', 'No description available')}\n",
+                f"Data Type: {column_info.get('data_type', 'Unknown')}\n",
+                f"Business Name: {column_info.get('business_name', 'Not specified')}\n"
+            ])
         else:
             # Explain entire table
             table_desc = metadata.get('table_description', {})
-            explanation = f"Business Context for {database}.{schema}.{table}:\n\n"
-            explanation += f"Purpose: {table_desc.get('purpose', 'No purpose description available')}\n"
-            explanation += f"Business Domain: {table_desc.get('business_domain', 'Not specified')}\n"
+            explanation = "".join([
+                f"Business Context for {database}.{schema}.{table}:\n\n",
+                f"Purpose: {table_desc.get('purpose', 'No purpose description available')}\n",
+                f"Business Domain: {table_desc.get('business_domain', 'Not specified')}\n"
+            ])
             
         return [types.TextContent(type="text", text=explanation)]
 
+    async def _json_content(self, label: str, payload: Dict[str, Any], compress: bool) -> types.TextContent:
+        """
+        Build a text content block carrying a JSON payload.
+        
+        Payloads over MAX_INLINE_JSON_BYTES are not inlined; they are written
+        to a gzipped temp file and the block points at a metadata://tmp/
+        resource that serves them. The payload is serialized once, as
+        compact JSON, and that text is reused for every path.
+        
+        Args:
+            label: Heading for the payload
+            payload: Object to serialize
+            compress: Whether to gzip and base64-encode the JSON
+            
+        Returns:
+            Text content with the serialized payload or its resource URI
+        """
+        payload_json = json_utils.dumps(payload)
+        if len(payload_json) > MAX_INLINE_JSON_BYTES:
+            payload_id = await asyncio.to_thread(self._spill_payload, payload_json)
+            return types.TextContent(
+                type="text",
+                text=f"{label} (JSON) is too large to inline; read it from resource metadata://tmp/{payload_id}"
+            )
+        if compress:
+            return types.TextContent(
+                type="text",
+                text=f"{label} (JSON, gzip+base64):\n{json_utils.gzip_base64(payload_json.encode('utf-8'))}"
+            )
+        return types.TextContent(type="text", text=f"{label} (JSON):\n{payload_json}")
+
     def _format_metadata_for_ai(self, metadata: Dict[str, Any]) -> str:
         """Format metadata in a way that's easy for AI to understand and use."""
         summary = []
@@ -398,10 +804,9 @@ class MetadataMCPServer:
         if columns:
             summary.append(f"\nCOLUMNS ({len(columns)} total):")
             for col_name, col_info in columns.items():
-                col_summary = f"  • {col_name} ({col_info.get('data_type', 'unknown')})"
-                if col_info.get('description'):
-                    col_summary += f" - {col_info['description']}"
-                summary.append(col_summary)
+                description = col_info.get('description')
+                tail = f" - {description}" if description else ""
+                summary.append(f"  • {col_name} ({col_info.get('data_type', 'unknown')}){tail}")
                 
         # Data quality
         quality_metrics = metadata.get('data_quality_metrics', {})
@@ -415,8 +820,7 @@ class MetadataMCPServer:
     async def _get_database_schema(self, db_name: str) -> str:
         """Get complete database schema information."""
         try:
-            db = get_db_handler(db_name)
-            tables = db.get_all_tables()
+            tables = await self._cached_tables(db_name)
             
             schema_info = {
                 "database": db_name,
@@ -424,26 +828,26 @@ class MetadataMCPServer:
                 "generated_at": datetime.now().isoformat()
             }
             
-            for table in tables:
-                try:
-                    columns = db.get_table_schema(table)
+            schemas = await self._fetch_table_schemas(db_name, tables)
+            for table, columns in zip(tables, schemas):
+                if isinstance(columns, Exception):
+                    logger.error(f"Error getting schema for table {table}: {str(columns)}")
+                else:
                     schema_info["tables"].append({
                         "name": table,
                         "columns": columns
                     })
-                except Exception as e:
-                    logger.error(f"Error getting schema for table {table}: {str(e)}")
                     
-            return json.dumps(schema_info, indent=2)
+            return json_utils.dumps(schema_info, indent=True)
             
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return json_utils.dumps({"error": str(e)})
 
     async def _get_quality_report(self, db_name: str) -> str:
         """Get data quality report for database."""
         # This would implement comprehensive quality analysis
         # For now, return a placeholder
-        return json.dumps({
+        return json_utils.dumps({
             "database": db_name,
             "quality_summary": "Quality analysis feature coming soon",
             "generated_at": datetime.now().isoformat()
@@ -452,21 +856,27 @@ class MetadataMCPServer:
     async def run(self):
         """Run the MCP server."""
         logger.info("Starting Metadata MCP Server")
-        async with stdio_server() as streams:
-            await self.server.run(
-                streams[0], streams[1],
-                self.server.create_initialization_options()
-            )
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=WORKER_THREADS, thread_name_prefix="metadata-mcp")
+        asyncio.get_running_loop().set_default_executor(executor)
+        hot_metrics_task = asyncio.create_task(self._refresh_hot_metrics())
+        try:
+            async with stdio_server() as streams:
+                await self.server.run(
+                    streams[0], streams[1],
+                    self.server.create_initialization_options()
+                )
+        finally:
+            hot_metrics_task.cancel()
+            self.close()
+            executor.shutdown(wait=False)
 
 
 # CLI entry point for MCP server
 async def main():
     """Main entry point for MCP server."""
-    import asyncio
     server = MetadataMCPServer()
     await server.run()
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main()) 
\ No newline at end of file
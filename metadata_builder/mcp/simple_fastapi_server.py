@@ -1,14 +1,33 @@
 """Simple FastAPI-based MCP-compatible server for Python 3.9 compatibility."""
 
-import json
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+from contextlib import asynccontextmanager
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, Field
+from fastapi import FastAPI, Header, HTTPException, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
 import uvicorn
 
+try:
+    import uvloop  # noqa: F401
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+try:
+    import httptools  # noqa: F401
+    HAS_HTTPTOOLS = True
+except ImportError:
+    HAS_HTTPTOOLS = False
+
 # Use absolute imports for better compatibility
 import sys
 import os
@@ -17,19 +36,87 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 from metadata_builder.core.generate_table_metadata import generate_complete_table_metadata
 from metadata_builder.core.semantic_models import generate_lookml_model
 from metadata_builder.config.config import load_config, get_db_handler
+from metadata_builder.utils import json_utils
+from metadata_builder.utils.table_search import build_name_index, match_table_names
+from metadata_builder.utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Worker threads for blocking database and LLM work run off the event loop
+WORKER_THREADS = 100
+
+# Generated table metadata is reused for this long across requests
+METADATA_CACHE_TTL_SECONDS = 300
+METADATA_CACHE_MAXSIZE = 1024
+
+# Table listings and column schemas change rarely but are read on every search and overview
+CATALOG_CACHE_TTL_SECONDS = 60
+
+_metadata_cache = TTLCache(maxsize=METADATA_CACHE_MAXSIZE, ttl_seconds=METADATA_CACHE_TTL_SECONDS)
+_metadata_locks: Dict[tuple, asyncio.Lock] = {}
+_tables_cache = TTLCache(maxsize=256, ttl_seconds=CATALOG_CACHE_TTL_SECONDS)
+_table_schema_cache = TTLCache(maxsize=4096, ttl_seconds=CATALOG_CACHE_TTL_SECONDS)
+_name_index_cache = TTLCache(maxsize=256, ttl_seconds=CATALOG_CACHE_TTL_SECONDS)
+
+# Search results by (normalized query, database, limit)
+SEARCH_CACHE_TTL_SECONDS = 120
+SEARCH_CACHE_MAXSIZE = 512
+_search_cache = TTLCache(maxsize=SEARCH_CACHE_MAXSIZE, ttl_seconds=SEARCH_CACHE_TTL_SECONDS)
+
+# A database that takes longer than this is left out of the search results
+SEARCH_DB_TIMEOUT_SECONDS = 10
+
+# The index and tool list only change on deploy; schema overviews live as long as the catalog cache
+STATIC_CACHE_CONTROL = "public, max-age=3600"
+OVERVIEW_CACHE_CONTROL = f"public, max-age={CATALOG_CACHE_TTL_SECONDS}"
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with json_utils (orjson when installed) instead of the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return json_utils.dumps_bytes(content)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Give blocking tool work its own thread pool for the life of the server.
+    
+    Configured databases are connected at startup so the first requests do not
+    pay for engine and pool creation; handlers are closed on shutdown.
+    """
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=WORKER_THREADS, thread_name_prefix="metadata-api")
+    asyncio.get_running_loop().set_default_executor(executor)
+    databases = list(get_config().get('databases', {}).keys())
+    warmed = await asyncio.gather(*[asyncio.to_thread(_get_handler, db_name) for db_name in databases], return_exceptions=True)
+    for db_name, handler in zip(databases, warmed):
+        if isinstance(handler, Exception):
+            logger.warning(f"Could not connect to database {db_name} at startup: {str(handler)}")
+    try:
+        yield
+    finally:
+        _close_handlers()
+        executor.shutdown(wait=False)
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Metadata Intelligence Server",
     description="MCP-compatible server for metadata operations using FastAPI",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
 )
 
+# Models reject unknown fields, which keeps their compiled validators tight
+MODEL_CONFIG = ConfigDict(extra='forbid')
+
 # Pydantic models for type safety
 class TableMetadataRequest(BaseModel):
     """Request model for table metadata."""
+    model_config = MODEL_CONFIG
+    
     database: str = Field(..., description="Database name to query")
     table: str = Field(..., description="Table name to analyze")
     schema: str = Field("public", description="Schema name (defaults to 'public')")
@@ -39,31 +126,72 @@ class TableMetadataRequest(BaseModel):
 
 class TableSearchRequest(BaseModel):
     """Request model for table search operations."""
+    model_config = MODEL_CONFIG
+    
     query: str = Field(..., description="Search query (table name pattern or business term)")
     database: Optional[str] = Field(None, description="Specific database to search (optional)")
     limit: int = Field(20, ge=1, le=100, description="Maximum results to return (1-100)")
 
 class MCPResponse(BaseModel):
-    """Standard MCP response format."""
+    """
+    Standard MCP response format.
+    
+    Responses are built from trusted server data, so handlers create them with
+    model_construct and skip validation.
+    """
+    model_config = MODEL_CONFIG
+    
     content: List[Dict[str, Any]]
     isError: bool = False
 
-# Global config
-config = None
-
+@functools.lru_cache(maxsize=1)
 def get_config():
     """Get configuration singleton."""
-    global config
-    if config is None:
+    try:
+        return load_config()
+    except Exception:
+        return {"databases": {}}
+
+# Handlers hold a single connection, so each worker thread keeps its own per database
+_thread_handlers = threading.local()
+_db_handlers: List[Any] = []
+_db_handlers_lock = threading.Lock()
+
+def _get_handler(db_name: str):
+    """
+    Get this thread's database handler, creating it on first use.
+    
+    Args:
+        db_name: Database name
+        
+    Returns:
+        Database handler
+    """
+    handlers = getattr(_thread_handlers, 'handlers', None)
+    if handlers is None:
+        handlers = _thread_handlers.handlers = {}
+    handler = handlers.get(db_name)
+    if handler is None:
+        handler = handlers[db_name] = get_db_handler(db_name)
+        with _db_handlers_lock:
+            _db_handlers.append(handler)
+    return handler
+
+def _close_handlers() -> None:
+    """Close every handler created by _get_handler."""
+    global _db_handlers
+    with _db_handlers_lock:
+        handlers, _db_handlers = _db_handlers, []
+    for handler in handlers:
         try:
-            config = load_config()
-        except Exception:
-            config = {"databases": {}}
-    return config
+            handler.close()
+        except Exception as e:
+            logger.warning(f"Error closing database handler: {str(e)}")
 
 @app.get("/")
-async def root():
+async def root(response: Response):
     """Health check endpoint."""
+    response.headers["Cache-Control"] = STATIC_CACHE_CONTROL
     return {
         "name": "Metadata Intelligence Server",
         "version": "1.0.0",
@@ -74,7 +202,8 @@ async def root():
             "docs": "/docs",
             "tools": "/tools",
             "table_metadata": "/tools/get_table_metadata",
-            "search_tables": "/tools/search_tables"
+            "search_tables": "/tools/search_tables",
+            "clear_cache": "DELETE /cache"
         }
     }
 
@@ -88,9 +217,20 @@ async def health_check():
         "server_type": "FastAPI-MCP"
     }
 
+@app.delete("/cache")
+async def clear_cache():
+    """Drop cached metadata, table listings and schemas so the next requests re-read the databases."""
+    for cache in (_metadata_cache, _tables_cache, _table_schema_cache, _name_index_cache, _search_cache):
+        cache.clear()
+    return {
+        "status": "cleared",
+        "timestamp": datetime.now().isoformat()
+    }
+
 @app.get("/tools")
-async def list_tools():
+async def list_tools(response: Response):
     """List all available MCP tools."""
+    response.headers["Cache-Control"] = STATIC_CACHE_CONTROL
     return {
         "tools": [
             {
@@ -127,38 +267,23 @@ async def get_table_metadata(request: TableMetadataRequest):
     before generating queries or performing analysis.
     """
     try:
-        # Generate comprehensive metadata
-        metadata = generate_complete_table_metadata(
-            db_name=request.database,
-            table_name=request.table,
-            schema_name=request.schema,
-            sample_size=100 if request.include_samples else 0,
-            num_samples=3 if request.include_samples else 0,
-            include_data_quality=request.include_quality,
-            include_relationships=request.include_relationships
-        )
+        # Generate comprehensive metadata, or reuse a recent identical request's
+        metadata = await _cached_metadata(request)
         
         # Format for AI consumption
         summary = _format_metadata_for_ai(metadata)
         
         result_text = f"""Table Metadata for {request.database}.{request.schema}.{request.table}:
 
-{summary}
-
-Full metadata available in JSON format:
-{json.dumps(metadata, indent=2, default=str)}"""
+{summary}"""
         
-        return MCPResponse(
-            content=[{
-                "type": "text",
-                "text": result_text
-            }],
-            isError=False
-        )
+        # The full metadata travels as structured JSON rather than a JSON string inside the text,
+        # streamed one top-level section at a time
+        return StreamingResponse(_iter_metadata_response(result_text, metadata), media_type="application/json")
         
     except Exception as e:
         logger.error(f"Error getting table metadata: {str(e)}")
-        return MCPResponse(
+        return MCPResponse.model_construct(
             content=[{
                 "type": "text", 
                 "text": f"Error retrieving metadata for {request.database}.{request.table}: {str(e)}"
@@ -179,57 +304,52 @@ async def search_tables(request: TableSearchRequest):
     Returns a ranked list of matching tables with metadata.
     """
     try:
-        config = get_config()
-        results = []
-        databases_to_search = [request.database] if request.database else list(config.get('databases', {}).keys())
+        # Queries differing only in case or spacing share one cache entry
+        query = _normalize_query(request.query)
+        cache_key = (query, request.database, request.limit)
+        results = _search_cache.get(cache_key)
         
-        for db_name in databases_to_search:
-            try:
-                db = get_db_handler(db_name)
-                tables = db.get_all_tables()
-                
-                # Pattern matching - could be enhanced with semantic search
-                matching_tables = [
-                    table for table in tables 
-                    if request.query.lower() in table.lower()
-                ][:request.limit]
-                
-                for table in matching_tables:
-                    # Get basic metadata for context
-                    try:
-                        columns = db.get_table_schema(table)
-                        results.append({
-                            "database": db_name,
-                            "table": table,
-                            "columns": len(columns),
-                            "match_reason": f"Name contains '{request.query}'",
-                            "sample_columns": list(columns.keys())[:5]
-                        })
-                    except Exception:
-                        results.append({
-                            "database": db_name,
-                            "table": table,
-                            "match_reason": f"Name contains '{request.query}'"
-                        })
-                        
-            except Exception as e:
-                logger.error(f"Error searching database {db_name}: {str(e)}")
+        if results is None:
+            config = get_config()
+            databases_to_search = [request.database] if request.database else list(config.get('databases', {}).keys())
+            
+            # Search every database concurrently, each in a worker thread
+            results_lists = await asyncio.gather(
+                *[_search_one_db(db_name, query, request.limit) for db_name in databases_to_search],
+                return_exceptions=True
+            )
+            results = []
+            complete = True
+            for db_name, db_results in zip(databases_to_search, results_lists):
+                if isinstance(db_results, asyncio.TimeoutError):
+                    logger.warning(f"Search of database {db_name} timed out after {SEARCH_DB_TIMEOUT_SECONDS}s")
+                    complete = False
+                elif isinstance(db_results, Exception):
+                    logger.error(f"Error searching database {db_name}: {str(db_results)}")
+                    complete = False
+                else:
+                    results.extend(db_results)
+            
+            # Only complete searches are reused; a failed database should be retried next time
+            if complete:
+                _search_cache.set(cache_key, results)
                 
         # Format results
         if not results:
             result_text = f"No tables found matching '{request.query}'"
         else:
-            result_text = f"Found {len(results)} tables matching '{request.query}':\n\n"
+            parts = [f"Found {len(results)} tables matching '{request.query}':\n\n"]
             for result in results[:request.limit]:
-                result_text += f"📊 {result['database']}.{result['table']}"
+                parts.append(f"📊 {result['database']}.{result['table']}")
                 if 'columns' in result:
-                    result_text += f" ({result['columns']} columns)"
-                result_text += f"\n   Match: {result['match_reason']}\n"
+                    parts.append(f" ({result['columns']} columns)")
+                parts.append(f"\n   Match: {result['match_reason']}\n")
                 if 'sample_columns' in result:
-                    result_text += f"   Columns: {', '.join(result['sample_columns'])}\n"
-                result_text += "\n"
+                    parts.append(f"   Columns: {', '.join(result['sample_columns'])}\n")
+                parts.append("\n")
+            result_text = "".join(parts)
         
-        return MCPResponse(
+        return MCPResponse.model_construct(
             content=[{
                 "type": "text",
                 "text": result_text
@@ -239,7 +359,7 @@ async def search_tables(request: TableSearchRequest):
         
     except Exception as e:
         logger.error(f"Error in table search: {str(e)}")
-        return MCPResponse(
+        return MCPResponse.model_construct(
             content=[{
                 "type": "text",
                 "text": f"Error searching for tables: {str(e)}"
@@ -248,7 +368,12 @@ async def search_tables(request: TableSearchRequest):
         )
 
 @app.get("/tools/get_schema_overview")
-async def get_schema_overview(database: str, schema: str = "public"):
+async def get_schema_overview(
+    response: Response,
+    database: str,
+    schema: str = "public",
+    if_none_match: Optional[str] = Header(None)
+):
     """
     Get a comprehensive overview of database schema structure.
     
@@ -259,59 +384,48 @@ async def get_schema_overview(database: str, schema: str = "public"):
     - Relationships between tables (if detectable)
     
     Perfect for AI agents getting familiar with a new database.
+    
+    Responses carry an ETag over the table list and counts; a client that
+    sends it back in If-None-Match gets a 304 without the body being built.
     """
     try:
-        db = get_db_handler(database)
-        tables = db.get_all_tables(schema)
+        # Catalog and count queries block, so they run in a worker thread
+        tables, table_details = await asyncio.to_thread(_schema_table_details, database, schema)
         
-        overview = f"🗄️ Schema Overview for {database}.{schema}:\n\n"
-        overview += f"📊 Total Tables: {len(tables)}\n\n"
+        etag = _overview_etag(database, schema, tables, table_details)
+        cache_headers = {"ETag": etag, "Cache-Control": OVERVIEW_CACHE_CONTROL}
+        if if_none_match and (if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))):
+            return Response(status_code=304, headers=cache_headers)
+        response.headers.update(cache_headers)
+        
+        parts = [
+            f"🗄️ Schema Overview for {database}.{schema}:\n\n",
+            f"📊 Total Tables: {len(tables)}\n\n",
+        ]
         
         if not tables:
-            overview += "No tables found in this schema."
+            parts.append("No tables found in this schema.")
         else:
-            overview += "📋 Tables Summary:\n"
-            
-            table_details = []
-            for table in tables[:50]:  # Limit to avoid overwhelming output
-                try:
-                    columns = db.get_table_schema(table, schema)
-                    # Try to get row count (if supported)
-                    try:
-                        row_count_query = f"SELECT COUNT(*) as count FROM {schema}.{table}" if schema != "public" else f"SELECT COUNT(*) as count FROM {table}"
-                        result = db.fetch_all(row_count_query)
-                        row_count = result[0]['count'] if result else "Unknown"
-                    except:
-                        row_count = "Unknown"
-                        
-                    table_details.append({
-                        "name": table,
-                        "columns": len(columns),
-                        "rows": row_count
-                    })
-                    
-                except Exception as e:
-                    table_details.append({
-                        "name": table,
-                        "error": str(e)
-                    })
+            parts.append("📋 Tables Summary:\n")
             
             # Sort by column count (most complex first)
             table_details.sort(key=lambda x: x.get('columns', 0), reverse=True)
             
             for detail in table_details:
                 if 'error' in detail:
-                    overview += f"  ❌ {detail['name']} (error: {detail['error']})\n"
+                    parts.append(f"  ❌ {detail['name']} (error: {detail['error']})\n")
                 else:
-                    overview += f"  📊 {detail['name']} - {detail['columns']} columns"
+                    parts.append(f"  📊 {detail['name']} - {detail['columns']} columns")
                     if detail['rows'] != "Unknown":
-                        overview += f", {detail['rows']:,} rows"
-                    overview += "\n"
+                        parts.append(f", {detail['rows']:,} rows")
+                    parts.append("\n")
                     
             if len(tables) > 50:
-                overview += f"\n... and {len(tables) - 50} more tables (showing top 50 by complexity)"
+                parts.append(f"\n... and {len(tables) - 50} more tables (showing top 50 by complexity)")
         
-        return MCPResponse(
+        overview = "".join(parts)
+        
+        return MCPResponse.model_construct(
             content=[{
                 "type": "text",
                 "text": overview
@@ -321,7 +435,7 @@ async def get_schema_overview(database: str, schema: str = "public"):
         
     except Exception as e:
         logger.error(f"Error getting schema overview: {str(e)}")
-        return MCPResponse(
+        return MCPResponse.model_construct(
             content=[{
                 "type": "text",
                 "text": f"Error retrieving schema overview: {str(e)}"
@@ -329,50 +443,343 @@ async def get_schema_overview(database: str, schema: str = "public"):
             isError=True
         )
 
+def _overview_etag(database: str, schema: str, tables: List[str], table_details: List[Dict[str, Any]]) -> str:
+    """Return a quoted ETag for the data a schema overview is rendered from."""
+    payload = json_utils.dumps_bytes([database, schema, tables, table_details])
+    return f'"{hashlib.sha1(payload).hexdigest()}"'
+
+def _iter_metadata_response(text: str, metadata: Dict[str, Any]) -> Iterator[bytes]:
+    """
+    Encode an MCPResponse body with a text item and a JSON metadata item, piece by piece.
+    
+    Each top-level metadata section is serialized on its own, so only one
+    section's JSON is held in memory at a time and the client receives the
+    summary before the bulk of the payload is encoded. Response-model
+    validation is bypassed; values JSON cannot represent natively are
+    converted with str().
+    
+    Args:
+        text: Readable summary for the text item
+        metadata: Table metadata for the JSON item
+        
+    Yields:
+        Chunks of UTF-8 encoded JSON
+    """
+    yield b'{"content":[{"type":"text","text":' + json_utils.dumps_bytes(text) + b'},{"type":"json","data":{'
+    for index, (key, value) in enumerate(metadata.items()):
+        separator = b"," if index else b""
+        yield separator + json_utils.dumps_bytes(str(key)) + b":" + json_utils.dumps_bytes(value)
+    yield b'}}],"isError":false}'
+
+async def _cached_metadata(request: TableMetadataRequest) -> Dict[str, Any]:
+    """
+    Generate table metadata in a worker thread, reusing results from recent identical requests.
+    
+    Concurrent requests for the same table and options wait on a shared lock
+    so the metadata is only generated once. Failed generations are not cached.
+    
+    Args:
+        request: Table metadata request
+        
+    Returns:
+        Table metadata dictionary
+    """
+    key = (
+        request.database, request.schema, request.table,
+        request.include_samples, request.include_quality, request.include_relationships
+    )
+    metadata = _metadata_cache.get(key)
+    if metadata is not None:
+        return metadata
+    
+    lock = _metadata_locks.setdefault(key, asyncio.Lock())
+    try:
+        async with lock:
+            metadata = _metadata_cache.get(key)
+            if metadata is None:
+                metadata = await asyncio.to_thread(
+                    generate_complete_table_metadata,
+                    db_name=request.database,
+                    table_name=request.table,
+                    schema_name=request.schema,
+                    sample_size=100,
+                    num_samples=3,
+                    include_samples=request.include_samples,
+                    include_data_quality=request.include_quality,
+                    include_relationships=request.include_relationships
+                )
+                if "error" not in metadata:
+                    _metadata_cache.set(key, metadata)
+    finally:
+        if _metadata_locks.get(key) is lock:
+            del _metadata_locks[key]
+    return metadata
+
+def _cached_tables(db, db_name: str, schema: Optional[str] = None) -> List[str]:
+    """
+    List a database's tables, reusing a recent listing when available.
+    
+    Args:
+        db: Database handler for db_name
+        db_name: Database name
+        schema: Optional schema name
+        
+    Returns:
+        List of table names
+    """
+    key = (db_name, schema)
+    tables = _tables_cache.get(key)
+    if tables is None:
+        tables = db.get_database_tables(schema)
+        _tables_cache.set(key, tables)
+    return tables
+
+def _cached_table_schema(db, db_name: str, table: str, schema: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Get a table's column schema, reusing a recent lookup when available.
+    
+    Args:
+        db: Database handler for db_name
+        db_name: Database name
+        table: Table name
+        schema: Optional schema name
+        
+    Returns:
+        Dictionary mapping column names to their types
+    """
+    key = (db_name, schema, table)
+    columns = _table_schema_cache.get(key)
+    if columns is None:
+        columns = db.get_table_schema(table, schema) if schema else db.get_table_schema(table)
+        _table_schema_cache.set(key, columns)
+    return columns
+
+def _cached_tables_schemas(db, db_name: str, tables: List[str], schema: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Get column schemas for several tables, fetching the uncached ones in one query.
+    
+    Falls back to one lookup per table when the bulk query fails. Tables
+    whose schema cannot be read are left out of the result.
+    
+    Args:
+        db: Database handler for db_name
+        db_name: Database name
+        tables: Table names
+        schema: Optional schema name
+        
+    Returns:
+        Dictionary mapping table names to their column schemas
+    """
+    schemas = {}
+    missing = []
+    for table in tables:
+        columns = _table_schema_cache.get((db_name, schema, table))
+        if columns is None:
+            missing.append(table)
+        else:
+            schemas[table] = columns
+    if not missing:
+        return schemas
+    
+    try:
+        fetched = db.get_tables_schemas(missing, schema)
+    except Exception as e:
+        logger.warning(f"Bulk schema fetch failed for {db_name}, fetching per table: {str(e)}")
+        fetched = {}
+        for table in missing:
+            try:
+                fetched[table] = _cached_table_schema(db, db_name, table, schema)
+            except Exception as table_error:
+                logger.debug(f"Could not read schema of {db_name}.{table}: {str(table_error)}")
+    
+    for table, columns in fetched.items():
+        _table_schema_cache.set((db_name, schema, table), columns)
+        schemas[table] = columns
+    return schemas
+
+def _normalize_query(query: str) -> str:
+    """Lowercase a search query and collapse its whitespace."""
+    return " ".join(query.lower().split())
+
+async def _search_one_db(db_name: str, query: str, limit: int) -> List[Dict[str, Any]]:
+    """
+    Search one database in a worker thread, giving up after SEARCH_DB_TIMEOUT_SECONDS.
+    
+    Args:
+        db_name: Database name
+        query: Normalized search query
+        limit: Maximum number of matching tables
+        
+    Returns:
+        List of result dictionaries for the matching tables
+        
+    Raises:
+        asyncio.TimeoutError: If the database did not answer in time
+    """
+    return await asyncio.wait_for(
+        asyncio.to_thread(_search_database, db_name, query, limit),
+        timeout=SEARCH_DB_TIMEOUT_SECONDS
+    )
+
+def _search_database(db_name: str, query: str, limit: int) -> List[Dict[str, Any]]:
+    """
+    Find tables in one database whose names match the query.
+    
+    Blocking; called from a worker thread.
+    
+    Args:
+        db_name: Database name
+        query: Search query
+        limit: Maximum number of matching tables
+        
+    Returns:
+        List of result dictionaries for the matching tables
+    """
+    results = []
+    db = _get_handler(db_name)
+    try:
+        name_index = _name_index_cache.get(db_name)
+        if name_index is None:
+            name_index = build_name_index(_cached_tables(db, db_name))
+            _name_index_cache.set(db_name, name_index)
+        
+        # Multi-term queries match all terms in one Aho-Corasick pass per name when available
+        matching_tables = match_table_names(name_index, query, limit)
+        match_reason = f"Name contains '{query}'" if len(query.split()) <= 1 else f"Name matches terms in '{query}'"
+        
+        # Get basic metadata for context, for all matches at once
+        schemas = _cached_tables_schemas(db, db_name, matching_tables)
+        for table in matching_tables:
+            columns = schemas.get(table)
+            if columns is not None:
+                results.append({
+                    "database": db_name,
+                    "table": table,
+                    "columns": len(columns),
+                    "match_reason": match_reason,
+                    "sample_columns": list(islice(columns, 5))
+                })
+            else:
+                results.append({
+                    "database": db_name,
+                    "table": table,
+                    "match_reason": match_reason
+                })
+    finally:
+        db.release()
+    return results
+
+def _schema_table_details(database: str, schema: str) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """
+    List a schema's tables with column and row counts for the first 50.
+    
+    Counts come from one catalog query (planner row estimates, no table
+    scans); if it fails, column counts are read from the table schemas and
+    row counts are left unknown. Blocking; called from a worker thread.
+    
+    Args:
+        database: Database name
+        schema: Schema name
+        
+    Returns:
+        Tuple of (all table names, details for the first 50 tables)
+    """
+    db = _get_handler(database)
+    try:
+        tables = _cached_tables(db, database, schema)
+        
+        overview_tables = tables[:50]  # Limit to avoid overwhelming output
+        try:
+            # Names are bound as parameters; invalid identifiers are rejected before any SQL runs
+            stats = db.get_schema_bulk_stats(schema, overview_tables)
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.warning(f"Bulk statistics failed for {database}.{schema}: {str(e)}")
+            stats = {}
+        if not stats:
+            stats = {
+                table: {'columns': len(columns), 'rows': None}
+                for table, columns in _cached_tables_schemas(db, database, overview_tables, schema).items()
+            }
+        
+        table_details = []
+        for table in overview_tables:
+            table_stats = stats.get(table)
+            if table_stats is None:
+                table_details.append({
+                    "name": table,
+                    "error": "statistics unavailable"
+                })
+            else:
+                table_details.append({
+                    "name": table,
+                    "columns": table_stats['columns'],
+                    "rows": table_stats['rows'] if table_stats['rows'] is not None else "Unknown"
+                })
+    finally:
+        db.release()
+    return tables, table_details
+
+def _format_column_line(col_name: str, col_info: Dict[str, Any]) -> str:
+    """Format one column of the AI summary as a single bullet line."""
+    get = col_info.get
+    description = get('description')
+    return "".join((
+        f"  • **{col_name}** ({get('data_type', 'unknown')})",
+        f" - {description}" if description else "",
+        " [PRIMARY KEY]" if get('is_primary_key') else "",
+        " [FOREIGN KEY]" if get('is_foreign_key') else "",
+    ))
+
 def _format_metadata_for_ai(metadata: Dict[str, Any]) -> str:
     """Format metadata in a way that's optimized for AI understanding."""
     summary = []
+    append = summary.append
+    extend = summary.extend
     
     # Table overview
     table_desc = metadata.get('table_description', {})
     if table_desc:
-        summary.append(f"🎯 PURPOSE: {table_desc.get('purpose', 'Unknown')}")
-        summary.append(f"🏢 BUSINESS DOMAIN: {table_desc.get('business_domain', 'Unknown')}")
+        append(f"🎯 PURPOSE: {table_desc.get('purpose', 'Unknown')}")
+        append(f"🏢 BUSINESS DOMAIN: {table_desc.get('business_domain', 'Unknown')}")
         
     # Column information
     columns = metadata.get('columns', {})
     if columns:
-        summary.append(f"\n📊 COLUMNS ({len(columns)} total):")
-        for col_name, col_info in list(columns.items())[:15]:  # Show top 15
-            col_summary = f"  • **{col_name}** ({col_info.get('data_type', 'unknown')})"
-            if col_info.get('description'):
-                col_summary += f" - {col_info['description']}"
-            if col_info.get('is_primary_key'):
-                col_summary += " [PRIMARY KEY]"
-            if col_info.get('is_foreign_key'):
-                col_summary += " [FOREIGN KEY]"
-            summary.append(col_summary)
+        column_count = len(columns)
+        append(f"\n📊 COLUMNS ({column_count} total):")
+        # Show top 15
+        extend(_format_column_line(col_name, col_info) for col_name, col_info in islice(columns.items(), 15))
         
-        if len(columns) > 15:
-            summary.append(f"  ... and {len(columns) - 15} more columns")
+        if column_count > 15:
+            append(f"  ... and {column_count - 15} more columns")
             
     # Data quality highlights
     quality_metrics = metadata.get('data_quality_metrics', {})
     if quality_metrics:
-        summary.append(f"\n📊 DATA QUALITY HIGHLIGHTS:")
-        for metric, value in list(quality_metrics.items())[:5]:
-            summary.append(f"  • {metric}: {value}")
+        append("\n📊 DATA QUALITY HIGHLIGHTS:")
+        extend(f"  • {metric}: {value}" for metric, value in islice(quality_metrics.items(), 5))
             
     # Key relationships
     relationships = metadata.get('relationships', {})
     if relationships:
-        summary.append(f"\n🔗 KEY RELATIONSHIPS:")
-        for rel_type, rel_info in relationships.items():
-            if rel_info:
-                summary.append(f"  • {rel_type}: {rel_info}")
+        append("\n🔗 KEY RELATIONSHIPS:")
+        extend(f"  • {rel_type}: {rel_info}" for rel_type, rel_info in relationships.items() if rel_info)
             
     return "\n".join(summary)
 
-# Entry point for running the server
+# Entry point for running the server. For multiple cores run the app under gunicorn instead:
+#   gunicorn -k uvicorn.workers.UvicornWorker -w $((2 * $(nproc) + 1)) metadata_builder.mcp.simple_fastapi_server:app
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8001) 
\ No newline at end of file
+    # Per-request access logs cost throughput; set DEV=1 to get them back while developing
+    dev_mode = bool(os.getenv("DEV"))
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8001,
+        loop="uvloop" if HAS_UVLOOP else "asyncio",
+        http="httptools" if HAS_HTTPTOOLS else "h11",
+        log_level="info" if dev_mode else "warning",
+        access_log=dev_mode
+    )
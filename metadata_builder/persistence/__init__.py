@@ -13,8 +13,8 @@ from .models import (
     SampleDataMetadata,
     ProcessingStatsMetadata
 )
-from .repository import MetadataRepository
-from .migration import create_metadata_tables
+from .bulk import COPY_THRESHOLD, bulk_copy, bulk_insert
+from .session import SessionLocal, engine, get_sessionmaker
 
 __all__ = [
     'Base',
@@ -26,6 +26,10 @@ __all__ = [
     'RelationshipMetadata',
     'SampleDataMetadata',
     'ProcessingStatsMetadata',
-    'MetadataRepository',
-    'create_metadata_tables'
+    'COPY_THRESHOLD',
+    'bulk_copy',
+    'bulk_insert',
+    'engine',
+    'SessionLocal',
+    'get_sessionmaker'
 ] 
\ No newline at end of file
@@ -0,0 +1,144 @@
+"""
+Bulk persistence helpers for metadata rows.
+"""
+
+import io
+import logging
+from datetime import date, datetime
+from typing import Any, Dict, List, Sequence
+
+from sqlalchemy import JSON, insert
+from sqlalchemy.orm import Session
+
+from ..utils import json_utils
+
+logger = logging.getLogger(__name__)
+
+# Below this many rows an executemany INSERT is cheaper than setting up a COPY
+COPY_THRESHOLD = 100
+
+
+def _fill_defaults(table, rows: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Apply client-side column defaults, which COPY bypasses.
+
+    Args:
+        table: SQLAlchemy Table the rows belong to
+        rows: Row dictionaries keyed by column name
+
+    Returns:
+        New row dictionaries with every table column present
+    """
+    filled = []
+    for row in rows:
+        values = dict(row)
+        for column in table.columns:
+            if values.get(column.name) is not None:
+                continue
+            default = column.default
+            if default is None:
+                values.setdefault(column.name, None)
+            elif default.is_callable:
+                values[column.name] = default.arg(None)
+            elif default.is_scalar:
+                values[column.name] = default.arg
+        filled.append(values)
+    return filled
+
+
+def _copy_value(value: Any, is_json: bool) -> str:
+    """Encode one value for PostgreSQL's COPY text format."""
+    if value is None:
+        return "\\N"
+    if is_json:
+        text = json_utils.dumps(value)
+    elif isinstance(value, bool):
+        text = "t" if value else "f"
+    elif isinstance(value, (datetime, date)):
+        text = value.isoformat()
+    else:
+        text = str(value)
+    return (
+        text.replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def copy_buffer(table, columns: Sequence[str], rows: Sequence[Dict[str, Any]]) -> io.StringIO:
+    """
+    Serialize rows to a tab-delimited buffer for COPY ... FROM STDIN.
+
+    JSON and JSONB columns are written as JSON text; NULLs use COPY's \\N marker.
+
+    Args:
+        table: SQLAlchemy Table the rows belong to
+        columns: Column names, in the order given to COPY
+        rows: Row dictionaries keyed by column name
+
+    Returns:
+        Buffer positioned at the start
+    """
+    json_columns = {name for name in columns if isinstance(table.columns[name].type, JSON)}
+    buffer = io.StringIO()
+    write = buffer.write
+    for row in rows:
+        write("\t".join(_copy_value(row.get(name), name in json_columns) for name in columns))
+        write("\n")
+    buffer.seek(0)
+    return buffer
+
+
+def bulk_copy(session: Session, model, rows: Sequence[Dict[str, Any]]) -> int:
+    """
+    Stream rows into a model's table with PostgreSQL COPY.
+
+    Runs on the session's connection, so the rows commit or roll back with
+    the session. Requires the psycopg2 driver.
+
+    Args:
+        session: SQLAlchemy session bound to PostgreSQL
+        model: Declarative model class, e.g. ColumnMetadata
+        rows: Row dictionaries keyed by column name
+
+    Returns:
+        Number of rows copied
+    """
+    if not rows:
+        return 0
+    table = model.__table__
+    rows = _fill_defaults(table, rows)
+    columns = [column.name for column in table.columns]
+    buffer = copy_buffer(table, columns, rows)
+
+    column_list = ", ".join(f'"{name}"' for name in columns)
+    table_name = f'"{table.schema}"."{table.name}"' if table.schema else f'"{table.name}"'
+    dbapi_connection = session.connection().connection
+    with dbapi_connection.cursor() as cursor:
+        cursor.copy_expert(f"COPY {table_name} ({column_list}) FROM STDIN", buffer)
+    logger.debug(f"Copied {len(rows)} rows into {table.name}")
+    return len(rows)
+
+
+def bulk_insert(session: Session, model, rows: Sequence[Dict[str, Any]]) -> int:
+    """
+    Insert many rows of one model, using COPY when it pays off.
+
+    Large batches on psycopg2 go through bulk_copy(); smaller batches and
+    other drivers use a single executemany INSERT.
+
+    Args:
+        session: SQLAlchemy session
+        model: Declarative model class, e.g. SampleDataMetadata
+        rows: Row dictionaries keyed by column name
+
+    Returns:
+        Number of rows inserted
+    """
+    if not rows:
+        return 0
+    if len(rows) > COPY_THRESHOLD and session.get_bind().dialect.driver == "psycopg2":
+        return bulk_copy(session, model, rows)
+    session.execute(insert(model), list(rows))
+    return len(rows)
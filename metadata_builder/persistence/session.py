@@ -0,0 +1,72 @@
+"""
+Engines and sessions for the metadata store.
+"""
+
+import logging
+import os
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+
+logger = logging.getLogger(__name__)
+
+# Metadata store connection; DATABASE_URL is shared with the auth schema
+METADATA_DATABASE_URL = os.getenv("METADATA_DATABASE_URL") or os.getenv("DATABASE_URL")
+
+# Sized for concurrent per-table writes; recycled connections survive database restarts
+POOL_OPTIONS = {
+    "pool_size": 25,
+    "max_overflow": 25,
+    "pool_pre_ping": True,
+    "pool_recycle": 1800,
+}
+
+
+def _driver_url(url: str, driver: str) -> str:
+    """
+    Return a PostgreSQL URL using the given driver, e.g. postgresql+psycopg2://.
+
+    Raises:
+        ValueError: If the URL is not for PostgreSQL
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "postgresql":
+        raise ValueError(
+            f"Metadata store must be PostgreSQL, got '{parsed.drivername}'. "
+            "Set METADATA_DATABASE_URL to a postgresql:// URL."
+        )
+    return parsed.set(drivername=f"postgresql+{driver}").render_as_string(hide_password=False)
+
+
+def _require_url() -> str:
+    if not METADATA_DATABASE_URL:
+        raise ValueError("Metadata store not configured. Set METADATA_DATABASE_URL or DATABASE_URL.")
+    return METADATA_DATABASE_URL
+
+
+# Shared pooled engine for synchronous metadata writes
+engine = None
+SessionLocal = None
+
+if METADATA_DATABASE_URL:
+    engine = create_engine(
+        _driver_url(METADATA_DATABASE_URL, "psycopg2"),
+        poolclass=QueuePool,
+        echo=False,
+        **POOL_OPTIONS
+    )
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def get_sessionmaker():
+    """
+    Return the session factory bound to the shared pooled engine.
+
+    Returns:
+        sessionmaker producing Session objects
+    """
+    _require_url()
+    return SessionLocal
+
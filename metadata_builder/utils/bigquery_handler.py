@@ -2,29 +2,60 @@
 BigQuery-specific database handler with partition awareness.
 """
 
+import concurrent.futures
+import itertools
 import logging
 import re
 from typing import Dict, Any, List, Tuple, Optional, Union
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta, timezone
 from google.cloud import bigquery
 from google.cloud.bigquery import Client, QueryJobConfig
 from .database_handler import DatabaseHandler
+from .ttl_cache import TTLCache
 from ..config.config import get_db_config
 from google.oauth2 import service_account
 import json
 
+try:
+    # Storage Read API client; needs pyarrow for Arrow decoding
+    from google.cloud import bigquery_storage
+    import pyarrow  # noqa: F401
+    HAS_BQ_STORAGE = True
+except ImportError:
+    bigquery_storage = None
+    HAS_BQ_STORAGE = False
+
 logger = logging.getLogger(__name__)
 
+# Table metadata (schema, partitioning, row counts) is read several times per table
+TABLE_METADATA_CACHE_TTL_SECONDS = 300
+TABLE_METADATA_CACHE_MAXSIZE = 512
+
+# Results with more cells (rows x columns) than this are read as Arrow over the Storage Read API
+ARROW_MIN_CELLS = 1000
+
+# Below this many rows a full shuffle is cheaper than block sampling
+TABLESAMPLE_MIN_ROWS = 100_000
+
+# Wide column types left out of samples when skip_nested_columns is set; BigQuery bills by bytes of selected columns
+SAMPLE_EXCLUDED_TYPES = {'RECORD', 'STRUCT', 'BYTES', 'GEOGRAPHY'}
+
 class BigQueryHandler(DatabaseHandler):
     """BigQuery-specific implementation with partition awareness"""
     
     def __init__(self, db_name: str = None):
         super().__init__(db_name)
         self.client = None
+        # Explicit service-account credentials, or None for application default credentials
+        self._credentials = None
         self.project_id = None
         self.job_project_id = None
         self._dataset_project_cache = {}  # Cache for dataset -> project mapping
         self._table_cache = {}  # Cache for dataset -> tables mapping
+        self._table_metadata_cache = TTLCache(
+            maxsize=TABLE_METADATA_CACHE_MAXSIZE, ttl_seconds=TABLE_METADATA_CACHE_TTL_SECONDS
+        )
+        self._bqstorage_client = None
         if db_name:
             self.connect(db_name)
     
@@ -89,9 +120,11 @@ class BigQueryHandler(DatabaseHandler):
                 # For file-based credentials, use data project for jobs
                 self.job_project_id = self.project_id
 
+            self._credentials = credentials
             self.client = bigquery.Client(project=self.job_project_id, credentials=credentials)
         else:
             # Check if credentials are required (when not using default environment credentials)
+            self._credentials = None
             self.job_project_id = self.project_id
             try:
                 # Try to use default credentials (e.g., from environment)
@@ -108,6 +141,196 @@ class BigQueryHandler(DatabaseHandler):
         
         logger.info(f"Successfully connected to BigQuery project: {self.project_id}")
     
+    def _get_table_cached(self, table_ref: str) -> bigquery.Table:
+        """
+        Fetch table metadata, reusing a recent lookup of the same table.
+        
+        Each get_table() is an API round trip, and one sampling run reads the
+        same table's metadata from several methods.
+        
+        Args:
+            table_ref: Fully qualified project.dataset.table reference
+            
+        Returns:
+            BigQuery table object
+        """
+        table = self._table_metadata_cache.get(table_ref)
+        if table is None:
+            table = self.client.get_table(table_ref)
+            self._table_metadata_cache.set(table_ref, table)
+        return table
+    
+    def _sample_select_list(
+        self,
+        table_ref: str,
+        columns: Optional[List[str]] = None,
+        skip_nested_columns: bool = False
+    ) -> str:
+        """
+        Build the SELECT list for sampling queries.
+        
+        Explicit columns are projected as given. Otherwise every column is
+        selected, unless skip_nested_columns is set, in which case arrays and
+        STRUCT, BYTES and GEOGRAPHY fields are left out; they are rarely useful
+        in samples and dominate the bytes scanned.
+        
+        Args:
+            table_ref: Fully qualified project.dataset.table reference
+            columns: Optional columns to select
+            skip_nested_columns: Whether to drop array, STRUCT, BYTES and GEOGRAPHY columns
+            
+        Returns:
+            Comma-separated quoted column names, or * for all columns
+        """
+        if columns is None:
+            if not skip_nested_columns:
+                return "*"
+            try:
+                columns = [
+                    field.name for field in self._get_table_cached(table_ref).schema
+                    if field.mode != 'REPEATED' and field.field_type not in SAMPLE_EXCLUDED_TYPES
+                ]
+            except Exception as e:
+                logger.warning(f"Could not read columns of {table_ref}, sampling all columns: {str(e)}")
+                return "*"
+        
+        if not columns:
+            return "*"
+        for column in columns:
+            if '`' in column:
+                raise ValueError(f"Invalid column name: {column}")
+        return ", ".join(f"`{column}`" for column in columns)
+    
+    def _fetch_rows(self, query: str, query_parameters: Optional[List[Any]] = None) -> List[Dict]:
+        """
+        Run a query and return its rows as dictionaries.
+        
+        Args:
+            query: SQL query
+            query_parameters: Optional bound query parameters
+            
+        Returns:
+            List of row dictionaries
+        """
+        job_config = QueryJobConfig(query_parameters=query_parameters or [])
+        return self._result_rows(self.client.query(query, job_config=job_config).result())
+    
+    def _get_bqstorage_client(self):
+        """Create the Storage Read API client on first use, with the credentials the query client was given."""
+        if not HAS_BQ_STORAGE:
+            return None
+        if self._bqstorage_client is None:
+            self._bqstorage_client = bigquery_storage.BigQueryReadClient(credentials=self._credentials)
+        return self._bqstorage_client
+    
+    def _result_rows(self, results) -> List[Dict]:
+        """
+        Convert query results to row dictionaries.
+        
+        Large results are streamed as Arrow through the Storage Read API,
+        which decodes columns far faster than row-by-row REST paging; small
+        results, or a missing or failing storage client, use plain iteration.
+        
+        Args:
+            results: RowIterator returned by QueryJob.result()
+            
+        Returns:
+            List of row dictionaries
+        """
+        cells = (results.total_rows or 0) * len(results.schema or [])
+        if cells > ARROW_MIN_CELLS:
+            try:
+                bqstorage_client = self._get_bqstorage_client()
+                if bqstorage_client is not None:
+                    return results.to_arrow(bqstorage_client=bqstorage_client).to_pylist()
+            except Exception as e:
+                logger.warning(f"Storage Read API unavailable, paging results instead: {str(e)}")
+        return [dict(row) for row in results]
+    
+    def _random_sample_query(self, table_ref: str, select_list: str, limit: int) -> str:
+        """
+        Build a query returning roughly limit random rows of a table.
+        
+        TABLESAMPLE SYSTEM reads only a percentage of storage blocks, so the
+        percentage is sized from the table's row count to cover the rows
+        wanted. Small tables, or tables whose size is unknown, are shuffled
+        with ORDER BY RAND() instead.
+        
+        Args:
+            table_ref: Fully qualified project.dataset.table reference
+            select_list: Columns to select
+            limit: Number of rows wanted
+            
+        Returns:
+            SQL query
+        """
+        try:
+            num_rows = self._get_table_cached(table_ref).num_rows
+        except Exception as e:
+            logger.warning(f"Could not read row count of {table_ref}: {str(e)}")
+            num_rows = None
+        
+        if not num_rows or num_rows < TABLESAMPLE_MIN_ROWS:
+            return f"""
+                SELECT {select_list} FROM `{table_ref}`
+                ORDER BY RAND()
+                LIMIT {limit}
+            """
+        
+        sample_percentage = max(0.01, min(99.0, limit * 100.0 / num_rows))
+        return f"""
+            SELECT {select_list} FROM `{table_ref}`
+            TABLESAMPLE SYSTEM ({sample_percentage:.4g} PERCENT)
+            LIMIT {limit}
+        """
+    
+    @staticmethod
+    def _partition_date_filter(
+        partition_column: str,
+        column_type: Optional[str],
+        partition_dates: List[Any],
+        query_parameters: List[Any]
+    ) -> str:
+        """
+        Build a prunable filter selecting the given daily partitions.
+        
+        The bare partition column is compared with a half-open range over the
+        selected days, which BigQuery uses to prune partitions; wrapping the
+        column in DATE() can defeat pruning on TIMESTAMP columns. When the
+        days are not contiguous an IN UNNEST check narrows the range to them.
+        
+        Args:
+            partition_column: Name of the partitioning column
+            column_type: BigQuery type of the column (DATE, TIMESTAMP or DATETIME)
+            partition_dates: Partition days to select
+            query_parameters: Parameter list the filter's bound values are appended to
+            
+        Returns:
+            SQL predicate
+        """
+        days = sorted(set(partition_dates))
+        lower, upper = days[0], days[-1] + timedelta(days=1)
+        if column_type == 'DATE':
+            bounds = ('DATE', lower, upper)
+        elif column_type == 'TIMESTAMP':
+            bounds = ('TIMESTAMP',
+                      datetime.combine(lower, time(), tzinfo=timezone.utc),
+                      datetime.combine(upper, time(), tzinfo=timezone.utc))
+        elif column_type == 'DATETIME':
+            bounds = ('DATETIME', datetime.combine(lower, time()), datetime.combine(upper, time()))
+        else:
+            query_parameters.append(bigquery.ArrayQueryParameter("partition_dates", "DATE", days))
+            return f"DATE(`{partition_column}`) IN UNNEST(@partition_dates)"
+        
+        param_type, lower_value, upper_value = bounds
+        query_parameters.append(bigquery.ScalarQueryParameter("partition_lower", param_type, lower_value))
+        query_parameters.append(bigquery.ScalarQueryParameter("partition_upper", param_type, upper_value))
+        predicate = f"`{partition_column}` >= @partition_lower AND `{partition_column}` < @partition_upper"
+        if (days[-1] - days[0]).days + 1 != len(days):
+            query_parameters.append(bigquery.ArrayQueryParameter("partition_dates", "DATE", days))
+            predicate += f" AND DATE(`{partition_column}`) IN UNNEST(@partition_dates)"
+        return f"({predicate})"
+    
     def get_partition_info(self, table_name: str, schema_name: str = None) -> Dict[str, Any]:
         """
         Get partition information for a BigQuery table.
@@ -125,12 +348,13 @@ class BigQueryHandler(DatabaseHandler):
             table_ref = f"{resolved_project}.{dataset_id}.{table_name}"
             
             # Get table metadata
-            table = self.client.get_table(table_ref)
+            table = self._get_table_cached(table_ref)
             
             partition_info = {
                 "is_partitioned": False,
                 "partition_type": None,
                 "partition_column": None,
+                "partition_column_type": None,
                 "clustering_fields": [],
                 "available_partitions": []
             }
@@ -140,19 +364,26 @@ class BigQueryHandler(DatabaseHandler):
                 partition_info["is_partitioned"] = True
                 partition_info["partition_type"] = table.time_partitioning.type_
                 partition_info["partition_column"] = table.time_partitioning.field
+                partition_info["partition_column_type"] = next(
+                    (field.field_type for field in table.schema if field.name == table.time_partitioning.field),
+                    None
+                )
                 
                 # Get available partitions from INFORMATION_SCHEMA
                 partitions_query = f"""
                     SELECT partition_id, total_rows, total_logical_bytes
                     FROM `{resolved_project}.{dataset_id}.INFORMATION_SCHEMA.PARTITIONS`
-                    WHERE table_name = '{table_name}'
+                    WHERE table_name = @table_name
                     AND partition_id IS NOT NULL
                     AND partition_id != '__NULL__'
                     ORDER BY partition_id DESC
                     LIMIT 100
                 """
                 
-                query_job = self.client.query(partitions_query)
+                job_config = QueryJobConfig(query_parameters=[
+                    bigquery.ScalarQueryParameter("table_name", "STRING", table_name)
+                ])
+                query_job = self.client.query(partitions_query, job_config=job_config)
                 results = query_job.result()
                 
                 partition_info["available_partitions"] = [
@@ -180,7 +411,9 @@ class BigQueryHandler(DatabaseHandler):
         schema_name: str = None,
         sample_size: int = 100,
         num_samples: int = 5,
-        max_partitions: int = 10
+        max_partitions: int = 10,
+        columns: Optional[List[str]] = None,
+        skip_nested_columns: bool = False
     ) -> List[Dict]:
         """
         Get sample data from partitioned table with partition pruning.
@@ -191,6 +424,9 @@ class BigQueryHandler(DatabaseHandler):
             sample_size: Size of each sample
             num_samples: Number of samples to take
             max_partitions: Maximum number of partitions to sample from
+            columns: Columns to sample; defaults to all columns
+            skip_nested_columns: When no columns are given, leave out array, STRUCT,
+                BYTES and GEOGRAPHY columns to cut the bytes scanned
             
         Returns:
             List of sample records
@@ -206,17 +442,15 @@ class BigQueryHandler(DatabaseHandler):
             
             # Get partition information
             partition_info = self.get_partition_info(table_name, schema_name)
+            select_list = self._sample_select_list(table_ref, columns, skip_nested_columns)
+            # Values are bound as parameters so the SQL text stays stable and cacheable
+            query_parameters = []
+            # Table-decorator samples run as one job per partition
+            partition_queries = []
             
             if not partition_info["is_partitioned"]:
                 # Non-partitioned table - use standard sampling
-                # Use a reasonable sample percentage (1-10%) or fallback to LIMIT
-                sample_percentage = min(10, max(1, sample_size * num_samples / 1000))
-                
-                query = f"""
-                    SELECT * FROM `{table_ref}`
-                    TABLESAMPLE SYSTEM ({sample_percentage} PERCENT)
-                    LIMIT {sample_size * num_samples}
-                """
+                query = self._random_sample_query(table_ref, select_list, sample_size * num_samples)
             else:
                 # Partitioned table - sample from recent partitions
                 available_partitions = partition_info["available_partitions"]
@@ -239,38 +473,47 @@ class BigQueryHandler(DatabaseHandler):
                 partition_column = partition_info["partition_column"]
                 if partition_column:
                     # Use partition column for filtering
-                    partition_filters = []
+                    partition_dates = []
+                    partition_ids = []
                     for partition in recent_partitions[:num_samples]:
                         partition_id = partition["partition_id"]
                         if partition_id.isdigit() and len(partition_id) == 8:
                             # Date partition (YYYYMMDD)
-                            date_str = f"{partition_id[:4]}-{partition_id[4:6]}-{partition_id[6:8]}"
-                            partition_filters.append(f"DATE({partition_column}) = '{date_str}'")
+                            partition_dates.append(datetime.strptime(partition_id, "%Y%m%d").date())
                         else:
                             # Other partition types
-                            partition_filters.append(f"{partition_column} = '{partition_id}'")
+                            partition_ids.append(partition_id)
                     
+                    partition_filters = []
+                    if partition_dates:
+                        partition_filters.append(self._partition_date_filter(
+                            partition_column, partition_info.get("partition_column_type"),
+                            partition_dates, query_parameters
+                        ))
+                    if partition_ids:
+                        partition_filters.append(f"CAST(`{partition_column}` AS STRING) IN UNNEST(@partition_ids)")
+                        query_parameters.append(bigquery.ArrayQueryParameter("partition_ids", "STRING", partition_ids))
                     where_clause = " OR ".join(partition_filters)
                     query = f"""
-                        SELECT * FROM `{table_ref}`
+                        SELECT {select_list} FROM `{table_ref}`
                         WHERE {where_clause}
                         LIMIT {sample_size * num_samples}
                     """
                 else:
                     # Use table decorators for specific partitions
-                    partition_queries = []
                     for partition in recent_partitions[:num_samples]:
                         partition_id = partition["partition_id"]
                         partition_queries.append(f"""
-                            SELECT * FROM `{table_ref}${partition_id}`
+                            SELECT {select_list} FROM `{table_ref}${partition_id}`
                             LIMIT {sample_size}
                         """)
                     
+                    # The union is only dry-run, to estimate the combined cost
                     query = " UNION ALL ".join(partition_queries)
             
             # Execute query with cost estimation
             try:
-                job_config = QueryJobConfig(dry_run=True)
+                job_config = QueryJobConfig(dry_run=True, query_parameters=query_parameters)
                 dry_run_job = self.client.query(query, job_config=job_config)
                 
                 # Check estimated cost
@@ -292,8 +535,13 @@ class BigQueryHandler(DatabaseHandler):
             
             # Execute actual query
             try:
-                query_job = self.client.query(query)
-                results = query_job.result()
+                if partition_queries:
+                    # Independent jobs overlap their submission and result latencies
+                    with concurrent.futures.ThreadPoolExecutor(max_workers=len(partition_queries)) as executor:
+                        partition_rows = list(executor.map(self._fetch_rows, partition_queries))
+                    sample_data = list(itertools.chain.from_iterable(partition_rows))
+                else:
+                    sample_data = self._fetch_rows(query, query_parameters)
             except Exception as e:
                 if "does not have bigquery.jobs.create permission" in str(e):
                     logger.warning(f"Cannot retrieve sample data from {table_name}: No permission to create jobs in project {self.project_id}. For public datasets, you need to provide your own project for running queries.")
@@ -301,11 +549,6 @@ class BigQueryHandler(DatabaseHandler):
                 else:
                     raise
             
-            # Convert to list of dictionaries
-            sample_data = []
-            for row in results:
-                sample_data.append(dict(row))
-            
             logger.info(f"Retrieved {len(sample_data)} sample records from {table_name}")
             return sample_data
             
@@ -324,7 +567,7 @@ class BigQueryHandler(DatabaseHandler):
             resolved_project = self._resolve_dataset_project(dataset_id)
             table_ref = f"{resolved_project}.{dataset_id}.{table_name}"
             
-            table = self.client.get_table(table_ref)
+            table = self._get_table_cached(table_ref)
             
             schema = {}
             for field in table.schema:
@@ -364,7 +607,7 @@ class BigQueryHandler(DatabaseHandler):
             resolved_project = self._resolve_dataset_project(dataset_id)
             table_ref = f"{resolved_project}.{dataset_id}.{table_name}"
             
-            table = self.client.get_table(table_ref)
+            table = self._get_table_cached(table_ref)
             
             columns = []
             for field in table.schema:
@@ -549,7 +792,7 @@ class BigQueryHandler(DatabaseHandler):
             
             if use_estimation:
                 # Use table metadata for fast estimation
-                table = self.client.get_table(table_ref)
+                table = self._get_table_cached(table_ref)
                 return table.num_rows
             else:
                 # Exact count (expensive for large tables)
@@ -602,7 +845,7 @@ class BigQueryHandler(DatabaseHandler):
             query_job = self.client.query(query)
             results = query_job.result()
             
-            return [dict(row) for row in results]
+            return self._result_rows(results)
             
         except Exception as e:
             logger.error(f"Error executing BigQuery query: {str(e)}")
@@ -623,6 +866,9 @@ class BigQueryHandler(DatabaseHandler):
         # BigQuery clients are designed to be reused and closed only when truly done
         if hasattr(self, '_force_close') and self._force_close and self.client:
             self.client.close()
+            if self._bqstorage_client is not None:
+                self._bqstorage_client.transport.close()
+                self._bqstorage_client = None
             logger.info(f"Closed BigQuery connection to project: {self.project_id}")
         else:
             # Just log that we're keeping the connection alive for reuse
@@ -647,7 +893,7 @@ class BigQueryHandler(DatabaseHandler):
             resolved_project = self._resolve_dataset_project(dataset_id)
             table_ref = f"{resolved_project}.{dataset_id}.{table_name}"
             
-            table = self.client.get_table(table_ref)
+            table = self._get_table_cached(table_ref)
             
             indexes = []
             
@@ -698,14 +944,7 @@ class BigQueryHandler(DatabaseHandler):
                 return self.get_partition_aware_sample(table_name, schema_name, limit, 1)
             else:
                 # Use regular sampling for non-partitioned tables
-                # Use a reasonable sample percentage
-                sample_percentage = min(10, max(1, limit / 1000))
-                
-                query = f"""
-                    SELECT * FROM `{table_ref}`
-                    TABLESAMPLE SYSTEM ({sample_percentage} PERCENT)
-                    LIMIT {limit}
-                """
+                query = self._random_sample_query(table_ref, "*", limit)
                 
                 # Check query cost first
                 safe, message = self.check_query_cost(query, table_name, schema_name)
@@ -724,9 +963,7 @@ class BigQueryHandler(DatabaseHandler):
                     else:
                         raise
                 
-                sample_data = []
-                for row in results:
-                    sample_data.append(dict(row))
+                sample_data = self._result_rows(results)
                 
                 logger.info(f"Retrieved {len(sample_data)} sample records from {table_name}")
                 return sample_data
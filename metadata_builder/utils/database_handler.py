@@ -1,9 +1,8 @@
 import json
 import logging
 import re
-import weakref
 from typing import Dict, Any, List, Tuple, Optional, Union
-from sqlalchemy import text, create_engine
+from sqlalchemy import text, create_engine, bindparam
 from sqlalchemy.sql.elements import TextClause
 from sqlalchemy.pool import QueuePool
 from ..config.config import get_db_connection_string, get_db_config, load_config
@@ -169,6 +168,14 @@ class DatabaseHandler:
             self._engine = None
         self.connection = None
 
+    def release(self) -> None:
+        """Release the handler's connection once the caller is done with it.
+        
+        Pooled handlers return the connection to their shared pool; the base
+        implementation simply closes.
+        """
+        self.close()
+
     def __del__(self):
         """Cleanup when object is destroyed"""
         self.close()
@@ -245,6 +252,61 @@ class DatabaseHandler:
             logger.error(f"Error getting table schema: {str(e)}")
             return {}
 
+    def _supports_information_schema(self) -> bool:
+        """Whether batched information_schema queries can be used for this database"""
+        try:
+            engine = self.engine
+        except ValueError:
+            return False
+        return engine is not None and engine.dialect.name not in ('sqlite', 'oracle')
+
+    def get_tables_schemas(self, table_names: List[str], schema_name: str = None) -> Dict[str, Dict[str, str]]:
+        """
+        Get schemas for several tables in a single round trip.
+        
+        Falls back to one get_table_schema call per table on databases
+        without information_schema.
+        
+        Args:
+            table_names: Names of the tables
+            schema_name: Optional schema name
+            
+        Returns:
+            Dictionary mapping table name to its {column: data_type} schema
+        """
+        for table_name in table_names:
+            if not _validate_sql_identifier(table_name):
+                raise ValueError(f"Invalid table name: {table_name}")
+        if schema_name and not _validate_sql_identifier(schema_name):
+            raise ValueError(f"Invalid schema name: {schema_name}")
+        
+        if not table_names:
+            return {}
+        if not self._supports_information_schema():
+            return {table_name: self.get_table_schema(table_name, schema_name) for table_name in table_names}
+        
+        try:
+            query = """
+                SELECT table_name AS table_name, column_name AS column_name, data_type AS data_type
+                FROM information_schema.columns
+                WHERE table_name IN :table_names
+            """
+            params = {"table_names": list(table_names)}
+            if schema_name:
+                query += " AND table_schema = :schema_name"
+                params["schema_name"] = schema_name
+            query += " ORDER BY table_name, ordinal_position"
+            
+            statement = text(query).bindparams(bindparam("table_names", expanding=True))
+            schemas = {table_name: {} for table_name in table_names}
+            for row in self.fetch_all(statement, params):
+                schemas.setdefault(row['table_name'], {})[row['column_name']] = row['data_type']
+            return schemas
+        
+        except Exception as e:
+            logger.error(f"Error getting table schemas: {str(e)}")
+            return {table_name: {} for table_name in table_names}
+
     def get_table_data(self, table_name: str, limit: int = None, offset: int = None) -> List[Dict]:
         """Get table data with optional pagination"""
         raise NotImplementedError
@@ -303,6 +365,55 @@ class DatabaseHandler:
             # Return empty list instead of raising error
             return []
 
+    def get_primary_keys_for_tables(self, table_names: List[str], schema_name: str = None) -> Dict[str, List[str]]:
+        """
+        Get primary key columns for several tables in a single round trip.
+        
+        Args:
+            table_names: Names of the tables
+            schema_name: Optional schema name
+            
+        Returns:
+            Dictionary mapping table name to its primary key column names
+        """
+        for table_name in table_names:
+            if not _validate_sql_identifier(table_name):
+                raise ValueError(f"Invalid table name: {table_name}")
+        if schema_name and not _validate_sql_identifier(schema_name):
+            raise ValueError(f"Invalid schema name: {schema_name}")
+        
+        if not table_names:
+            return {}
+        if not self._supports_information_schema():
+            return {table_name: self.get_primary_keys(table_name, schema_name) for table_name in table_names}
+        
+        try:
+            query = """
+                SELECT tc.table_name AS table_name, kcu.column_name AS column_name
+                FROM information_schema.table_constraints AS tc
+                JOIN information_schema.key_column_usage AS kcu
+                ON tc.constraint_name = kcu.constraint_name
+                AND tc.table_schema = kcu.table_schema
+                AND tc.table_name = kcu.table_name
+                WHERE tc.table_name IN :table_names
+                AND tc.constraint_type = 'PRIMARY KEY'
+            """
+            params = {"table_names": list(table_names)}
+            if schema_name:
+                query += " AND tc.table_schema = :schema_name"
+                params["schema_name"] = schema_name
+            query += " ORDER BY tc.table_name, kcu.ordinal_position"
+            
+            statement = text(query).bindparams(bindparam("table_names", expanding=True))
+            primary_keys = {table_name: [] for table_name in table_names}
+            for row in self.fetch_all(statement, params):
+                primary_keys.setdefault(row['table_name'], []).append(row['column_name'])
+            return primary_keys
+        
+        except Exception as e:
+            logger.error(f"Error getting primary keys for tables {table_names}: {str(e)}")
+            return {table_name: [] for table_name in table_names}
+
     def get_table_constraints(self, table_name: str, schema_name: str = 'public') -> Dict[str, Any]:
         """Base method for getting table constraints"""
         raise NotImplementedError
@@ -331,6 +442,30 @@ class DatabaseHandler:
         """
         raise NotImplementedError("Each database handler must implement get_table_indexes")
 
+    def _quote_table_ref(self, table_name: str, schema_name: str = None) -> str:
+        """
+        Build a schema-qualified table reference quoted for this database's dialect.
+        
+        Names are only quoted when the dialect requires it (reserved words,
+        mixed case), so plain lowercase names are left as written.
+        
+        Args:
+            table_name: Table name
+            schema_name: Optional schema name
+            
+        Returns:
+            Table reference safe to interpolate into SQL
+        """
+        try:
+            preparer = self.engine.dialect.identifier_preparer
+        except (ValueError, AttributeError):
+            preparer = None
+        if preparer is None:
+            return f"{schema_name}.{table_name}" if schema_name else table_name
+        if schema_name:
+            return f"{preparer.quote_schema(schema_name)}.{preparer.quote(table_name)}"
+        return preparer.quote(table_name)
+
     def get_row_count(self, table_name: str, schema_name: str = None, use_estimation: bool = True) -> Optional[int]:
         # Validate inputs
         if not _validate_sql_identifier(table_name):
@@ -341,7 +476,7 @@ class DatabaseHandler:
         try:
             # For now, let's use the simple and reliable exact count method
             # The estimation methods can be added back later once parameter binding is fixed
-            table_ref = f"{schema_name}.{table_name}" if schema_name else table_name
+            table_ref = self._quote_table_ref(table_name, schema_name)
             count_sql = f"SELECT COUNT(*) as count FROM {table_ref}"
             result = self.fetch_one(count_sql)
             return int(result['count']) if result else None
@@ -350,6 +485,115 @@ class DatabaseHandler:
             logger.warning(f"Error getting row count for table {table_name}: {str(e)}")
             return None
 
+    def get_schema_bulk_stats(self, schema_name: str, table_names: List[str] = None) -> Dict[str, Dict[str, Optional[int]]]:
+        """
+        Get column counts and approximate row counts for a schema's tables in one round trip.
+
+        Row counts come from catalog statistics (pg_class.reltuples, or
+        pg_stat_user_tables.n_live_tup for tables never analyzed, on
+        PostgreSQL, information_schema.tables.table_rows on MySQL,
+        sys.dm_db_partition_stats on SQL Server) rather than COUNT(*), so no
+        table is scanned. They are None where the database
+        keeps no estimate. Databases without information_schema fall back to
+        one get_table_schema call per table.
+
+        Args:
+            schema_name: Schema name
+            table_names: Optional tables to restrict the result to
+
+        Returns:
+            Dictionary mapping table name to {'columns': int, 'rows': Optional[int]}
+        """
+        if not _validate_sql_identifier(schema_name):
+            raise ValueError(f"Invalid schema name: {schema_name}")
+        if table_names is not None:
+            for table_name in table_names:
+                if not _validate_sql_identifier(table_name):
+                    raise ValueError(f"Invalid table name: {table_name}")
+            if not table_names:
+                return {}
+
+        if not self._supports_information_schema():
+            return {
+                table_name: {'columns': len(self.get_table_schema(table_name, schema_name)), 'rows': None}
+                for table_name in (table_names if table_names is not None else self.get_database_tables(schema_name))
+            }
+
+        dialect = self.engine.dialect.name
+        column_counts = """
+            SELECT table_name AS table_name, COUNT(*) AS column_count
+            FROM information_schema.columns
+            WHERE table_schema = :schema_name
+            GROUP BY table_name
+        """
+        if dialect == 'postgresql':
+            # Tables never analyzed have reltuples = -1; the statistics collector's live tuple count covers those
+            query = f"""
+                SELECT c.relname AS table_name,
+                       CASE WHEN c.reltuples >= 0 THEN c.reltuples::bigint ELSE st.n_live_tup END AS row_count,
+                       COALESCE(cols.column_count, 0) AS column_count
+                FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                LEFT JOIN pg_stat_user_tables st ON st.relid = c.oid
+                LEFT JOIN ({column_counts}) cols ON cols.table_name = c.relname
+                WHERE n.nspname = :schema_name AND c.relkind IN ('r', 'p')
+            """
+            table_column = "c.relname"
+        elif dialect == 'mysql':
+            query = f"""
+                SELECT t.table_name AS table_name, t.table_rows AS row_count,
+                       COALESCE(cols.column_count, 0) AS column_count
+                FROM information_schema.tables t
+                LEFT JOIN ({column_counts}) cols ON cols.table_name = t.table_name
+                WHERE t.table_schema = :schema_name
+            """
+            table_column = "t.table_name"
+        elif dialect == 'mssql':
+            # Heap (0) or clustered index (1) partitions hold each row exactly once
+            query = f"""
+                SELECT t.name AS table_name, ps.row_count AS row_count,
+                       COALESCE(cols.column_count, 0) AS column_count
+                FROM sys.tables t
+                JOIN sys.schemas s ON s.schema_id = t.schema_id
+                LEFT JOIN (
+                    SELECT object_id, SUM(row_count) AS row_count
+                    FROM sys.dm_db_partition_stats
+                    WHERE index_id IN (0, 1)
+                    GROUP BY object_id
+                ) ps ON ps.object_id = t.object_id
+                LEFT JOIN ({column_counts}) cols ON cols.table_name = t.name
+                WHERE s.name = :schema_name
+            """
+            table_column = "t.name"
+        else:
+            query = f"""
+                SELECT cols.table_name AS table_name, NULL AS row_count, cols.column_count AS column_count
+                FROM ({column_counts}) cols
+                WHERE 1 = 1
+            """
+            table_column = "cols.table_name"
+
+        params = {"schema_name": schema_name}
+        statement = text(query)
+        if table_names is not None:
+            statement = text(query + f" AND {table_column} IN :table_names").bindparams(
+                bindparam("table_names", expanding=True)
+            )
+            params["table_names"] = list(table_names)
+
+        try:
+            stats = {}
+            for row in self.fetch_all(statement, params):
+                row_count = row['row_count']
+                # Missing or negative estimates mean the database keeps no figure for the table
+                rows = int(row_count) if row_count is not None and row_count >= 0 else None
+                stats[row['table_name']] = {'columns': int(row['column_count']), 'rows': rows}
+            return stats
+
+        except Exception as e:
+            logger.error(f"Error getting schema statistics for {schema_name}: {str(e)}")
+            return {}
+
     def check_query_cost(self, query: str, table_name: str, schema_name: str = None) -> Tuple[bool, str]:
         """
         Check if a query would be too costly to execute by analyzing the execution plan.
@@ -369,8 +613,10 @@ class DatabaseHandler:
 class SQLAlchemyHandler(DatabaseHandler):
     """SQLAlchemy implementation of DatabaseHandler"""
     
-    # Use weak references to prevent memory leaks
-    _engines = weakref.WeakValueDictionary()
+    # Engines (and their connection pools) are shared per database for the life
+    # of the process so handlers can check connections in and out cheaply.
+    # Call dispose_pools() to tear them down.
+    _engines: Dict[str, Any] = {}
     _connection_count = {}
     _max_connections_per_db = 5  # Limit concurrent connections per database
     
@@ -396,6 +642,45 @@ class SQLAlchemyHandler(DatabaseHandler):
             self._engines[self.db_name] = value
             self._connection_count[self.db_name] = self._connection_count.get(self.db_name, 0) + 1
 
+    @staticmethod
+    def _engine_args(db_config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build create_engine arguments for a database's shared connection pool.
+        
+        Pool sizing defaults can be overridden per database with a ``pool``
+        section in its configuration (pool_size, max_overflow, pool_timeout,
+        pool_recycle).
+        
+        Args:
+            db_config: Database configuration
+            
+        Returns:
+            Keyword arguments for create_engine
+        """
+        # Reduced pool sizes to limit connections
+        engine_args = {
+            'poolclass': QueuePool,
+            'pool_size': 3,  # Reduced from 20
+            'max_overflow': 2,  # Reduced from 10
+            'pool_timeout': 30,
+            'pool_recycle': 1800,
+            'pool_pre_ping': True
+        }
+        pool_config = db_config.get('pool') or {}
+        for key in ('pool_size', 'max_overflow', 'pool_timeout', 'pool_recycle'):
+            if key in pool_config:
+                engine_args[key] = pool_config[key]
+        
+        # Add SQLite-specific configuration
+        if db_config.get('type') == 'sqlite':
+            engine_args.update({
+                'connect_args': {
+                    'timeout': 30,  # Connection timeout in seconds
+                    'check_same_thread': False  # Allow multi-threading
+                }
+            })
+        return engine_args
+
     def connect(self, db_name: str = None) -> None:
         if db_name:
             self.db_name = db_name
@@ -419,24 +704,7 @@ class SQLAlchemyHandler(DatabaseHandler):
                     config = load_config()
                     sqlite_config = config.get('sqlite', {})
                 
-                # Reduced pool sizes to limit connections
-                engine_args = {
-                    'poolclass': QueuePool,
-                    'pool_size': 3,  # Reduced from 20
-                    'max_overflow': 2,  # Reduced from 10
-                    'pool_timeout': 30,
-                    'pool_recycle': 1800,
-                    'pool_pre_ping': True
-                }
-                
-                # Add SQLite-specific configuration
-                if db_config.get('type') == 'sqlite':
-                    engine_args.update({
-                        'connect_args': {
-                            'timeout': 30,  # Connection timeout in seconds
-                            'check_same_thread': False  # Allow multi-threading
-                        }
-                    })
+                engine_args = self._engine_args(db_config)
                 
                 # Create the engine
                 engine = create_engine(
@@ -486,24 +754,7 @@ class SQLAlchemyHandler(DatabaseHandler):
                     config = load_config()
                     sqlite_config = config.get('sqlite', {})
                 
-                # Reduced pool sizes to limit connections
-                engine_args = {
-                    'poolclass': QueuePool,
-                    'pool_size': 3,  # Reduced from 20
-                    'max_overflow': 2,  # Reduced from 10
-                    'pool_timeout': 30,
-                    'pool_recycle': 1800,
-                    'pool_pre_ping': True
-                }
-                
-                # Add SQLite-specific configuration
-                if db_config.get('type') == 'sqlite':
-                    engine_args.update({
-                        'connect_args': {
-                            'timeout': 30,  # Connection timeout in seconds
-                            'check_same_thread': False  # Allow multi-threading
-                        }
-                    })
+                engine_args = self._engine_args(db_config)
                 
                 # Create the engine
                 engine = create_engine(
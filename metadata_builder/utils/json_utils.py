@@ -0,0 +1,99 @@
+"""JSON serialization helpers with optional orjson acceleration."""
+
+import base64
+import gzip
+import json
+import logging
+from typing import Any
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+logger = logging.getLogger(__name__)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Uses orjson when it is installed and falls back to the standard library
+    otherwise. Values that are not natively serializable are converted with
+    str(), and output is compact unless indent is requested.
+
+    Args:
+        obj: Object to serialize
+        indent: Whether to pretty-print with two-space indentation
+
+    Returns:
+        JSON string
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=str, option=option).decode("utf-8")
+        except TypeError as e:
+            # e.g. integers beyond 64 bits; the stdlib encoder handles these
+            logger.debug(f"orjson could not serialize object, falling back to json: {str(e)}")
+
+    if indent:
+        return json.dumps(obj, indent=2, default=str)
+    return json.dumps(obj, separators=(",", ":"), default=str)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    Serialize an object to compact UTF-8 JSON bytes.
+
+    orjson produces bytes natively, so writers that need bytes (HTTP bodies,
+    compression) skip the str round trip that dumps() would add.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError as e:
+            logger.debug(f"orjson could not serialize object, falling back to json: {str(e)}")
+    return json.dumps(obj, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def dumps_compressed(obj: Any) -> str:
+    """
+    Serialize an object to gzip-compressed JSON, base64-encoded for text transports.
+
+    Uses the fastest gzip level; on large metadata payloads it still shrinks
+    the output several times over at little CPU cost.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        Base64 text of the gzipped compact JSON
+    """
+    return gzip_base64(dumps_bytes(obj))
+
+
+def gzip_base64(payload: bytes) -> str:
+    """
+    Gzip already-serialized JSON at the fastest level and base64-encode it.
+
+    Lets callers that need the JSON text anyway compress it without
+    serializing the object a second time.
+
+    Args:
+        payload: UTF-8 encoded JSON
+
+    Returns:
+        Base64 text of the gzipped payload
+    """
+    return base64.b64encode(gzip.compress(payload, compresslevel=1)).decode("ascii")
@@ -306,6 +306,9 @@ def compute_data_quality_metrics(df: pd.DataFrame, schema: Dict[str, str]) -> Di
     """
     Compute simplified data quality metrics for a table.
     
+    Null rates, distinct counts and skew are computed for all columns in one
+    vectorized pass over the sample; only the issue checks run per column.
+    
     Args:
         df: DataFrame containing the data
         schema: Dictionary mapping column names to their data types
@@ -315,6 +318,24 @@ def compute_data_quality_metrics(df: pd.DataFrame, schema: Dict[str, str]) -> Di
     """
     metrics = {}
     total_rows = len(df)
+    present = [col for col in schema if col in df.columns]
+    frame = df[present]
+    
+    completeness = (frame.notna().mean() * 100).to_dict() if total_rows else {}
+    try:
+        unique_counts = frame.nunique().to_dict()
+    except TypeError:
+        # Unhashable values (e.g. nested records) in some column; count those individually
+        unique_counts = {}
+        for col in present:
+            try:
+                unique_counts[col] = frame[col].nunique()
+            except TypeError:
+                unique_counts[col] = frame[col].astype(str).nunique()
+    try:
+        skews = frame.select_dtypes(include='number').skew().to_dict()
+    except Exception:
+        skews = {}
     
     for col, dtype in schema.items():
         # Skip if column is not in DataFrame
@@ -328,10 +349,13 @@ def compute_data_quality_metrics(df: pd.DataFrame, schema: Dict[str, str]) -> Di
                 "data_type": dtype
             }
             continue
-            
+        
+        unique_count = int(unique_counts.get(col, 0))
+        col_completeness = round(completeness.get(col, 0.0), 2)
         metrics[col] = {
-            "completeness": round(df[col].notnull().mean() * 100, 2),
-            "uniqueness": round((df[col].nunique() / total_rows * 100), 2),
+            "completeness": col_completeness,
+            "uniqueness": round(unique_count / total_rows * 100, 2) if total_rows else 0,
+            "unique_count": unique_count,
             "common_issues": [],
             "recommendations": [],
             "data_type": dtype
@@ -340,7 +364,7 @@ def compute_data_quality_metrics(df: pd.DataFrame, schema: Dict[str, str]) -> Di
         # Check for common issues
         try:
             # Missing values check
-            null_percent = round((1 - df[col].notnull().mean()) * 100, 2)
+            null_percent = round(100 - col_completeness, 2) if total_rows else 0
             if null_percent > 5:
                 metrics[col]["common_issues"].append(f"High missing values ({null_percent}%)")
                 metrics[col]["recommendations"].append("Investigate source of missing values")
@@ -351,7 +375,7 @@ def compute_data_quality_metrics(df: pd.DataFrame, schema: Dict[str, str]) -> Di
                 metrics[col]["common_issues"].append("Potential primary key (100% unique values)")
                 
             # Low cardinality check
-            if df[col].nunique() <= 5 and total_rows > 100:
+            if unique_count <= 5 and total_rows > 100:
                 values_str = str(sorted(df[col].dropna().unique().tolist()[:10]))
                 metrics[col]["common_issues"].append(f"Low cardinality column with values: {values_str}")
                 
@@ -362,15 +386,10 @@ def compute_data_quality_metrics(df: pd.DataFrame, schema: Dict[str, str]) -> Di
                     metrics[col]["common_issues"].append("Potential data type mismatch: numeric column contains non-numeric values")
                     
             # Check for highly skewed distributions in numeric columns
-            if df[col].dtype.kind in 'ifc':  # Integer, float, complex
-                try:
-                    if df[col].dropna().count() > 0:
-                        skew = df[col].skew()
-                        if abs(skew) > 3:
-                            metrics[col]["common_issues"].append(f"Highly skewed distribution (skew={skew:.2f})")
-                            metrics[col]["recommendations"].append("Consider transformation for analysis")
-                except Exception:
-                    pass
+            skew = skews.get(col)
+            if skew is not None and abs(skew) > 3:
+                metrics[col]["common_issues"].append(f"Highly skewed distribution (skew={skew:.2f})")
+                metrics[col]["recommendations"].append("Consider transformation for analysis")
                 
         except Exception as e:
             logger.warning(f"Error computing data quality metrics for {col}: {str(e)}")
@@ -410,6 +429,47 @@ def extract_constraints(table_name: str, db_name: str, connection_manager=None)
     finally:
         db.close()
 
+def extract_constraints_bulk(
+    table_names: List[str],
+    db_name: str,
+    connection_manager=None,
+    db=None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Extract database constraints for several tables with one query per constraint type.
+    
+    Args:
+        table_names: Names of the tables
+        db_name: Database name
+        connection_manager: Optional connection manager for user/system connections
+        db: Optional already-open database handler to reuse
+        
+    Returns:
+        Dictionary mapping table name to its constraint information
+    """
+    owns_handler = db is None
+    if owns_handler:
+        if connection_manager and connection_manager.connection_exists(db_name):
+            from .database_handlers import get_database_handler
+            db = get_database_handler(db_name, connection_manager)
+        else:
+            from .database_handler import SQLAlchemyHandler  # Import here to avoid circular imports
+            db = SQLAlchemyHandler(db_name)
+    
+    try:
+        primary_keys = db.get_primary_keys_for_tables(table_names)
+        return {
+            table_name: {
+                'primary_keys': primary_keys.get(table_name, []),
+                'foreign_keys': [],
+                'unique_constraints': []
+            }
+            for table_name in table_names
+        }
+    finally:
+        if owns_handler:
+            db.close()
+
 # Export functions for use in other modules
 __all__ = [
     'identify_column_types',
@@ -418,5 +478,6 @@ __all__ = [
     'is_date_like_string',
     'compute_numerical_stats',
     'compute_data_quality_metrics',
-    'extract_constraints'
+    'extract_constraints',
+    'extract_constraints_bulk'
 ] 
\ No newline at end of file
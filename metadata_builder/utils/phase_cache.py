@@ -0,0 +1,139 @@
+"""On-disk cache of intermediate table metadata results, so interrupted runs can resume."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .storage_utils import sanitize_filename
+
+try:
+    import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    blake3 = None
+    HAS_BLAKE3 = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join("~", ".cache", "metadata-builder")
+
+# Artifacts are meant for resuming a recently interrupted run; older ones are regenerated
+DEFAULT_MAX_AGE_SECONDS = 3600
+
+
+def schema_fingerprint(schema: Dict[str, str], options: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Hash a table's column list, plus any phase options, to detect schema drift.
+
+    Uses blake3 when it is installed and falls back to hashlib's blake2b.
+
+    Args:
+        schema: Dictionary mapping column names to data types
+        options: Optional settings that also change the phase result
+
+    Returns:
+        Hex digest of the columns and options
+    """
+    payload = json.dumps([list(schema.items()), options or {}], sort_keys=True, default=str).encode("utf-8")
+    if HAS_BLAKE3:
+        return blake3.blake3(payload).hexdigest()
+    return hashlib.blake2b(payload, digest_size=32).hexdigest()
+
+
+class PhaseCache:
+    """
+    JSON file per pipeline phase under {base_dir}/{db}/{schema}/{table}/{phase}.json.
+
+    Each file stores the fingerprint it was computed against and when it was
+    written; a load only succeeds when the fingerprint still matches and the
+    artifact is younger than max_age_seconds, so a changed column list
+    invalidates every phase of that table and old results are not reused
+    indefinitely.
+    """
+
+    def __init__(
+        self,
+        db_name: str,
+        schema_name: str,
+        table_name: str,
+        base_dir: Optional[str] = None,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS
+    ):
+        """
+        Initialize the cache for one table.
+
+        Args:
+            db_name: Database name
+            schema_name: Schema name
+            table_name: Table name
+            base_dir: Cache root; defaults to METADATA_BUILDER_CACHE_DIR or ~/.cache/metadata-builder
+            max_age_seconds: How long a stored phase result can be resumed from
+        """
+        self.max_age_seconds = max_age_seconds
+        root = base_dir or os.environ.get("METADATA_BUILDER_CACHE_DIR", DEFAULT_CACHE_DIR)
+        self.directory = (
+            Path(root).expanduser()
+            / sanitize_filename(db_name)
+            / sanitize_filename(schema_name)
+            / sanitize_filename(table_name)
+        )
+
+    def _path(self, phase: str) -> Path:
+        return self.directory / f"{phase}.json"
+
+    def load(self, phase: str, fingerprint: str) -> Optional[Any]:
+        """
+        Return a stored phase result if it was computed for this fingerprint
+        within the last max_age_seconds.
+
+        Args:
+            phase: Phase name
+            fingerprint: Current fingerprint from schema_fingerprint()
+
+        Returns:
+            The stored result, or None when missing, stale, expired or unreadable
+        """
+        try:
+            with open(self._path(phase), "r", encoding="utf-8") as f:
+                artifact = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable {phase} artifact in {self.directory}: {str(e)}")
+            return None
+
+        if artifact.get("fingerprint") != fingerprint:
+            return None
+        stored_at = artifact.get("stored_at")
+        if not isinstance(stored_at, (int, float)) or time.time() - stored_at > self.max_age_seconds:
+            return None
+        logger.info(f"Resuming {phase} from {self._path(phase)}")
+        return artifact.get("result")
+
+    def store(self, phase: str, fingerprint: str, result: Any) -> None:
+        """
+        Atomically write a phase result; failures are logged, not raised.
+
+        Args:
+            phase: Phase name
+            fingerprint: Fingerprint the result was computed for
+            result: JSON-serializable phase result
+        """
+        tmp_path = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=self.directory, prefix=f".{phase}-", suffix=".tmp", delete=False
+            ) as f:
+                tmp_path = f.name
+                json.dump({"fingerprint": fingerprint, "stored_at": time.time(), "result": result}, f, default=str)
+            os.replace(tmp_path, self._path(phase))
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not persist {phase} artifact to {self.directory}: {str(e)}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
@@ -0,0 +1,91 @@
+"""Table name search helpers shared by the MCP servers."""
+
+import logging
+import sys
+from typing import Iterable, List, Optional, Tuple
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    ahocorasick = None
+    HAS_AHOCORASICK = False
+
+logger = logging.getLogger(__name__)
+
+
+def build_name_index(tables: Iterable[str]) -> List[Tuple[str, str]]:
+    """
+    Build a search index of table names.
+
+    Names are casefolded once here so searches never lowercase per row, and
+    the originals are interned so names repeated across schemas and
+    databases share one string.
+
+    Args:
+        tables: Table names
+
+    Returns:
+        List of (casefolded name, original name) pairs
+    """
+    return [(table.casefold(), sys.intern(table)) for table in tables]
+
+
+def match_table_names(
+    name_index: List[Tuple[str, str]],
+    query: str,
+    limit: Optional[int] = None
+) -> List[str]:
+    """
+    Find table names matching a search query.
+
+    A single-term query matches names containing it, in index order. A
+    multi-term query matches names containing any of its terms, ranked by
+    how many terms they contain, with names containing the whole query
+    first. Multi-term matching runs in a single pass per name using an
+    Aho-Corasick automaton when pyahocorasick is installed.
+
+    Args:
+        name_index: Index built by build_name_index
+        query: Search query
+        limit: Optional maximum number of names to return
+
+    Returns:
+        Matching original table names
+    """
+    lowered_query = query.casefold()
+    terms = list(dict.fromkeys(lowered_query.split()))
+
+    if len(terms) <= 1:
+        needle = terms[0] if terms else lowered_query
+        matches = [table for lowered, table in name_index if needle in lowered]
+        return matches[:limit] if limit else matches
+
+    phrase = " ".join(terms)
+    full_match_score = len(terms) + 1
+    scored = []
+    if HAS_AHOCORASICK:
+        automaton = ahocorasick.Automaton()
+        for term_index, term in enumerate(terms):
+            automaton.add_word(term, term_index)
+        automaton.make_automaton()
+        for lowered, table in name_index:
+            if phrase in lowered:
+                scored.append((full_match_score, table))
+                continue
+            matched_terms = {term_index for _, term_index in automaton.iter(lowered)}
+            if matched_terms:
+                scored.append((len(matched_terms), table))
+    else:
+        for lowered, table in name_index:
+            if phrase in lowered:
+                scored.append((full_match_score, table))
+                continue
+            score = sum(1 for term in terms if term in lowered)
+            if score:
+                scored.append((score, table))
+
+    # Stable sort keeps index order among equally scored names
+    scored.sort(key=lambda match: match[0], reverse=True)
+    matches = [table for _, table in scored]
+    return matches[:limit] if limit else matches
@@ -1,12 +1,55 @@
 """Token counting utility for LLM requests."""
 
+import functools
 import logging
+import threading
 import time
 from typing import Dict, Any, Optional
 import tiktoken
 
 logger = logging.getLogger(__name__)
 
+# Maps model names to tiktoken encodings
+MODEL_ENCODINGS = {
+    "gpt-3.5-turbo": "cl100k_base",
+    "gpt-3.5-turbo-16k": "cl100k_base",
+    "gpt-4": "cl100k_base",
+    "gpt-4-turbo": "cl100k_base",
+    "gpt-4-turbo-preview": "cl100k_base",
+    "gpt-4-32k": "cl100k_base"
+}
+
+# Texts shorter than this are memoized; longer ones are rarely repeated verbatim
+_MAX_CACHED_TEXT_LENGTH = 4096
+
+
+@functools.lru_cache(maxsize=None)
+def _get_encoding(encoding_name: str) -> "tiktoken.Encoding":
+    """Load a tiktoken encoding once per process.
+
+    Args:
+        encoding_name: The tiktoken encoding to load
+
+    Returns:
+        The encoding
+    """
+    return tiktoken.get_encoding(encoding_name)
+
+
+@functools.lru_cache(maxsize=512)
+def _count_tokens_cached(encoding_name: str, text: str) -> int:
+    """Count tokens for a short text, memoized across calls.
+
+    Args:
+        encoding_name: The tiktoken encoding to use
+        text: The text to count tokens for
+
+    Returns:
+        Token count
+    """
+    return len(_get_encoding(encoding_name).encode(text))
+
+
 class TokenCounter:
     """Counts tokens in LLM requests and responses."""
     
@@ -24,16 +67,9 @@ class TokenCounter:
         }
         self.request_count = 0
         self.start_time = time.time()
+        self._stats_lock = threading.Lock()
         
-        # Maps model names to tiktoken encodings
-        self.model_encodings = {
-            "gpt-3.5-turbo": "cl100k_base",
-            "gpt-3.5-turbo-16k": "cl100k_base",
-            "gpt-4": "cl100k_base",
-            "gpt-4-turbo": "cl100k_base",
-            "gpt-4-turbo-preview": "cl100k_base",
-            "gpt-4-32k": "cl100k_base"
-        }
+        self.model_encodings = MODEL_ENCODINGS
     
     def count_tokens(self, text: str) -> int:
         """Count the number of tokens in a text string.
@@ -46,7 +82,9 @@ class TokenCounter:
         """
         try:
             encoding_name = self.model_encodings.get(self.model, "cl100k_base")
-            encoding = tiktoken.get_encoding(encoding_name)
+            if len(text) < _MAX_CACHED_TEXT_LENGTH:
+                return _count_tokens_cached(encoding_name, text)
+            encoding = _get_encoding(encoding_name)
             token_count = len(encoding.encode(text))
             return token_count
         except Exception as e:
@@ -61,10 +99,11 @@ class TokenCounter:
             prompt_tokens: Tokens used in the prompt
             completion_tokens: Tokens used in the completion
         """
-        self.token_usage["prompt_tokens"] += prompt_tokens
-        self.token_usage["completion_tokens"] += completion_tokens
-        self.token_usage["total_tokens"] += prompt_tokens + completion_tokens
-        self.request_count += 1
+        with self._stats_lock:
+            self.token_usage["prompt_tokens"] += prompt_tokens
+            self.token_usage["completion_tokens"] += completion_tokens
+            self.token_usage["total_tokens"] += prompt_tokens + completion_tokens
+            self.request_count += 1
     
     def get_usage_stats(self) -> Dict[str, Any]:
         """Get token usage statistics.
@@ -59,6 +59,7 @@ echo "💡 Usage Examples:"
 echo "   • Test health: curl http://localhost:$PORT/health"
 echo "   • View docs: open http://localhost:$PORT/docs"
 echo "   • List tools: curl http://localhost:$PORT/tools"
+echo "   • Multiple cores: gunicorn -k uvicorn.workers.UvicornWorker -w \$((2 * \$(nproc) + 1)) metadata_builder.mcp.simple_fastapi_server:app"
 echo ""
 echo "🔧 This is a FastAPI-based MCP-compatible server"
 echo "   ✅ Python 3.9 compatible"
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Tests for single-column metadata generation."""
+
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from metadata_builder.core import generate_table_metadata as gtm
+
+
+SCHEMA = {"order_id": "integer", "status": "varchar", "amount": "numeric"}
+SAMPLE = pd.DataFrame({
+    "order_id": [1, 2, 3, 4],
+    "status": ["open", "closed", "open", "open"],
+    "amount": [10.0, 20.5, 7.25, 3.0],
+})
+
+
+class TestGenerateColumnMetadata:
+    """Test the column-scoped metadata path."""
+
+    def _generate(self, column_name):
+        with patch.object(gtm, "get_table_info_with_better_sampling", return_value=(SCHEMA, SAMPLE)) as table_info, \
+             patch.object(gtm, "extract_constraints", return_value={}), \
+             patch.object(gtm, "extract_categorical_values",
+                          side_effect=lambda df, cols, *args, **kwargs: {col: sorted(df[col].unique()) for col in cols}), \
+             patch.object(gtm, "generate_column_definitions",
+                          side_effect=lambda schema, **kwargs: {
+                              col: {"definition": f"{col} definition", "business_name": col.title()} for col in schema
+                          }) as definitions:
+            metadata = gtm.generate_column_metadata("warehouse", "orders", column_name)
+        assert table_info.call_args.kwargs["columns"] == [column_name]
+        return metadata, definitions
+
+    def test_only_requested_column_is_described(self):
+        """Definitions are generated for the requested column alone."""
+        metadata, definitions = self._generate("status")
+
+        assert list(metadata["columns"]) == ["status"]
+        assert definitions.call_args.kwargs["schema"] == {"status": "varchar"}
+        assert metadata["columns"]["status"]["description"] == "status definition"
+        assert metadata["columns"]["status"]["is_categorical"]
+        assert metadata["categorical_values"] == {"status": ["closed", "open"]}
+        assert "table_insights" not in metadata
+
+    def test_unknown_column_returns_no_columns(self):
+        """A column missing from the table yields empty columns without LLM calls."""
+        metadata, definitions = self._generate("missing")
+
+        assert metadata["columns"] == {}
+        definitions.assert_not_called()
+
+
+class TestColumnSampling:
+    """Test that sampling queries select only the requested columns."""
+
+    def test_random_samples_project_requested_columns(self):
+        db = MagicMock()
+        db.fetch_all.return_value = [{"status": "open"}]
+
+        with patch.object(gtm.random, "sample", return_value=[0]):
+            gtm._random_sampling(db, "orders", "public", 10, 1, row_count=100, columns=["status"])
+
+        assert db.fetch_all.call_args.args[0] == 'SELECT "status" FROM "public"."orders" LIMIT 10 OFFSET 0'
+        assert gtm._select_list(None) == "*"
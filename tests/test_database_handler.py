@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""Tests for database handler SQL helpers."""
+
+from sqlalchemy import create_engine
+
+from metadata_builder.utils.database_handler import DatabaseHandler
+
+
+class TestQuoteTableRef:
+    """Test dialect-aware quoting of table references."""
+
+    def test_reserved_and_mixed_case_names_are_quoted(self):
+        """Names that need quoting are quoted; plain names are left as written."""
+        db = DatabaseHandler()
+        db.engine = create_engine("sqlite://")
+
+        assert db._quote_table_ref("orders") == "orders"
+        assert db._quote_table_ref("order", "main") == 'main."order"'
+        assert db._quote_table_ref("Orders", "public") == 'public."Orders"'
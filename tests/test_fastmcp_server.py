@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Tests for the FastMCP server."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("fastmcp")
+
+from metadata_builder.mcp import fastmcp_server  # noqa: E402
+
+
+TOOL_NAMES = {
+    "get_table_metadata",
+    "search_tables",
+    "analyze_data_quality",
+    "get_schema_overview",
+    "generate_semantic_model",
+    "explain_business_context",
+}
+
+
+def tool_function(server, name):
+    return asyncio.run(server.app.get_tools())[name].fn
+
+
+class TestServerSetup:
+    """Test that the server builds and registers its tools."""
+
+    def test_server_registers_every_tool(self):
+        server = fastmcp_server.MetadataFastMCPServer()
+
+        assert server.get_app() is server.app
+        assert set(asyncio.run(server.app.get_tools())) >= TOOL_NAMES
+
+    def test_handlers_come_from_config_and_are_released(self):
+        db = MagicMock()
+
+        async def use_handler():
+            async with fastmcp_server.pooled_db_handler("sales") as handler:
+                assert handler is db
+
+        with patch.object(fastmcp_server, "get_db_handler", return_value=db) as factory:
+            asyncio.run(use_handler())
+
+        factory.assert_called_once_with("sales")
+        db.release.assert_called_once()
+
+    def test_connection_slots_match_the_pool(self):
+        server = fastmcp_server.MetadataFastMCPServer()
+        configs = {"sales": {"type": "postgresql"}, "ops": {"type": "postgresql", "pool": {"pool_size": 10, "max_overflow": 0}}}
+
+        with patch.object(fastmcp_server, "get_db_config", side_effect=configs.get):
+            assert server._db_slot("sales")._value == 5
+            assert server._db_slot("ops")._value == 10
+            assert server._db_slot("sales") is server._db_slot("sales")
+
+
+class TestTools:
+    """Test tool functions against stubbed database calls."""
+
+    def test_search_tables_formats_matches(self):
+        server = fastmcp_server.MetadataFastMCPServer()
+        server._db_names = ("sales",)
+        found = [{"database": "sales", "table": "orders", "columns": 3,
+                  "match_reason": "Name contains 'orders'", "sample_columns": ["id", "total", "placed_at"]}]
+        search_tables = tool_function(server, "search_tables")
+
+        with patch.object(server, "_search_one_db", return_value=found):
+            text = asyncio.run(search_tables(fastmcp_server.TableSearchRequest(query="orders")))
+
+        assert "sales.orders (3 columns)" in text
+        assert "Columns: id, total, placed_at" in text
+
+    def test_equivalent_queries_share_cached_results(self):
+        server = fastmcp_server.MetadataFastMCPServer()
+        server._db_names = ("sales",)
+        found = [{"database": "sales", "table": "order_items", "match_reason": "Name contains 'order items'"}]
+        search_tables = tool_function(server, "search_tables")
+
+        with patch.object(server, "_search_one_db", return_value=found) as search_one_db:
+            texts = [
+                asyncio.run(search_tables(fastmcp_server.TableSearchRequest(query=query)))
+                for query in ("order items", "  Order   ITEMS ")
+            ]
+
+        search_one_db.assert_called_once_with("sales", "order items", 20)
+        assert texts[0] == texts[1]
+
+    def test_quality_analysis_summarizes_column_metrics(self):
+        server = fastmcp_server.MetadataFastMCPServer()
+        metadata = {"columns": {
+            "id": {"data_quality": {"completeness": 100, "unique_count": 4, "common_issues": []}},
+            "note": {"data_quality": {"completeness": 50, "unique_count": 2,
+                                      "common_issues": ["High missing values (50.0%)"]}},
+        }}
+        analyze_data_quality = tool_function(server, "analyze_data_quality")
+
+        with patch.object(server, "_cached_metadata", return_value=metadata):
+            text = asyncio.run(analyze_data_quality(fastmcp_server.QualityAnalysisRequest(database="sales", table="orders")))
+
+        assert "Overall Quality Score: 75.0/100" in text
+        assert "note: High missing values (50.0%)" in text
+
+
+class TestMetadataCache:
+    """Test reuse of generated table metadata."""
+
+    def test_failed_generations_are_retried(self):
+        server = fastmcp_server.MetadataFastMCPServer()
+        generator = MagicMock(__name__="generate", side_effect=[{"error": "timeout"}, {"columns": {}}])
+
+        with patch.object(server, "_db_slot", return_value=asyncio.Semaphore(1)):
+            first = asyncio.run(server._cached_metadata(generator, db_name="sales", table_name="orders"))
+            second = asyncio.run(server._cached_metadata(generator, db_name="sales", table_name="orders"))
+
+        assert first == {"error": "timeout"}
+        assert second == {"columns": {}}
+        assert generator.call_count == 2
+
+    def test_default_arguments_share_a_cache_entry(self):
+        server = fastmcp_server.MetadataFastMCPServer()
+
+        with patch.object(server, "_run_db", return_value={"columns": {}}) as run_db:
+            asyncio.run(server._cached_metadata(db_name="sales", table_name="orders"))
+            asyncio.run(server._cached_metadata(db_name="sales", table_name="orders",
+                                                schema_name="public", include_data_quality=True))
+
+        run_db.assert_called_once()
+
+    def test_table_resource_reads_through_the_metadata_cache(self):
+        server = fastmcp_server.MetadataFastMCPServer()
+        templates = asyncio.run(server.app.get_resource_templates())
+        read_resource = templates["metadata://databases/{database}/tables/{schema}/{table}"].fn
+        get_table_metadata = tool_function(server, "get_table_metadata")
+        metadata = {"table_name": "orders", "columns": {"id": {"data_type": "integer"}}}
+
+        with patch.object(server, "_run_db", return_value=metadata) as run_db:
+            cold = asyncio.run(read_resource("sales", "public", "orders"))
+            asyncio.run(get_table_metadata(fastmcp_server.TableMetadataRequest(database="sales", table="orders")))
+            warm = asyncio.run(read_resource("sales", "public", "orders"))
+
+        run_db.assert_called_once()
+        assert '"table_name": "orders"' in cold
+        assert warm == cold
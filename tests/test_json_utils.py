@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""Tests for JSON serialization helpers."""
+
+import base64
+import gzip
+import json
+
+from metadata_builder.utils.json_utils import dumps, dumps_bytes, dumps_compressed, gzip_base64
+
+
+class TestJsonUtils:
+    """Test plain and compressed serialization."""
+
+    def test_dumps_indent(self):
+        """Compact output by default, two-space indentation on request."""
+        assert dumps({"a": [1, 2]}) == '{"a":[1,2]}'
+        assert dumps({"a": 1}, indent=True) == '{\n  "a": 1\n}'
+
+    def test_dumps_bytes_matches_dumps(self):
+        """Byte output is the UTF-8 encoding of the compact string output."""
+        payload = {"name": "café", "values": [1, 2.5, None]}
+        assert dumps_bytes(payload) == dumps(payload).encode("utf-8")
+
+    def test_dumps_compressed_round_trip(self):
+        """Compressed output decodes back to the original object."""
+        payload = {"columns": {f"col_{i}": {"data_type": "text"} for i in range(50)}}
+
+        encoded = dumps_compressed(payload)
+
+        assert json.loads(gzip.decompress(base64.b64decode(encoded))) == payload
+        assert len(encoded) < len(dumps(payload))
+        assert gzip.decompress(base64.b64decode(gzip_base64(dumps_bytes(payload)))) == dumps_bytes(payload)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Tests for the LLM client retry policy."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from openai import BadRequestError, RateLimitError
+
+from metadata_builder.core import llm_service
+from metadata_builder.core.llm_service import LLMClient
+
+
+def _api_error(error_class, status_code, headers=None, message="error"):
+    """Build an OpenAI status error around a fake HTTP response."""
+    response = MagicMock(status_code=status_code, headers=headers or {})
+    return error_class(message, response=response, body=None)
+
+
+class TestLLMRetryPolicy:
+    """Test which LLM failures are retried and how long to wait."""
+
+    def test_bad_request_is_not_retried(self):
+        """Request errors such as an over-long prompt fail on the first attempt."""
+        client = MagicMock()
+        client.chat.completions.create.side_effect = _api_error(BadRequestError, 400)
+        llm_client = LLMClient(model="gpt-4", client=client, token_counter=MagicMock())
+
+        with pytest.raises(BadRequestError):
+            llm_client.call_llm("prompt")
+
+        assert client.chat.completions.create.call_count == 1
+
+    def test_rate_limit_honors_retry_after(self):
+        """A rate-limit error waits as long as the server asks, capped at the maximum."""
+        retry_state = MagicMock()
+        retry_state.outcome.exception.return_value = _api_error(RateLimitError, 429, {"retry-after": "2"})
+        assert llm_service._wait_for_retry(retry_state) == 2.0
+
+        retry_state.outcome.exception.return_value = _api_error(RateLimitError, 429, {"retry-after": "600"})
+        assert llm_service._wait_for_retry(retry_state) == llm_service.MAX_RETRY_AFTER_SECONDS
+
+    def test_backoff_without_retry_after_is_bounded(self):
+        """Without a Retry-After header the jittered backoff stays within its cap."""
+        retry_state = MagicMock(attempt_number=10)
+        retry_state.outcome.exception.return_value = _api_error(RateLimitError, 429)
+
+        assert 0 <= llm_service._wait_for_retry(retry_state) <= 9
+
+
+class TestLLMJsonMode:
+    """Test requesting JSON mode for structured responses."""
+
+    @staticmethod
+    def _completion(content):
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        response.choices[0].message.content = content
+        return response
+
+    def test_json_mode_is_requested(self):
+        """call_llm_json asks the API for a JSON object and parses it directly."""
+        client = MagicMock()
+        client.chat.completions.create.return_value = self._completion('{"views": []}')
+        llm_client = LLMClient(model="gpt-4", client=client, token_counter=MagicMock())
+
+        assert llm_client.call_llm_json("Return JSON") == {"views": []}
+        _, kwargs = client.chat.completions.create.call_args
+        assert kwargs["response_format"] == llm_service.JSON_RESPONSE_FORMAT
+
+    def test_falls_back_when_json_mode_rejected(self):
+        """Servers that reject response_format are asked again without it."""
+        client = MagicMock()
+        rejection = _api_error(BadRequestError, 400, message="response_format is not supported")
+        client.chat.completions.create.side_effect = [rejection, self._completion('Here: {"views": [],}')]
+        llm_client = LLMClient(model="local-model", client=client, token_counter=MagicMock())
+
+        assert llm_client.call_llm_json("Return JSON") == {"views": []}
+        assert "response_format" not in client.chat.completions.create.call_args.kwargs
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""Tests for metadata utility functions."""
+
+import pandas as pd
+
+from metadata_builder.utils.metadata_utils import compute_data_quality_metrics
+
+
+class TestComputeDataQualityMetrics:
+    """Test the vectorized data quality metrics."""
+
+    def test_completeness_and_uniqueness(self):
+        """Null rates and distinct counts are reported per column."""
+        df = pd.DataFrame({
+            "id": [1, 2, 3, 4],
+            "status": ["open", None, "open", "closed"],
+        })
+
+        metrics = compute_data_quality_metrics(df, {"id": "integer", "status": "varchar"})
+
+        assert metrics["id"]["completeness"] == 100.0
+        assert metrics["id"]["unique_count"] == 4
+        assert "Potential primary key (100% unique values)" in metrics["id"]["common_issues"]
+        assert metrics["status"]["completeness"] == 75.0
+        assert metrics["status"]["unique_count"] == 2
+        assert metrics["status"]["common_issues"] == ["High missing values (25.0%)"]
+
+    def test_missing_column_and_empty_sample(self):
+        """Columns absent from the sample are flagged and empty samples don't fail."""
+        metrics = compute_data_quality_metrics(pd.DataFrame({"id": []}), {"id": "integer", "gone": "text"})
+
+        assert metrics["id"]["completeness"] == 0
+        assert metrics["id"]["uniqueness"] == 0
+        assert metrics["gone"]["common_issues"] == ["Column not found in sample data"]
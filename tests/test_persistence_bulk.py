@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Tests for bulk persistence of metadata rows."""
+
+import uuid
+from unittest.mock import MagicMock
+
+from metadata_builder.persistence import bulk
+from metadata_builder.persistence.models import ColumnMetadata
+
+
+TABLE_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+
+
+def column_rows(count):
+    return [
+        {"table_id": TABLE_ID, "name": f"col_{i}", "data_type": "integer", "statistics": {"max": i}}
+        for i in range(count)
+    ]
+
+
+def session_for(driver):
+    session = MagicMock()
+    session.get_bind.return_value.dialect.driver = driver
+    return session
+
+
+class TestCopyBuffer:
+    """Test encoding of rows for COPY text format."""
+
+    def test_values_are_escaped_and_json_columns_serialized(self):
+        table = ColumnMetadata.__table__
+        columns = ["name", "description", "is_primary_key", "statistics", "purpose"]
+        row = {"name": "notes", "description": "tab\there\nnew \\ line", "is_primary_key": True,
+               "statistics": {"distinct": 3}, "purpose": None}
+
+        line = bulk.copy_buffer(table, columns, [row]).getvalue()
+
+        assert line == 'notes\ttab\\there\\nnew \\\\ line\tt\t{"distinct":3}\t\\N\n'
+
+
+class TestBulkInsert:
+    """Test the choice between COPY and INSERT."""
+
+    def test_large_postgres_batches_use_copy_with_defaults(self):
+        session = session_for("psycopg2")
+        cursor = session.connection.return_value.connection.cursor.return_value.__enter__.return_value
+
+        assert bulk.bulk_insert(session, ColumnMetadata, column_rows(bulk.COPY_THRESHOLD + 1)) == bulk.COPY_THRESHOLD + 1
+
+        session.execute.assert_not_called()
+        statement, buffer = cursor.copy_expert.call_args.args
+        assert statement.startswith('COPY "column_metadata" ("id", "table_id", "name"')
+        first = buffer.getvalue().splitlines()[0].split("\t")
+        assert uuid.UUID(first[0])
+        assert first[2] == "col_0"
+        assert first[-1] != "\\N"
+
+    def test_small_batches_and_other_drivers_use_insert(self):
+        for driver, count in (("psycopg2", bulk.COPY_THRESHOLD), ("asyncpg", bulk.COPY_THRESHOLD + 1)):
+            session = session_for(driver)
+
+            bulk.bulk_insert(session, ColumnMetadata, column_rows(count))
+
+            session.execute.assert_called_once()
+            session.connection.assert_not_called()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""Tests for metadata store engines and sessions."""
+
+import importlib
+
+import pytest
+
+from metadata_builder.persistence import session as store
+
+
+class TestDriverSelection:
+    """Test driver URLs for the metadata store."""
+
+    def test_url_keeps_credentials_and_swaps_driver(self):
+        url = "postgresql://meta:s3cret@db:5432/metadata"
+
+        assert store._driver_url(url, "psycopg2") == "postgresql+psycopg2://meta:s3cret@db:5432/metadata"
+        assert store._driver_url("postgresql+asyncpg://db/metadata", "psycopg2") == "postgresql+psycopg2://db/metadata"
+
+    def test_other_backends_are_rejected(self):
+        with pytest.raises(ValueError, match="must be PostgreSQL, got 'sqlite'"):
+            store._driver_url("sqlite:///auth.db", "psycopg2")
+
+
+class TestPooledEngine:
+    """Test the shared engine used for synchronous writes."""
+
+    def test_engine_is_pooled_for_concurrent_writes(self, monkeypatch):
+        monkeypatch.setenv("METADATA_DATABASE_URL", "postgresql://meta:s3cret@db:5432/metadata")
+        try:
+            pooled = importlib.reload(store)
+            pool = pooled.engine.pool
+
+            assert isinstance(pool, pooled.QueuePool)
+            assert (pool.size(), pool._max_overflow, pool._recycle) == (25, 25, 1800)
+            assert pooled.get_sessionmaker() is pooled.SessionLocal
+            assert pooled.SessionLocal.kw["bind"] is pooled.engine
+        finally:
+            monkeypatch.delenv("METADATA_DATABASE_URL")
+            importlib.reload(store)
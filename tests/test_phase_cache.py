@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Tests for the on-disk phase artifact cache."""
+
+from unittest.mock import patch
+
+from metadata_builder.utils import phase_cache
+from metadata_builder.utils.phase_cache import PhaseCache, schema_fingerprint
+
+
+SCHEMA = {"order_id": "integer", "status": "varchar"}
+
+
+class TestPhaseCache:
+    """Test storing and resuming phase results."""
+
+    def test_round_trip(self, tmp_path):
+        cache = PhaseCache("warehouse", "public", "orders", base_dir=str(tmp_path))
+        fingerprint = schema_fingerprint(SCHEMA)
+
+        cache.store("table_insights", fingerprint, {"table_insights": {"purpose": "Orders"}})
+
+        assert (tmp_path / "warehouse" / "public" / "orders" / "table_insights.json").exists()
+        assert cache.load("table_insights", fingerprint) == {"table_insights": {"purpose": "Orders"}}
+        assert list(cache.directory.glob("*.tmp")) == []
+
+    def test_schema_drift_invalidates(self, tmp_path):
+        cache = PhaseCache("warehouse", "public", "orders", base_dir=str(tmp_path))
+        cache.store("column_definitions", schema_fingerprint(SCHEMA), {"order_id": {}})
+
+        drifted = dict(SCHEMA, amount="numeric")
+        assert cache.load("column_definitions", schema_fingerprint(drifted)) is None
+
+    def test_options_change_fingerprint(self):
+        assert schema_fingerprint(SCHEMA, {"analysis_sql": None}) != schema_fingerprint(SCHEMA, {"analysis_sql": "SELECT 1"})
+
+    def test_missing_and_corrupt_artifacts(self, tmp_path):
+        cache = PhaseCache("warehouse", "public", "orders", base_dir=str(tmp_path))
+        assert cache.load("table_insights", "abc") is None
+
+        cache.directory.mkdir(parents=True)
+        (cache.directory / "table_insights.json").write_text("{not json")
+        assert cache.load("table_insights", "abc") is None
+
+    def test_expired_artifacts_are_not_resumed(self, tmp_path):
+        cache = PhaseCache("warehouse", "public", "orders", base_dir=str(tmp_path), max_age_seconds=60)
+        fingerprint = schema_fingerprint(SCHEMA)
+        cache.store("table_insights", fingerprint, {"table_insights": {}})
+
+        with patch.object(phase_cache.time, "time", return_value=phase_cache.time.time() + 61):
+            assert cache.load("table_insights", fingerprint) is None
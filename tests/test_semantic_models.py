@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""Tests for semantic model generation helpers."""
+
+from unittest.mock import MagicMock, patch
+
+from metadata_builder.core import semantic_models
+from metadata_builder.core.llm_service import LLMClient
+from metadata_builder.core.semantic_models import CachedLLMClient
+from metadata_builder.utils import ttl_cache
+
+
+class TestCachedLLMClient:
+    """Test the LLM response cache used by LookML generation."""
+
+    def test_identical_prompts_hit_cache(self):
+        """A repeated prompt should be answered without calling the LLM again."""
+        cache = CachedLLMClient()
+        with patch.object(semantic_models, "call_llm_json", return_value={"views": []}) as mock_call:
+            first = cache.call_llm_json(None, "gpt-4", "Generate views for orders")
+            second = cache.call_llm_json(None, "gpt-4", "Generate views for orders")
+
+        assert first == second == {"views": []}
+        assert mock_call.call_count == 1
+        assert cache.hits == 1
+
+    def test_whitespace_is_part_of_key(self):
+        """Prompts differing only in whitespace are sent separately."""
+        cache = CachedLLMClient()
+        with patch.object(semantic_models, "call_llm_json", return_value={"views": []}) as mock_call:
+            cache.call_llm_json(None, "gpt-4", "Generate views\n  for orders")
+            cache.call_llm_json(None, "gpt-4", "Generate views for orders")
+
+        assert mock_call.call_count == 2
+
+    def test_model_is_part_of_key(self):
+        """The same prompt sent to a different model is not a cache hit."""
+        cache = CachedLLMClient()
+        with patch.object(semantic_models, "call_llm_json", return_value={"views": []}) as mock_call:
+            cache.call_llm_json(None, "gpt-4", "prompt")
+            cache.call_llm_json(None, "gpt-3.5-turbo", "prompt")
+
+        assert mock_call.call_count == 2
+
+    def test_cached_response_is_isolated_from_caller_mutation(self):
+        """Mutating a returned response must not corrupt the cached copy."""
+        cache = CachedLLMClient()
+        with patch.object(semantic_models, "call_llm_json", return_value={"views": [{"view_name": "a"}]}):
+            first = cache.call_llm_json(None, "gpt-4", "prompt")
+            first["views"].append({"view_name": "b"})
+            second = cache.call_llm_json(None, "gpt-4", "prompt")
+
+        assert second == {"views": [{"view_name": "a"}]}
+
+    def test_expired_entries_are_refetched(self):
+        """Entries older than the TTL are treated as misses."""
+        cache = CachedLLMClient(ttl_seconds=0)
+        with patch.object(semantic_models, "call_llm_json", return_value={"views": []}) as mock_call:
+            cache.call_llm_json(None, "gpt-4", "prompt")
+            with patch.object(ttl_cache.time, "monotonic", return_value=ttl_cache.time.monotonic() + 1):
+                cache.call_llm_json(None, "gpt-4", "prompt")
+
+        assert mock_call.call_count == 2
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted once the cache is full."""
+        cache = CachedLLMClient(maxsize=1)
+        cache.put("a", {"x": 1})
+        cache.put("b", {"x": 2})
+
+        assert cache.get("a") is None
+        assert cache.get("b") == {"x": 2}
+
+
+class TestLLMClientStreaming:
+    """Test assembling streamed LLM completions."""
+
+    def test_stream_chunks_are_joined(self):
+        """Streamed deltas are concatenated, skipping empty and choice-less chunks."""
+        def chunk(content):
+            part = MagicMock()
+            part.choices = [MagicMock()]
+            part.choices[0].delta.content = content
+            return part
+
+        empty = MagicMock()
+        empty.choices = []
+        stream = [chunk('{"views"'), empty, chunk(None), chunk(': []}')]
+
+        assert LLMClient._collect_stream(iter(stream), 0.0) == '{"views": []}'
+
+
+class TestChunkMetadataByTokens:
+    """Test metadata truncation to fit the prompt token budget."""
+
+    def test_small_metadata_skips_tokenizer(self):
+        """Metadata well under the threshold is returned without tokenizing."""
+        counter = MagicMock()
+        metadata = {"orders": {"schema": {"id": "int"}}}
+
+        assert semantic_models.chunk_metadata_by_tokens(metadata, 8000, counter) is metadata
+        counter.count_tokens.assert_not_called()
+
+    def test_large_metadata_is_truncated(self):
+        """Long column fields and sample data are trimmed when over the threshold."""
+        counter = MagicMock()
+        counter.count_tokens.return_value = 10_000
+        metadata = {
+            "orders": {"columns": {"note": {"description": "x" * 500, "data_type": "text"}}},
+            "sample_data": list(range(20)),
+        }
+
+        chunked = semantic_models.chunk_metadata_by_tokens(metadata, 100, counter)
+
+        assert counter.count_tokens.call_count == 1
+        assert chunked["sample_data"] == list(range(5))
+        assert chunked["orders"]["columns"]["note"]["description"] == "x" * 200 + "..."
+        assert chunked["orders"]["columns"]["note"]["data_type"] == "text"
+
+    def test_project_for_lookml_drops_unused_fields(self):
+        """Only table and column fields used for LookML survive projection."""
+        table_metadata = {
+            "table_name": "orders",
+            "description": "Customer orders",
+            "columns": {"id": {"data_type": "int", "description": "Order id", "statistics": {"min": 1}}},
+            "constraints": {"primary_keys": ["id"]},
+            "sample_data": [{"id": 1}],
+            "processing_stats": {"total_tokens": 10},
+        }
+
+        projected = semantic_models._project_for_lookml(table_metadata)
+
+        assert projected == {
+            "table_name": "orders",
+            "description": "Customer orders",
+            "columns": {"id": {"data_type": "int", "description": "Order id"}},
+            "constraints": {"primary_keys": ["id"]},
+        }
+        assert "statistics" in table_metadata["columns"]["id"]
+
+    def test_truncate_strings_walks_nested_values(self):
+        """Strings inside nested dicts and lists are truncated in place."""
+        columns = {"status": {"constraints": ["y" * 300], "statistics": {"top": "z" * 250}}}
+
+        semantic_models._truncate_strings(columns, limit=10)
+
+        assert columns["status"]["constraints"] == ["y" * 10 + "..."]
+        assert columns["status"]["statistics"]["top"] == "z" * 10 + "..."
+
+
+class TestGenerateLookMLModel:
+    """Test LookML generation orchestration with a stubbed LLM."""
+
+    @staticmethod
+    def _fake_llm(client, model, prompt, **kwargs):
+        if prompt.startswith("Based on these LookML views"):
+            return {"explores": [{"name": "orders"}]}
+        table = "orders" if '"orders"' in prompt else "customers"
+        return {"views": [{"view_name": table}]}
+
+    def test_views_requested_per_table(self):
+        """Multi-table generation issues one views request per table plus one explores request."""
+        metadata = {"orders": {"schema": {"id": "int"}}, "customers": {"schema": {"id": "int"}}}
+        with patch.object(semantic_models, "get_llm_api_config", return_value=("key", "http://llm", "gpt-4")), \
+                patch.object(semantic_models, "call_llm_json", side_effect=self._fake_llm) as mock_call:
+            result = semantic_models.generate_lookml_model(
+                db_name="db",
+                schema_name="public",
+                table_names=["orders", "customers"],
+                model_name="sales",
+                metadata=metadata,
+                cache_enabled=False,
+            )
+
+        assert mock_call.call_count == 3
+        assert sorted(view["view_name"] for view in result["views"]) == ["customers", "orders"]
+        assert result["explores"] == [{"name": "orders"}]
+
+    def test_single_table_skips_explores_call(self):
+        """A single-table model gets a locally built explore without a second LLM request."""
+        metadata = {"orders": {"schema": {"id": "int"}}}
+        with patch.object(semantic_models, "get_llm_api_config", return_value=("key", "http://llm", "gpt-4")), \
+                patch.object(semantic_models, "call_llm_json", side_effect=self._fake_llm) as mock_call:
+            result = semantic_models.generate_lookml_model(
+                db_name="db",
+                schema_name="public",
+                table_names=["orders"],
+                model_name="sales",
+                metadata=metadata,
+                cache_enabled=False,
+            )
+
+        assert mock_call.call_count == 1
+        assert result["explores"] == [{"name": "orders", "view_name": "orders", "label": "Orders", "joins": []}]
+
+    def test_single_table_explore_uses_generated_view_name(self):
+        """The local explore points at the view the LLM generated, not the raw table name."""
+        metadata = {"fact_orders": {"schema": {"id": "int"}}}
+        with patch.object(semantic_models, "get_llm_api_config", return_value=("key", "http://llm", "gpt-4")), \
+                patch.object(semantic_models, "call_llm_json", return_value={"views": [{"view_name": "orders"}]}):
+            result = semantic_models.generate_lookml_model(
+                db_name="db",
+                schema_name="public",
+                table_names=["fact_orders"],
+                model_name="sales",
+                metadata=metadata,
+                cache_enabled=False,
+            )
+
+        assert result["explores"] == [{"name": "orders", "view_name": "orders", "label": "Orders", "joins": []}]
+
+    def test_append_merges_new_measures_into_existing_views(self):
+        """Append mode parses the existing LookML and extends the matching view's measures."""
+        existing_lookml = (
+            "model_name: sales\n"
+            "views:\n"
+            "  - view_name: orders\n"
+            "    measures:\n"
+            "      - name: count\n"
+        )
+        new_measures = {"new_measures": [{"view_name": "orders", "measures": [{"name": "total"}]}]}
+        with patch.object(semantic_models, "get_llm_api_config", return_value=("key", "http://llm", "gpt-4")), \
+                patch.object(semantic_models, "call_llm_json", return_value=new_measures):
+            result = semantic_models.generate_lookml_model(
+                db_name="db",
+                schema_name="public",
+                table_names=["orders"],
+                model_name="sales",
+                metadata={"orders": {"schema": {"id": "int"}}},
+                generation_type="append",
+                existing_lookml=existing_lookml,
+                additional_prompt="Add a total measure",
+                cache_enabled=False,
+            )
+
+        assert result["views"][0]["measures"] == [{"name": "count"}, {"name": "total"}]
+        assert result["processing_stats"]["measures_added"] == 1
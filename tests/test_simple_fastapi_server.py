@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""Tests for the FastAPI-based MCP-compatible server."""
+
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+from metadata_builder.mcp import simple_fastapi_server as server
+
+
+class TestSearchTables:
+    """Test the search_tables endpoint."""
+
+    def setup_method(self):
+        server._search_cache.clear()
+
+    def test_databases_are_searched_concurrently(self):
+        """Both database searches must be in flight at once to pass the barrier."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def search_database(db_name, query, limit):
+            barrier.wait()
+            return [{"database": db_name, "table": f"{query}_2024", "match_reason": f"Name contains '{query}'"}]
+
+        with patch.object(server, "get_config", return_value={"databases": {"sales": {}, "ops": {}}}), \
+             patch.object(server, "_search_database", side_effect=search_database):
+            with TestClient(server.app) as client:
+                response = client.post("/tools/search_tables", json={"query": "orders"})
+
+        body = response.json()
+        assert not body["isError"]
+        assert "sales.orders_2024" in body["content"][0]["text"]
+        assert "ops.orders_2024" in body["content"][0]["text"]
+        assert not barrier.broken
+
+    def test_equivalent_queries_share_cached_results(self):
+        """Queries differing only in case and spacing are answered from one search."""
+        found = [{"database": "sales", "table": "order_items", "match_reason": "Name contains 'order items'"}]
+
+        with patch.object(server, "get_config", return_value={"databases": {"sales": {}}}), \
+             patch.object(server, "_search_database", return_value=found) as search_database:
+            with TestClient(server.app) as client:
+                texts = [
+                    client.post("/tools/search_tables", json={"query": query}).json()["content"][0]["text"]
+                    for query in ("order items", "  Order   ITEMS ")
+                ]
+
+        assert search_database.call_count == 1
+        search_database.assert_called_with("sales", "order items", 20)
+        assert all("sales.order_items" in text for text in texts)
+
+
+    def test_database_search_uses_name_index(self):
+        """Names are matched through the shared index, multi-term queries ranked by matched terms."""
+        server._name_index_cache.clear()
+        server._tables_cache.clear()
+        server._table_schema_cache.clear()
+        db = MagicMock()
+        db.get_database_tables.return_value = ["Order_Items", "customer_orders", "invoices"]
+        db.get_tables_schemas.return_value = {"Order_Items": {"id": "integer"}}
+
+        with patch.object(server, "_get_handler", return_value=db):
+            results = server._search_database("sales", "order items", 10)
+            server._search_database("sales", "invoice", 10)
+
+        assert [result["table"] for result in results] == ["Order_Items", "customer_orders"]
+        assert results[0]["sample_columns"] == ["id"]
+        assert results[1]["match_reason"] == "Name matches terms in 'order items'"
+        db.get_database_tables.assert_called_once()
+
+    def test_unknown_fields_are_rejected(self):
+        with TestClient(server.app) as client:
+            response = client.post("/tools/search_tables", json={"query": "orders", "fuzzy": True})
+
+        assert response.status_code == 422
+
+    def test_slow_database_is_left_out(self):
+        """A database that misses the timeout does not hold back the others, and the partial result is not cached."""
+        def search_database(db_name, query, limit):
+            if db_name == "archive":
+                time.sleep(0.5)
+            return [{"database": db_name, "table": "orders", "match_reason": f"Name contains '{query}'"}]
+
+        with patch.object(server, "SEARCH_DB_TIMEOUT_SECONDS", 0.1), \
+             patch.object(server, "get_config", return_value={"databases": {"sales": {}, "archive": {}}}), \
+             patch.object(server, "_search_database", side_effect=search_database):
+            with TestClient(server.app) as client:
+                text = client.post("/tools/search_tables", json={"query": "orders"}).json()["content"][0]["text"]
+
+        assert "sales.orders" in text
+        assert "archive.orders" not in text
+        assert len(server._search_cache) == 0
+
+
+class TestMetadataCache:
+    """Test reuse and coalescing of generated table metadata."""
+
+    def setup_method(self):
+        server._metadata_cache.clear()
+
+    def test_concurrent_identical_requests_generate_once(self):
+        """Requests for the same table share one generation and later ones hit the cache."""
+        def generate(**kwargs):
+            time.sleep(0.05)
+            return {"table_name": kwargs["table_name"], "columns": {}}
+
+        request = server.TableMetadataRequest(database="sales", table="orders")
+
+        async def fetch_three():
+            first = await asyncio.gather(server._cached_metadata(request), server._cached_metadata(request))
+            return first + [await server._cached_metadata(request)]
+
+        with patch.object(server, "generate_complete_table_metadata", side_effect=generate) as generator:
+            results = asyncio.run(fetch_three())
+
+        assert generator.call_count == 1
+        assert all(result is results[0] for result in results)
+
+    def test_clear_cache_endpoint(self):
+        server._metadata_cache.set(("sales", "public", "orders", True, True, True), {"columns": {}})
+
+        with TestClient(server.app) as client:
+            response = client.delete("/cache")
+
+        assert response.json()["status"] == "cleared"
+        assert len(server._metadata_cache) == 0
+
+
+class TestSchemaOverview:
+    """Test the get_schema_overview endpoint."""
+
+    def test_counts_come_from_one_catalog_query(self):
+        server._tables_cache.clear()
+        db = MagicMock()
+        db.get_database_tables.return_value = ["orders", "customers"]
+        db.get_schema_bulk_stats.return_value = {
+            "orders": {"columns": 8, "rows": 120000},
+            "customers": {"columns": 5, "rows": None},
+        }
+
+        with patch.object(server, "get_db_handler", return_value=db):
+            with TestClient(server.app) as client:
+                text = client.get("/tools/get_schema_overview", params={"database": "sales"}).json()["content"][0]["text"]
+
+        db.get_schema_bulk_stats.assert_called_once_with("public", ["orders", "customers"])
+        db.fetch_all.assert_not_called()
+        assert "orders - 8 columns, 120,000 rows" in text
+        assert "customers - 5 columns\n" in text
+        assert text.startswith("🗄️ Schema Overview for sales.public")
+        assert "📊 Total Tables: 2" in text
+        assert "ð" not in text
+
+    def test_unchanged_overview_is_not_modified(self):
+        server._tables_cache.clear()
+        db = MagicMock()
+        db.get_database_tables.return_value = ["orders"]
+        db.get_schema_bulk_stats.return_value = {"orders": {"columns": 8, "rows": 10}}
+
+        with patch.object(server, "get_db_handler", return_value=db):
+            with TestClient(server.app) as client:
+                first = client.get("/tools/get_schema_overview", params={"database": "sales"})
+                etag = first.headers["ETag"]
+                again = client.get("/tools/get_schema_overview", params={"database": "sales"},
+                                   headers={"If-None-Match": etag})
+                db.get_schema_bulk_stats.return_value = {"orders": {"columns": 9, "rows": 10}}
+                changed = client.get("/tools/get_schema_overview", params={"database": "sales"},
+                                     headers={"If-None-Match": etag})
+
+        assert first.headers["Cache-Control"] == server.OVERVIEW_CACHE_CONTROL
+        assert again.status_code == 304
+        assert again.content == b""
+        assert changed.status_code == 200
+        assert "orders - 9 columns" in changed.json()["content"][0]["text"]
+
+    def test_static_endpoints_are_cacheable(self):
+        with TestClient(server.app) as client:
+            for path in ("/", "/tools"):
+                assert client.get(path).headers["Cache-Control"] == server.STATIC_CACHE_CONTROL
+
+    def test_invalid_schema_is_rejected_without_fallback(self):
+        server._tables_cache.clear()
+        db = MagicMock()
+        db.get_database_tables.return_value = ["orders"]
+        db.get_schema_bulk_stats.side_effect = ValueError("Invalid schema name: public;drop")
+
+        with patch.object(server, "get_db_handler", return_value=db):
+            with TestClient(server.app) as client:
+                body = client.get("/tools/get_schema_overview", params={"database": "sales", "schema": "public;drop"}).json()
+
+        assert body["isError"]
+        assert "Invalid schema name" in body["content"][0]["text"]
+        db.get_tables_schemas.assert_not_called()
+
+
+class TestTableMetadata:
+    """Test the get_table_metadata endpoint."""
+
+    def setup_method(self):
+        server._metadata_cache.clear()
+
+    def test_metadata_is_returned_as_structured_json(self):
+        metadata = {
+            "table_name": "orders",
+            "columns": {"amount": {"data_type": "numeric", "statistics": {"mean": np.float64(12.5)}}},
+            "processing_stats": {"generated_at": datetime(2024, 1, 1)},
+        }
+
+        with patch.object(server, "generate_complete_table_metadata", return_value=metadata):
+            with TestClient(server.app) as client:
+                body = client.post("/tools/get_table_metadata", json={"database": "sales", "table": "orders"}).json()
+
+        text_item, json_item = body["content"]
+        assert not body["isError"]
+        assert "amount" in text_item["text"]
+        assert "{" not in text_item["text"]
+        assert json_item["type"] == "json"
+        assert json_item["data"]["columns"]["amount"]["statistics"]["mean"] == 12.5
+        assert json_item["data"]["processing_stats"]["generated_at"].startswith("2024-01-01")
+
+    def test_summary_lists_first_fifteen_columns_with_key_flags(self):
+        columns = {f"col_{i}": {"data_type": "integer"} for i in range(20)}
+        columns["col_0"] = {"data_type": "integer", "description": "Order id", "is_primary_key": True}
+        columns["col_1"] = {"is_foreign_key": True}
+
+        summary = server._format_metadata_for_ai({"columns": columns, "relationships": {"parent": "", "child": "lines"}})
+
+        assert "  • **col_0** (integer) - Order id [PRIMARY KEY]\n" in summary
+        assert "  • **col_1** (unknown) [FOREIGN KEY]\n" in summary
+        assert "col_15" not in summary
+        assert "  ... and 5 more columns" in summary
+        assert summary.endswith("🔗 KEY RELATIONSHIPS:\n  • child: lines")
+
+    def test_streamed_body_is_one_json_document_per_section(self):
+        """Each top-level section is its own chunk and the chunks join into a valid body."""
+        metadata = {"table_name": "orders", "columns": {"id": {"data_type": "integer"}}, "tags": []}
+
+        chunks = list(server._iter_metadata_response("Orders \"summary\"", metadata))
+
+        assert len(chunks) == len(metadata) + 2
+        body = json.loads(b"".join(chunks))
+        assert body == {
+            "content": [{"type": "text", "text": "Orders \"summary\""}, {"type": "json", "data": metadata}],
+            "isError": False,
+        }
+        assert json.loads(b"".join(server._iter_metadata_response("", {})))["content"][1]["data"] == {}
+
+
+class TestHandlers:
+    """Test per-thread reuse of database handlers."""
+
+    def test_handlers_are_reused_per_thread_and_closed(self):
+        with patch.object(server, "get_db_handler", side_effect=lambda db_name: MagicMock(name=db_name)) as factory:
+            first = server._get_handler("sales")
+            assert server._get_handler("sales") is first
+
+            other_thread = []
+            worker = threading.Thread(target=lambda: other_thread.append(server._get_handler("sales")))
+            worker.start()
+            worker.join()
+
+        assert other_thread[0] is not first
+        assert factory.call_count == 2
+
+        server._close_handlers()
+        first.close.assert_called_once()
+        other_thread[0].close.assert_called_once()
+        server._thread_handlers.handlers.clear()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Tests for the LLM phases of table metadata generation."""
+
+import threading
+from unittest.mock import patch
+
+import pandas as pd
+
+from metadata_builder.core import generate_table_metadata as gtm
+
+
+SCHEMA = {"order_id": "integer", "status": "varchar"}
+SAMPLE = pd.DataFrame({"order_id": [1, 2], "status": ["open", "closed"]})
+
+
+class TestTableMetadataPhases:
+    """Test that independent LLM phases overlap."""
+
+    def test_categorical_definitions_and_insights_run_concurrently(self):
+        """Both phases must be in flight at once to pass the barrier."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def categorical_phase(**kwargs):
+            barrier.wait()
+            return {"status": {"open": "Order is open"}}
+
+        def insights_phase(**kwargs):
+            barrier.wait()
+            return {"table_insights": {"purpose": "Orders"}}
+
+        with patch.object(gtm, "get_table_info_with_better_sampling", return_value=(SCHEMA, SAMPLE)), \
+             patch.object(gtm, "extract_constraints", return_value={}), \
+             patch.object(gtm, "extract_categorical_values", return_value={"status": ["open", "closed"]}), \
+             patch.object(gtm, "generate_column_definitions", return_value={}), \
+             patch.object(gtm, "generate_smart_categorical_definitions", side_effect=categorical_phase), \
+             patch.object(gtm, "generate_enhanced_table_insights", side_effect=insights_phase), \
+             patch.object(gtm, "get_db_handler", side_effect=RuntimeError("no database")):
+            metadata = gtm.generate_complete_table_metadata("warehouse", "orders")
+
+        steps = [step["step"] for step in metadata["processing_stats"]["steps"]]
+        assert "generate_categorical_definitions" in steps
+        assert "generate_table_insights" in steps
+        assert not barrier.broken
+
+    def test_resume_reuses_persisted_llm_phases(self, tmp_path, monkeypatch):
+        """A second resumable run loads insights and categorical definitions from disk."""
+        monkeypatch.setenv("METADATA_BUILDER_CACHE_DIR", str(tmp_path))
+
+        def run(values=("open", "closed")):
+            with patch.object(gtm, "get_table_info_with_better_sampling", return_value=(SCHEMA, SAMPLE)), \
+                 patch.object(gtm, "extract_constraints", return_value={}), \
+                 patch.object(gtm, "extract_categorical_values", return_value={"status": list(values)}), \
+                 patch.object(gtm, "generate_column_definitions", return_value={}), \
+                 patch.object(gtm, "generate_smart_categorical_definitions",
+                              return_value={"status": {"open": "Order is open"}}) as categorical, \
+                 patch.object(gtm, "generate_enhanced_table_insights",
+                              return_value={"table_insights": {"purpose": "Orders"}}) as insights, \
+                 patch.object(gtm, "get_db_handler", side_effect=RuntimeError("no database")):
+                gtm.generate_complete_table_metadata("warehouse", "orders", resume=True)
+            return categorical.call_count, insights.call_count
+
+        assert run() == (1, 1)
+        assert run() == (0, 0)
+        # New categorical values only invalidate the categorical definitions
+        assert run(("open", "closed", "refunded")) == (1, 0)
+
+    def test_disabled_samples_skip_sampled_row_work(self):
+        """Without samples no rows are read and the row-based phases never run."""
+        with patch.object(gtm, "get_table_info_with_better_sampling",
+                          return_value=(SCHEMA, pd.DataFrame(columns=list(SCHEMA)))) as table_info, \
+             patch.object(gtm, "extract_constraints", return_value={}), \
+             patch.object(gtm, "compute_numerical_stats") as numerical_stats, \
+             patch.object(gtm, "compute_data_quality_metrics") as quality, \
+             patch.object(gtm, "extract_categorical_values") as categorical_values, \
+             patch.object(gtm, "generate_column_definitions", return_value={}), \
+             patch.object(gtm, "generate_smart_categorical_definitions") as categorical, \
+             patch.object(gtm, "generate_enhanced_table_insights", return_value={"table_insights": {}}), \
+             patch.object(gtm, "get_db_handler", side_effect=RuntimeError("no database")):
+            metadata = gtm.generate_complete_table_metadata("warehouse", "orders", include_samples=False)
+
+        assert table_info.call_args.kwargs["include_samples"] is False
+        for skipped in (numerical_stats, quality, categorical_values, categorical):
+            skipped.assert_not_called()
+        assert metadata["processing_stats"]["optional_sections"]["samples"] is False
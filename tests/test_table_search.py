@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Tests for table name search helpers."""
+
+from unittest.mock import patch
+
+from metadata_builder.utils import table_search
+from metadata_builder.utils.table_search import build_name_index, match_table_names
+
+
+TABLES = ["Customer_Orders", "orders", "customers", "inventory", "order_items"]
+
+
+class TestMatchTableNames:
+    """Test matching table names against search queries."""
+
+    def test_single_term_is_case_insensitive_substring(self):
+        """A single term matches names containing it, in original order."""
+        index = build_name_index(TABLES)
+
+        assert match_table_names(index, "ORDER") == ["Customer_Orders", "orders", "order_items"]
+        assert match_table_names(index, "order", limit=2) == ["Customer_Orders", "orders"]
+
+    def test_multi_term_ranks_by_terms_matched(self):
+        """Names matching more terms rank first; names matching none are dropped."""
+        index = build_name_index(TABLES)
+
+        assert match_table_names(index, "customer orders") == [
+            "Customer_Orders", "orders", "customers"
+        ]
+
+    def test_multi_term_without_automaton(self):
+        """The plain substring fallback ranks multi-term matches the same way."""
+        index = build_name_index(TABLES)
+
+        with patch.object(table_search, "HAS_AHOCORASICK", False):
+            assert match_table_names(index, "customer orders") == [
+                "Customer_Orders", "orders", "customers"
+            ]
+
+    def test_matching_is_casefolded(self):
+        """Unicode case variants match, not just ASCII upper and lower case."""
+        index = build_name_index(["Straße_Orders", "inventory"])
+
+        assert match_table_names(index, "STRASSE") == ["Straße_Orders"]
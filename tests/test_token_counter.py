@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Tests for token counting utilities."""
+
+from unittest.mock import MagicMock, patch
+
+from metadata_builder.utils import token_counter
+from metadata_builder.utils.token_counter import TokenCounter
+
+
+def _fake_encoding():
+    """Build a fake tiktoken encoding that splits on whitespace."""
+    encoding = MagicMock()
+    encoding.encode.side_effect = lambda text: text.split()
+    return encoding
+
+
+class TestTokenCounter:
+    """Test token counting and memoization."""
+
+    def setup_method(self):
+        token_counter._get_encoding.cache_clear()
+        token_counter._count_tokens_cached.cache_clear()
+
+    def test_short_text_is_memoized(self):
+        """Repeated short prompts should only be encoded once."""
+        encoding = _fake_encoding()
+        with patch.object(token_counter.tiktoken, "get_encoding", return_value=encoding):
+            counter = TokenCounter("gpt-4")
+            assert counter.count_tokens("You are a helpful assistant.") == 5
+            assert counter.count_tokens("You are a helpful assistant.") == 5
+
+        assert encoding.encode.call_count == 1
+        assert token_counter._count_tokens_cached.cache_info().hits == 1
+
+    def test_long_text_bypasses_cache(self):
+        """Texts above the cache limit are encoded directly every time."""
+        encoding = _fake_encoding()
+        long_text = "word " * token_counter._MAX_CACHED_TEXT_LENGTH
+        with patch.object(token_counter.tiktoken, "get_encoding", return_value=encoding):
+            counter = TokenCounter("gpt-4")
+            counter.count_tokens(long_text)
+            counter.count_tokens(long_text)
+
+        assert encoding.encode.call_count == 2
+        assert token_counter._count_tokens_cached.cache_info().currsize == 0
+
+    def test_encoding_loaded_once(self):
+        """The tiktoken encoding is looked up once and shared by all counters."""
+        encoding = _fake_encoding()
+        long_text = "word " * token_counter._MAX_CACHED_TEXT_LENGTH
+        with patch.object(token_counter.tiktoken, "get_encoding", return_value=encoding) as mock_get:
+            TokenCounter("gpt-4").count_tokens(long_text)
+            TokenCounter("gpt-4-turbo").count_tokens(long_text)
+
+        assert mock_get.call_count == 1
+
+    def test_fallback_when_encoding_unavailable(self):
+        """Encoding failures fall back to a character-based estimate and are not cached."""
+        with patch.object(token_counter.tiktoken, "get_encoding", side_effect=RuntimeError("offline")):
+            counter = TokenCounter("gpt-4")
+            assert counter.count_tokens("abcdefgh") == 2
+
+        assert token_counter._count_tokens_cached.cache_info().currsize == 0
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Tests for the TTL cache utility."""
+
+from unittest.mock import patch
+
+from metadata_builder.utils import ttl_cache
+from metadata_builder.utils.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+    """Test expiry and eviction of cached entries."""
+
+    def test_get_returns_stored_value(self):
+        """Stored values are returned until they expire."""
+        cache = TTLCache()
+        cache.set(("db", "orders"), {"columns": {}})
+
+        assert cache.get(("db", "orders")) == {"columns": {}}
+        assert ("db", "orders") in cache
+        assert cache.get(("db", "customers")) is None
+
+    def test_expired_entries_are_dropped(self):
+        """Entries older than the TTL are treated as missing."""
+        cache = TTLCache(ttl_seconds=60)
+        cache.set("tables", ["orders"])
+
+        with patch.object(ttl_cache.time, "monotonic", return_value=ttl_cache.time.monotonic() + 61):
+            assert cache.get("tables") is None
+
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted once the cache is full."""
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert "b" not in cache
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3